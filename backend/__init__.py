@@ -2,7 +2,8 @@
 
 Key concepts:
 - create_app(): Flask application factory used by both run.py and app.py legacy entrypoint.
-- Blueprints: chat (conversational AI + tool calling), dashboard (summary metrics), chart (direct aggregations without LLM).
+- Blueprints: chat (conversational AI + tool calling), dashboard (summary metrics), chart (direct aggregations without LLM),
+  metrics (Jira access-layer counters), exports (download route for stored export files).
 - Extensions: SocketIO + CORS initialized via extensions.init_extensions.
 - Database: Lightweight SQLite (maya_tone.db) initialised on startup.
 """
@@ -10,12 +11,14 @@ Key concepts:
 from flask import Flask, jsonify, request, session
 from .config import SECRET_KEY
 from .extensions import init_extensions, socketio
-from .db import init_db
+from .db import init_db, fail_interrupted_export_jobs, release_conn
 from .api.chat import chat_bp
 from .api.dashboard import dashboard_bp
 from .api.chart import chart_bp
 from .api.auth import auth_bp
 from .api.projects import projects_bp
+from .api.metrics import metrics_bp
+from .api.exports import exports_bp
 import requests
 
 
@@ -25,7 +28,8 @@ def create_app():
     Responsibilities:
     1. Instantiate Flask app & configure secret key.
     2. Initialise extensions (CORS + SocketIO binding) so SocketIO shares the Flask app context.
-    3. Initialise / migrate the SQLite DB (tables created if missing).
+    3. Initialise / migrate the SQLite DB (tables created if missing) and fail
+       export jobs left open by the previous process.
     4. Register API blueprints (each one owns its URL space under /api/*).
     5. Provide a lightweight /api/health route for readiness probes.
 
@@ -35,11 +39,16 @@ def create_app():
     app.secret_key = SECRET_KEY
     init_extensions(app)
     init_db()
+    fail_interrupted_export_jobs()
+    # Hand the request's pooled SQLite connection back when the request ends
+    app.teardown_appcontext(release_conn)
     app.register_blueprint(chat_bp)
     app.register_blueprint(dashboard_bp)
     app.register_blueprint(chart_bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(projects_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(exports_bp)
 
     @app.before_request
     def require_auth():
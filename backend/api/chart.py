@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify
-from ..jira_utils import aggregate_issues, JiraManager
+from ..jira_utils import aggregate_issues, pivot_issues, JiraManager
 from ..config import JIRA_BASE_URL, JIRA_USERNAME, JIRA_PASSWORD
 
 # Blueprint exposing direct (non-LLM) chart aggregation so the frontend or
@@ -7,12 +7,96 @@ from ..config import JIRA_BASE_URL, JIRA_USERNAME, JIRA_PASSWORD
 chart_bp = Blueprint("chart", __name__)
 _manager = None
 
+PALETTE = [
+    "#3b82f6", "#10b981", "#f59e0b", "#ef4444", "#8b5cf6", "#06b6d4",
+    "#84cc16", "#6366f1", "#d946ef", "#f87171", "#0ea5e9", "#64748b",
+]
+
 
 def _mgr():
     """JiraManager using session credentials."""
     return JiraManager()
 
 
+def _filters_jql(filters):
+    """Build JQL filter clauses from lists (ignore 'all' semantics)."""
+    clauses = []
+
+    def quote_list(values):
+        return ",".join(f'"{v}"' for v in values if v and str(v).lower() != "all")
+
+    if filters.get("status"):
+        q = quote_list(filters["status"])
+        if q:
+            clauses.append(f"status in ({q})")
+    if filters.get("assignee"):
+        q = quote_list(filters["assignee"])
+        if q:
+            clauses.append(f"assignee in ({q})")
+    if filters.get("project"):
+        q = quote_list(filters["project"])
+        if q:
+            clauses.append(f"project in ({q})")
+    return " AND ".join(clauses) if clauses else None
+
+
+def _pivot(data, from_date, to_date, filters, jql_extra, max_groups, max_issues):
+    """Pivot mode of /api/chart/aggregate: one fetch, every dimension pair cross-tabbed."""
+    stacked = data.get("stacked", True)
+    agg, err = pivot_issues(
+        _mgr(),
+        dimensions=data.get("pivot") or [],
+        from_date=from_date,
+        to_date=to_date,
+        jql_extra=jql_extra,
+        max_issues=max_issues,
+        max_groups=max_groups,
+    )
+    if err:
+        return jsonify({"success": False, "error": err}), 400
+
+    primary = agg["crosstabs"][0]
+    matrix = primary["matrix"]
+    # One dataset per column value; each bar (row value) is split by it
+    datasets = [
+        {
+            "label": col_label,
+            "data": [row[j] for row in matrix],
+            "backgroundColor": PALETTE[j % len(PALETTE)],
+            "borderColor": PALETTE[j % len(PALETTE)],
+        }
+        for j, col_label in enumerate(primary["column_labels"])
+    ]
+    chart_spec = {
+        "title": f"Distribusi Issue by {primary['rows']} × {primary['columns']}",
+        "type": data.get("type") or "bar",
+        "labels": primary["row_labels"],
+        "datasets": datasets,
+        "options": {
+            "scales": {"x": {"stacked": bool(stacked)}, "y": {"stacked": bool(stacked)}}
+        },
+        "meta": {
+            "pivot": agg["dimensions"],
+            "rows": primary["rows"],
+            "columns": primary["columns"],
+            "stacked": bool(stacked),
+            "from": agg.get("from"),
+            "to": agg.get("to"),
+            "source": "jira",
+            "max_groups": max_groups,
+            "max_issues": max_issues,
+            "filters": {
+                "status": filters.get("status", []),
+                "assignee": filters.get("assignee", []),
+                "project": filters.get("project", []),
+            },
+        },
+        "notes": f"Total {agg.get('total', 0)} issues, {len(agg['crosstabs'])} cross-tab(s) from one fetch.",
+        "distincts": agg["distincts"],
+    }
+    return jsonify({"success": True, "chart": chart_spec, "raw": agg})
+
+
 @chart_bp.route("/api/chart/aggregate", methods=["POST"])
 def aggregate():
     """Aggregate Jira issues and return a ready-to-render chart spec.
@@ -26,10 +110,17 @@ def aggregate():
         "type": "bar" | "doughnut" | "line" | "pie"?,
         "max_groups": 5?  # Limit number of groups in chart
         "max_issues": 500? # Limit number of issues from Jira API
+        "pivot": ["status", "assignee", ...]? # Pivot mode, see below
+        "stacked": true?   # Pivot mode: stacked (default) or grouped bars
       }
 
     Response JSON (success):
       { success: true, chart: { title, type, labels, datasets:[...], meta:{...} , notes, distincts? }, raw: <original aggregation> }
+
+    Pivot mode: when "pivot" lists 2-4 dimensions, the issue set is fetched
+    once and cross-tabulated for every dimension pair (see pivot_issues). The
+    chart renders the first pair as a stacked/grouped bar chart; all matrices
+    are returned in raw.crosstabs.
     """
     data = request.json or {}
     group_by = data.get("group_by", "status")
@@ -40,25 +131,10 @@ def aggregate():
     max_groups = data.get("max_groups")  # Limit chart groups
     max_issues = data.get("max_issues", 500)  # Limit Jira API results
 
-    # Build JQL filter clauses from lists (ignore 'all' semantics)
-    clauses = []
-
-    def quote_list(values):
-        return ",".join(f'"{v}"' for v in values if v and str(v).lower() != "all")
+    jql_extra = _filters_jql(filters)
 
-    if filters.get("status"):
-        q = quote_list(filters["status"])
-        if q:
-            clauses.append(f"status in ({q})")
-    if filters.get("assignee"):
-        q = quote_list(filters["assignee"])
-        if q:
-            clauses.append(f"assignee in ({q})")
-    if filters.get("project"):
-        q = quote_list(filters["project"])
-        if q:
-            clauses.append(f"project in ({q})")
-    jql_extra = " AND ".join(clauses) if clauses else None
+    if data.get("pivot"):
+        return _pivot(data, from_date, to_date, filters, jql_extra, max_groups, max_issues)
 
     # Call aggregate_issues with both max_issues and max_groups
     agg, err = aggregate_issues(
@@ -89,11 +165,7 @@ def aggregate():
         else:
             chart_type = "bar"
 
-    palette = [
-        "#3b82f6", "#10b981", "#f59e0b", "#ef4444", "#8b5cf6", "#06b6d4",
-        "#84cc16", "#6366f1", "#d946ef", "#f87171", "#0ea5e9", "#64748b",
-    ]
-    colors = [palette[i % len(palette)] for i in range(len(values))]
+    colors = [PALETTE[i % len(PALETTE)] for i in range(len(values))]
 
     # Create title with appropriate suffix
     original_groups = agg.get("total_groups", len(counts_data))
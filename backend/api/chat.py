@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify, session
-import json, sqlite3
+import json
 from datetime import datetime, timedelta
 from ..prompts import get_base_system_prompt
 from ..config import (
@@ -19,6 +19,7 @@ from ..db import (
     verify_chat_ownership,
     delete_user_chat,
     update_chat_title,
+    get_chat_messages,
 )
 from ..services.openai_service import get_client, check_confirmation_intent
 from ..services.tool_dispatcher import execute as execute_tool
@@ -244,7 +245,7 @@ def build_tools(current_date: str, month_start: str):
             "type": "function",
             "function": {
                 "name": "get_worklogs",
-                "description": "Ambil worklog user saat ini dalam rentang tanggal (inklusi).",
+                "description": "Ambil worklog user saat ini dalam rentang tanggal (inklusi). Hasil: {worklogs, failed_issues}; jika failed_issues tidak kosong, sebutkan issue tersebut karena datanya tidak lengkap.",
                 "parameters": {
                     "type": "object",
                     "properties": {
@@ -375,6 +376,11 @@ def build_tools(current_date: str, month_start: str):
                         "end_date": {
                             "type": "string",
                             "description": "End date in YYYY-MM-DD format (inclusive)"
+                        },
+                        "format": {
+                            "type": "string",
+                            "enum": ["pdf", "csv", "xlsx"],
+                            "description": "File format: pdf (default, timesheet layout) or csv/xlsx when the user asks for Excel/CSV/spreadsheet data"
                         }
                     },
                     "required": ["start_date", "end_date"]
@@ -453,21 +459,7 @@ def messages(chat_id):
     if not verify_chat_ownership(chat_id, user_id):
         return jsonify({"success": False, "error": "Chat not found or access denied"}), 404
     
-    conn = sqlite3.connect("maya_tone.db")
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute(
-        "SELECT content, sender, timestamp FROM messages WHERE chat_id = ? ORDER BY timestamp ASC",
-        (chat_id,),
-    )
-    rows = c.fetchall()
-    # Normalize timestamp to ISO string for frontend
-    msgs = [
-        {"content": r["content"], "sender": r["sender"], "timestamp": r["timestamp"]}
-        for r in rows
-    ]
-    conn.close()
-    return jsonify(msgs)
+    return jsonify(get_chat_messages(chat_id))
 
 
 @chat_bp.route("/api/chat/<chat_id>/delete", methods=["DELETE"])
@@ -550,7 +542,7 @@ def ask(chat_id):
             action = json.loads(pending)
             name = action["name"]
             args = action["args"]
-            data_res, err = execute_tool(name, args)
+            data_res, err = execute_tool(name, args, {"chat_id": chat_id})
             if err:
                 return send(f"❌ Error eksekusi: {err}")
             history_msgs = fetch_recent_messages(chat_id, MAX_CONTEXT_MESSAGES)
@@ -601,7 +593,7 @@ def ask(chat_id):
     call = rmsg.tool_calls[0]
     fname = call.function.name
     args = json.loads(call.function.arguments)
-    data_res, err = execute_tool(fname, args)
+    data_res, err = execute_tool(fname, args, {"chat_id": chat_id})
     if err:
         return send(f"❌ Error: {err}")
 
@@ -686,7 +678,7 @@ def ask_stream(chat_id):
             call = rmsg.tool_calls[0]
             fname = call.function.name
             args = json.loads(call.function.arguments)
-            data_res, err = execute_tool(fname, args)
+            data_res, err = execute_tool(fname, args, {"chat_id": chat_id})
             if err:
                 answer = f"❌ Error: {err}"
                 insert_message(chat_id, answer, "assistant")
@@ -858,19 +850,7 @@ def ask_new():
     if not client:
         return jsonify({"success": False, "answer": "OpenAI tidak tersedia."}), 500
 
-    import sqlite3, random
-    from uuid import uuid4
-
-    conn = sqlite3.connect("maya_tone.db")
-    c = conn.cursor()
-    chat_id = str(uuid4())
-    title = generate_chat_title()
-    c.execute(
-        "INSERT INTO chats (id, title, created_at, updated_at, user_id) VALUES (?,?,?,?,?)",
-        (chat_id, title, datetime.now(), datetime.now(), "user"),
-    )
-    conn.commit()
-    conn.close()
+    chat_id = create_user_chat("user", generate_chat_title())
 
     insert_message(chat_id, user_message, "user")
     try:
@@ -914,7 +894,7 @@ def ask_new():
             args = _json.loads(call.function.arguments)
         except Exception:
             args = {}
-        data_res, err = execute_tool(fname, args)
+        data_res, err = execute_tool(fname, args, {"chat_id": chat_id})
         if err:
             answer = f"❌ Error: {err}"
         else:
@@ -1,12 +1,24 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from ..jira_utils import JiraManager
-from ..config import JIRA_BASE_URL, JIRA_USERNAME, JIRA_PASSWORD
+from ..config import (
+    JIRA_BASE_URL,
+    JIRA_USERNAME,
+    JIRA_PASSWORD,
+    DASHBOARD_CACHE_TTL,
+    DASHBOARD_CACHE_MAX_STALE,
+)
+from ..utils.cache import StaleWhileRevalidateCache
 
 # Dashboard blueprint: exposes consolidated lightweight summary metrics for quick UI rendering.
 # Uses JiraManager.get_dashboard_stats() which bundles counts & distributions used by the React dashboard.
 dashboard_bp = Blueprint("dashboard", __name__)
 _manager = None
 
+# Per-user stats cache (keyed by Jira identity) so tabs and refreshes share one computation.
+_stats_cache = StaleWhileRevalidateCache(
+    ttl=DASHBOARD_CACHE_TTL, max_stale=DASHBOARD_CACHE_MAX_STALE
+)
+
 
 def _mgr():
     """JiraManager using session credentials."""
@@ -21,7 +33,21 @@ def stats():
       {
         "summary": {"my_open_tickets": int, ...},
         "distributions": {"status": {...}, "priority": {...}, ...},
-        "recent_tickets": [ { key, summary, status, priority, updated, assignee, url }, ... ]
+        "recent_tickets": [ { key, summary, status, priority, updated, assignee, url }, ... ],
+        "cache": { "age_seconds": float, "stale": bool, "ttl_seconds": int }
       }
+
+    Pass ?refresh=1 to bypass the cache and recompute synchronously.
     """
-    return jsonify(_mgr().get_dashboard_stats())
+    manager = _mgr()
+    key = (manager.base_url, manager.username)
+    if request.args.get("refresh"):
+        _stats_cache.invalidate(key)
+    data, age, stale = _stats_cache.get(key, manager.get_dashboard_stats)
+    payload = dict(data)
+    payload["cache"] = {
+        "age_seconds": round(age, 1),
+        "stale": stale,
+        "ttl_seconds": DASHBOARD_CACHE_TTL,
+    }
+    return jsonify(payload)
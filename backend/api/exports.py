@@ -0,0 +1,74 @@
+import json
+from datetime import datetime
+from flask import Blueprint, Response, jsonify, request, send_file, session, stream_with_context
+from ..services.artifacts import get_artifact
+from ..db import get_export_job
+from ..services.jira_crud import EXPORT_COLUMNS, STREAM_EXPORT_FORMATS, iter_worklog_rows
+from ..utils.tabular_stream import CSV_MIMETYPE, XLSX_MIMETYPE, csv_stream, xlsx_stream
+
+# Exports blueprint: streams stored export artifacts (see services/artifacts.py)
+exports_bp = Blueprint("exports", __name__)
+
+
+@exports_bp.route("/api/exports/<artifact_id>")
+def download_export(artifact_id):
+    """Stream an export file owned by the logged-in user as an attachment."""
+    artifact = get_artifact(artifact_id)
+    if not artifact or artifact.get("owner") != session.get("jira_username"):
+        return jsonify({"error": "Export not found"}), 404
+    return send_file(
+        artifact["path"],
+        mimetype=artifact.get("content_type") or "application/octet-stream",
+        as_attachment=True,
+        download_name=artifact.get("filename") or f"{artifact_id}.bin",
+        conditional=True,
+        max_age=0,
+    )
+
+
+@exports_bp.route("/api/exports/jobs/<job_id>")
+def export_job_status(job_id):
+    """Current state of a background export job (queued/running/done/failed)."""
+    job = get_export_job(job_id, session.get("jira_username"))
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    job["params"] = json.loads(job["params"] or "{}")
+    return jsonify(job)
+
+
+@exports_bp.route("/api/exports/worklogs")
+def stream_worklogs():
+    """Stream the logged-in user's worklogs as CSV or XLSX.
+
+    Query: format=csv|xlsx, start_date, end_date (YYYY-MM-DD). Rows are written
+    to the response as they are read, so memory does not grow with the range.
+    When some issues' worklogs could not be fetched from Jira the file ends
+    with a "⚠️ GAGAL" row listing those issue keys.
+    """
+    fmt = (request.args.get("format") or "csv").lower()
+    if fmt not in STREAM_EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported format: {fmt}"}), 400
+    start_date, end_date = request.args.get("start_date"), request.args.get("end_date")
+    try:
+        if datetime.strptime(start_date or "", "%Y-%m-%d") > datetime.strptime(end_date or "", "%Y-%m-%d"):
+            return jsonify({"error": "start_date must not be after end_date"}), 400
+    except ValueError:
+        return jsonify({"error": "start_date and end_date must be YYYY-MM-DD"}), 400
+
+    username = session.get("jira_username")
+    full_name = session.get("jira_display_name", username)
+    try:
+        rows = iter_worklog_rows(start_date, end_date, username, full_name)
+    except RuntimeError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if fmt == "csv":
+        body, mimetype = csv_stream(EXPORT_COLUMNS, rows), CSV_MIMETYPE
+    else:
+        body, mimetype = xlsx_stream(EXPORT_COLUMNS, rows, sheet_name="Worklogs"), XLSX_MIMETYPE
+    filename = f"worklogs_{username}_{start_date}_{end_date}.{fmt}"
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,23 @@
+from flask import Blueprint, jsonify
+from ..utils.http_pool import jira_sessions
+from ..services.jira_crud import client_pool
+from ..utils.singleflight import jira_flights
+from ..utils.rate_limit import jira_rate_limiter
+
+# Metrics blueprint: process-level counters for the Jira access layer
+# (connection reuse etc.) so operators can check efficiency without a profiler.
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/api/metrics")
+def metrics():
+    """Return JSON counters, e.g. { "http_sessions": {hits, misses, evictions, active}, "jira_clients": {...}, "coalescing": {...},
+    "rate_limit": {requests, throttled, retries, gave_up, wait_seconds, paused_for} }."""
+    return jsonify(
+        {
+            "http_sessions": jira_sessions.stats(),
+            "jira_clients": client_pool.stats(),
+            "coalescing": jira_flights.stats(),
+            "rate_limit": jira_rate_limiter.stats(),
+        }
+    )
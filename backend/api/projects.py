@@ -1,15 +1,113 @@
 from flask import Blueprint, jsonify
-from ..jira_utils import JiraManager
+from ..jira_utils import JiraManager, FIELDS_PROJECT, FIELDS_PEOPLE
+from ..mirror import mirror_issues
+from ..utils.cache import StaleWhileRevalidateCache
+from ..services.project_metadata import get_project
+from ..config import JIRA_FANOUT_WORKERS, PROJECT_META_TTL, PROJECT_META_MAX_STALE
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections import Counter
+from datetime import datetime, timedelta
 import requests
 from requests.auth import HTTPBasicAuth
 
 projects_bp = Blueprint("projects", __name__)
 
+# Project metadata shared across users of the same Jira instance
+_project_cache = StaleWhileRevalidateCache(PROJECT_META_TTL, PROJECT_META_MAX_STALE)
+
 def _mgr():
     """JiraManager using session credentials."""
     return JiraManager()
 
+def _project_details(jira_manager, project_key):
+    """Project metadata (name, lead, category) from the bulk catalog.
+
+    Falls back to a per-project GET (also cached) when the catalog cannot be
+    loaded or does not list the project.
+    """
+    try:
+        project = get_project(
+            jira_manager.base_url,
+            jira_manager.username,
+            jira_manager.password,
+            project_key,
+            jira_manager.session,
+        )
+        if project:
+            return project
+    except Exception:
+        pass
+
+    def load():
+        r = jira_manager.session.get(
+            f"{jira_manager.base_url}/rest/api/2/project/{project_key}"
+        )
+        r.raise_for_status()
+        return r.json()
+
+    details, _, _ = _project_cache.get((jira_manager.base_url, project_key), load)
+    return details
+
+
+def _collaborators(issues):
+    """Unique assignees/reporters of `issues`, keyed by user name or account id."""
+    collaborators = {}
+    for issue in issues:
+        fields = issue.get("fields", {})
+        for person in (fields.get("assignee"), fields.get("reporter")):
+            if person and person.get("displayName"):
+                user_key = person.get("name", person.get("accountId", person.get("displayName", "")))
+                if user_key and user_key not in collaborators:
+                    collaborators[user_key] = {
+                        "displayName": person.get("displayName", "Unknown User"),
+                        "avatar": person.get("avatarUrls", {}).get("48x48", "")
+                    }
+    return list(collaborators.values())
+
+
+def _project_summary(jira_manager, project_key):
+    """Build one overview row; None when the project cannot be read."""
+    try:
+        project_details = _project_details(jira_manager, project_key)
+    except Exception:
+        return None
+
+    project_lead = project_details.get("lead") or {}
+    project_category = project_details.get("projectCategory") or {}
+
+    # Count epics in this project (count-only query, no issues transferred)
+    epic_jql = f'project = "{project_key}" AND issuetype = "Epic"'
+    total_epics = jira_manager.count_issues(epic_jql)
+
+    # Get all collaborators (assignees, reporters, etc.) from recent issues
+    recent_issues = mirror_issues(
+        jira_manager,
+        "updated",
+        datetime.now() - timedelta(days=90),
+        project=project_key,
+        limit=500,
+    )
+    if recent_issues is None:
+        collaborators_jql = f'project = "{project_key}" AND updated >= -90d'
+        recent_issues = jira_manager.iter_issues(
+            collaborators_jql, 500, fields=FIELDS_PEOPLE
+        )
+    collaborator_list = _collaborators(recent_issues)
+
+    return {
+        "projectKey": project_key,
+        "projectName": project_details.get("name", project_key),
+        "projectLead": {
+            "name": project_lead.get("displayName", "Unassigned"),
+            "avatar": project_lead.get("avatarUrls", {}).get("48x48", "")
+        },
+        "projectCategory": project_category.get("name", "Uncategorized"),
+        "totalEpics": total_epics,
+        "collaborators": collaborator_list,
+        "totalCollaborators": len(collaborator_list)
+    }
+
+
 @projects_bp.route("/api/projects/overview", methods=["GET"])
 def get_projects_overview():
     """Get project overview data for projects where the current user is involved."""
@@ -24,7 +122,9 @@ def get_projects_overview():
         
         # Search for issues where the current user is involved (assignee, reporter, or has worked on)
         user_involvement_jql = f"(assignee = '{username}' OR reporter = '{username}' OR worklogAuthor = '{username}') AND resolution = Unresolved"
-        user_issues = jira_manager.search_issues(user_involvement_jql, 1000)
+        user_issues = jira_manager.iter_issues(
+            user_involvement_jql, fields=FIELDS_PROJECT
+        )
         
         # Extract unique project keys from the issues
         user_project_keys = set()
@@ -33,80 +133,25 @@ def get_projects_overview():
             if project_key:
                 user_project_keys.add(project_key)
 
+        # Per-project work runs concurrently; rows are appended as each project
+        # finishes, so total latency tracks the slowest project, not the sum.
         project_overview = []
-        
-        # Get details for each project the user is involved in
-        for project_key in user_project_keys:
-            # Get project details including lead
-            project_detail_response = jira_manager.session.get(
-                f"{jira_manager.base_url}/rest/api/2/project/{project_key}"
-            )
-            
-            if project_detail_response.status_code != 200:
-                continue
-                
-            project_details = project_detail_response.json()
-            project_name = project_details.get("name", project_key)
-            
-            # Get project lead
-            project_lead = project_details.get("lead", {})
-            project_lead_name = project_lead.get("displayName", "Unassigned")
-            project_lead_avatar = project_lead.get("avatarUrls", {}).get("48x48", "")
-            
-            # Get project category
-            project_category = project_details.get("projectCategory", {})
-            category_name = project_category.get("name", "Uncategorized")
-            
-            # Count epics in this project
-            epic_jql = f'project = "{project_key}" AND issuetype = "Epic"'
-            epic_issues = jira_manager.search_issues(epic_jql, 1000)
-            total_epics = len(epic_issues)
-            
-            # Get all collaborators (assignees, reporters, etc.) from recent issues
-            collaborators_jql = f'project = "{project_key}" AND updated >= -90d'
-            recent_issues = jira_manager.search_issues(collaborators_jql, 500)
-            
-            # Collect unique collaborators
-            collaborators = {}
-            for issue in recent_issues:
-                fields = issue.get("fields", {})
-                
-                # Add assignee
-                assignee = fields.get("assignee")
-                if assignee and assignee.get("displayName"):
-                    user_key = assignee.get("name", assignee.get("accountId", assignee.get("displayName", "")))
-                    if user_key and user_key not in collaborators:
-                        collaborators[user_key] = {
-                            "displayName": assignee.get("displayName", "Unknown User"),
-                            "avatar": assignee.get("avatarUrls", {}).get("48x48", "")
-                        }
-                
-                # Add reporter
-                reporter = fields.get("reporter")
-                if reporter and reporter.get("displayName"):
-                    user_key = reporter.get("name", reporter.get("accountId", reporter.get("displayName", "")))
-                    if user_key and user_key not in collaborators:
-                        collaborators[user_key] = {
-                            "displayName": reporter.get("displayName", "Unknown User"),
-                            "avatar": reporter.get("avatarUrls", {}).get("48x48", "")
-                        }
-            
-            # Convert collaborators dict to list and limit to reasonable number
-            collaborator_list = list(collaborators.values())#[:20]  # Limit to 20 collaborators max
-            
-            project_overview.append({
-                "projectKey": project_key,
-                "projectName": project_name,
-                "projectLead": {
-                    "name": project_lead_name,
-                    "avatar": project_lead_avatar
-                },
-                "projectCategory": category_name,
-                "totalEpics": total_epics,
-                "collaborators": collaborator_list,
-                "totalCollaborators": len(collaborator_list)
-            })
-        
+        if user_project_keys:
+            workers = max(1, min(JIRA_FANOUT_WORKERS, len(user_project_keys)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_project_summary, jira_manager, key)
+                    for key in user_project_keys
+                ]
+                for future in as_completed(futures):
+                    try:
+                        row = future.result()
+                    except Exception:
+                        continue
+                    if row:
+                        project_overview.append(row)
+        project_overview.sort(key=lambda p: (p["projectName"] or "").lower())
+
         return jsonify({
             "success": True,
             "projects": project_overview
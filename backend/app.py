@@ -19,20 +19,27 @@ except ImportError:  # Fallback when executed directly (no parent package)
     from backend import create_app  # type: ignore
     from backend.extensions import socketio  # type: ignore
 
-app = create_app()
 
+def build_app():
+    """create_app() plus the legacy root + 404 handlers.
 
-@app.route("/")
-def root():
-    return {"message": "Backend running. Modular API under /api/*"}
+    Called only under __main__: timesheet PDF workers are spawned processes
+    that re-import this module, and must not initialise the app or the DB.
+    """
+    app = create_app()
 
+    @app.route("/")
+    def root():
+        return {"message": "Backend running. Modular API under /api/*"}
 
-@app.errorhandler(404)
-def not_found(e):
-    return {"error": "not found"}, 404
+    @app.errorhandler(404)
+    def not_found(e):
+        return {"error": "not found"}, 404
+
+    return app
 
 
 if __name__ == "__main__":
+    app = build_app()
     debug_mode = os.environ.get("FLASK_DEBUG", "False").lower() in ("1", "true", "yes")
     socketio.run(app, host="0.0.0.0", port=4000, debug=debug_mode)
-## All legacy routes removed; blueprints provide functionality.
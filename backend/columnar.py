@@ -0,0 +1,147 @@
+"""Columnar, dictionary-encoded issue batches for vectorized aggregation.
+
+Issues are consumed in batches; each batch is turned into one NumPy string
+array per dimension, encoded with np.unique, and merged into a growing
+per-column dictionary. Only int32 codes are kept per issue, so group-by
+counts, distincts, sorting and top-N folding are plain array operations.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+import numpy as np
+
+# Encoded dimensions; order matches the tuple built by _extract().
+DIMENSIONS = ("status", "priority", "assignee", "type", "project", "created_date")
+
+
+def _extract(fields: Dict[str, Any]) -> Tuple[str, ...]:
+    """One row of dimension values, using the same defaults as the dashboard."""
+    return (
+        (fields.get("status") or {}).get("name") or "Unknown",
+        (fields.get("priority") or {}).get("name") or "Medium",
+        (fields.get("assignee") or {}).get("displayName") or "Unassigned",
+        (fields.get("issuetype") or {}).get("name") or "Unknown",
+        (fields.get("project") or {}).get("key") or "",
+        (fields.get("created") or "")[:10] or "Unknown",
+    )
+
+
+class IssueColumns:
+    """Dictionary-encoded columns for a set of issues.
+
+    labels[dim] is an array of distinct values; codes[dim][i] indexes into it
+    for issue i. Labels are kept in first-seen order; sorting happens at
+    query time.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self._lookup: Dict[str, Dict[str, int]] = {d: {} for d in DIMENSIONS}
+        self._labels: Dict[str, List[str]] = {d: [] for d in DIMENSIONS}
+        self._chunks: Dict[str, List[np.ndarray]] = {d: [] for d in DIMENSIONS}
+        self._codes: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_issues(cls, issues: Iterable[Dict[str, Any]], batch_size: int = 1000) -> "IssueColumns":
+        cols = cls()
+        batch = []
+        for issue in issues:
+            batch.append(_extract(issue.get("fields") or {}))
+            if len(batch) >= batch_size:
+                cols.add_batch(batch)
+                batch = []
+        if batch:
+            cols.add_batch(batch)
+        return cols
+
+    def add_batch(self, rows: List[Tuple[str, ...]]) -> None:
+        """Encode one batch of extracted rows and append its codes."""
+        if not rows:
+            return
+        table = np.array(rows, dtype=str)
+        for j, dim in enumerate(DIMENSIONS):
+            uniq, inverse = np.unique(table[:, j], return_inverse=True)
+            lookup, labels = self._lookup[dim], self._labels[dim]
+            # Only the batch's distinct values touch Python; issues stay in NumPy
+            remap = np.empty(len(uniq), dtype=np.int32)
+            for i, value in enumerate(uniq.tolist()):
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(labels)
+                    labels.append(value)
+                remap[i] = code
+            self._chunks[dim].append(remap[inverse.reshape(-1)])
+        self.size += len(rows)
+        self._codes = {}
+
+    def codes(self, dim: str) -> np.ndarray:
+        if dim not in self._codes:
+            chunks = self._chunks[dim]
+            self._codes[dim] = (
+                np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32)
+            )
+        return self._codes[dim]
+
+    def labels(self, dim: str) -> np.ndarray:
+        return np.array(self._labels[dim], dtype=object)
+
+    def group_counts(self, dim: str, chronological: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (labels, counts) sorted by count desc then label, or by label when chronological."""
+        labels = self.labels(dim)
+        counts = np.bincount(self.codes(dim), minlength=len(labels))
+        keep = counts > 0
+        labels, counts = labels[keep], counts[keep]
+        if chronological:
+            order = np.argsort(labels.astype(str), kind="stable")
+        else:
+            order = np.lexsort((labels.astype(str), -counts))
+        return labels[order], counts[order]
+
+    def crosstab(
+        self, row_dim: str, col_dim: str, max_rows: int = None, max_cols: int = None
+    ) -> Tuple[List[str], List[str], np.ndarray]:
+        """Count issues per (row, column) pair in one pass over the codes.
+
+        Rows and columns follow group_counts() ordering; anything past
+        max_rows / max_cols is folded into a trailing "Others" row / column.
+        """
+        n_rows, n_cols = len(self._labels[row_dim]), len(self._labels[col_dim])
+        flat = self.codes(row_dim).astype(np.int64) * n_cols + self.codes(col_dim)
+        matrix = np.bincount(flat, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+        def order(dim, totals, limit):
+            labels = self.labels(dim)
+            present = np.nonzero(totals > 0)[0]
+            if dim == "created_date":
+                idx = present[np.argsort(labels[present].astype(str), kind="stable")]
+            else:
+                idx = present[np.lexsort((labels[present].astype(str), -totals[present]))]
+            if limit and len(idx) > limit:
+                return labels[idx[:limit]].tolist() + ["Others"], idx[:limit], idx[limit:]
+            return labels[idx].tolist(), idx, idx[:0]
+
+        row_labels, rows, row_rest = order(row_dim, matrix.sum(axis=1), max_rows)
+        col_labels, cols, col_rest = order(col_dim, matrix.sum(axis=0), max_cols)
+        # Fold overflow columns, then overflow rows, with slice sums
+        out = matrix[:, cols]
+        if len(col_rest):
+            out = np.column_stack([out, matrix[:, col_rest].sum(axis=1)])
+        head = out[rows]
+        if len(row_rest):
+            head = np.vstack([head, out[row_rest].sum(axis=0)])
+        return row_labels, col_labels, head
+
+    def distinct(self, dim: str) -> List[str]:
+        labels = self.labels(dim)
+        present = np.bincount(self.codes(dim), minlength=len(labels)) > 0
+        return sorted(v for v in labels[present].tolist() if v)
+
+
+def fold_top_n(labels: np.ndarray, counts: np.ndarray, max_groups: int, others_label: str = "Others"):
+    """Keep the first `max_groups` entries and fold the remainder into one bucket."""
+    head_labels = labels[:max_groups].tolist()
+    head_counts = counts[:max_groups].tolist()
+    others = int(counts[max_groups:].sum())
+    if others > 0:
+        head_labels.append(others_label)
+        head_counts.append(others)
+    return head_labels, head_counts
@@ -27,5 +27,63 @@ AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o
 
 MAX_CONTEXT_MESSAGES = int(os.getenv("MAX_CONTEXT_MESSAGES", "20"))
 
+# Upper bound on concurrent Jira searches issued by a single dashboard request.
+JIRA_FANOUT_WORKERS = int(os.getenv("JIRA_FANOUT_WORKERS", "8"))
+# Page size used when walking large result sets via startAt pagination.
+JIRA_PAGE_SIZE = int(os.getenv("JIRA_PAGE_SIZE", "100"))
+
+# Shared keep-alive sessions (utils/http_pool.py), one per Jira credential identity.
+JIRA_POOL_CONNECTIONS = int(os.getenv("JIRA_POOL_CONNECTIONS", "4"))
+JIRA_POOL_MAXSIZE = int(os.getenv("JIRA_POOL_MAXSIZE", str(max(JIRA_FANOUT_WORKERS * 2, 10))))
+JIRA_SESSION_IDLE_TTL = int(os.getenv("JIRA_SESSION_IDLE_TTL", "600"))
+JIRA_MAX_SESSIONS = int(os.getenv("JIRA_MAX_SESSIONS", "128"))
+
+# Client-side rate limit shared by all outbound Jira calls (utils/rate_limit.py).
+# 429/503 responses are retried after Retry-After or jittered exponential backoff.
+JIRA_RATE_LIMIT = float(os.getenv("JIRA_RATE_LIMIT", "20"))
+JIRA_RATE_BURST = int(os.getenv("JIRA_RATE_BURST", "40"))
+JIRA_THROTTLE_RETRIES = int(os.getenv("JIRA_THROTTLE_RETRIES", "4"))
+JIRA_BACKOFF_BASE = float(os.getenv("JIRA_BACKOFF_BASE", "0.5"))
+JIRA_BACKOFF_MAX = float(os.getenv("JIRA_BACKOFF_MAX", "30"))
+
+# /api/dashboard-stats per-user cache: entries older than the TTL are served
+# while a background refresh runs; past MAX_STALE they are recomputed inline.
+DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", "60"))
+DASHBOARD_CACHE_MAX_STALE = int(os.getenv("DASHBOARD_CACHE_MAX_STALE", "900"))
+
+# Project metadata (name, lead, category) changes rarely: cache for an hour,
+# serve stale for up to a day while refreshing in the background.
+PROJECT_META_TTL = int(os.getenv("PROJECT_META_TTL", "3600"))
+PROJECT_META_MAX_STALE = int(os.getenv("PROJECT_META_MAX_STALE", "86400"))
+
+# Local SQLite mirror of recently updated issues (opt-in). Synced incrementally
+# per Jira identity; readers fall back to live Jira when it is stale or the
+# requested window is older than ISSUE_MIRROR_WINDOW_DAYS.
+ISSUE_MIRROR_ENABLED = os.getenv("ISSUE_MIRROR_ENABLED", "false").lower() in ("1", "true", "yes")
+ISSUE_MIRROR_DB_PATH = os.getenv("ISSUE_MIRROR_DB_PATH", "jira_mirror.db")
+ISSUE_MIRROR_SYNC_INTERVAL = int(os.getenv("ISSUE_MIRROR_SYNC_INTERVAL", "120"))
+ISSUE_MIRROR_WINDOW_DAYS = int(os.getenv("ISSUE_MIRROR_WINDOW_DAYS", "90"))
+ISSUE_MIRROR_IDLE_TIMEOUT = int(os.getenv("ISSUE_MIRROR_IDLE_TIMEOUT", "1800"))
+# Full key diff of the mirrored window: drops issues deleted in Jira or no longer visible.
+ISSUE_MIRROR_RECONCILE_INTERVAL = int(os.getenv("ISSUE_MIRROR_RECONCILE_INTERVAL", "3600"))
+
+# Generated export files (timesheet PDFs etc.) are kept on disk and served by
+# /api/exports/<id>; chat messages only store that short link.
+EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
+EXPORT_RETENTION_DAYS = int(os.getenv("EXPORT_RETENTION_DAYS", "30"))
+
+# Timesheet PDFs render in a process pool (0 = render on the request thread).
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", "2"))
+PDF_RENDER_TIMEOUT = int(os.getenv("PDF_RENDER_TIMEOUT", "120"))
+
+# Chat-triggered exports run as background jobs (0 = run inline in the request).
+EXPORT_JOB_WORKERS = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+
+# maya_tone.db connections (db.py): idle pool size (0 = no pooling, close after each request),
+# page cache per connection and memory-mapped I/O size.
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "8"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "8192"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(64 * 1024 * 1024)))
+
 CURRENT_DATE = datetime.now().strftime("%Y-%m-%d")
 CURRENT_TIME = datetime.now().strftime("%H:%M:%S")
@@ -1,17 +1,103 @@
+import queue
 import sqlite3
+import threading
 from datetime import datetime
 from flask import current_app as app
 
+from .config import SQLITE_CACHE_SIZE_KB, SQLITE_MMAP_SIZE, SQLITE_POOL_SIZE
+
 DB_PATH = "maya_tone.db"
 
+# Connections are pooled. A thread takes one on its first query and keeps it
+# until release_conn(): at the end of each request (teardown_appcontext) and
+# when an export job or a fan-out task finishes. Released connections go back
+# to a small idle pool, so the next request (Werkzeug and Socket.IO run a thread
+# per request) reuses an open connection: no reconnect, no pragma setup, and
+# sqlite3's per-connection statement cache stays warm across chat turns.
+# Keeping connections open also avoids the WAL checkpoint + -wal file delete
+# SQLite performs whenever the last connection to the database closes.
+_local = threading.local()
+# SQLITE_POOL_SIZE <= 0 disables pooling (LifoQueue would treat 0 as unbounded)
+_idle = queue.LifoQueue(maxsize=SQLITE_POOL_SIZE) if SQLITE_POOL_SIZE > 0 else None
+STATEMENT_CACHE_SIZE = 256
+
+
+def _connect(path):
+    # check_same_thread=False: a pooled connection moves between threads, but is
+    # only ever used by the one thread that currently holds it
+    conn = sqlite3.connect(
+        path, timeout=30, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False
+    )
+    conn.row_factory = sqlite3.Row
+    # Connection-scoped settings; journal_mode=WAL is stored in the file by init_db()
+    # NORMAL is durable across app crashes in WAL mode; only an OS crash can drop the last commits
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA cache_size={-SQLITE_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+def _checkout(path):
+    if _idle is None:
+        return _connect(path)
+    while True:
+        try:
+            conn, conn_path = _idle.get_nowait()
+        except queue.Empty:
+            return _connect(path)
+        if conn_path == path:
+            return conn
+        conn.close()
+
 
 def get_conn():
-    return sqlite3.connect(DB_PATH)
+    """Return the calling thread's connection to DB_PATH (rows are sqlite3.Row).
+
+    Callers do not close it; use `with conn:` around writes so a failed
+    statement rolls back instead of leaving a transaction open on it.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "path", None) != DB_PATH:
+        if conn is not None:
+            release_conn()
+        conn = _checkout(DB_PATH)
+        _local.conn, _local.path = conn, DB_PATH
+    return conn
+
+
+def release_conn(exc=None):
+    """Return the calling thread's connection to the idle pool (closed if the pool
+    is full or disabled).
+
+    Registered with app.teardown_appcontext (hence the unused `exc`) and called
+    by worker threads when their task is done.
+    """
+    conn, path = getattr(_local, "conn", None), getattr(_local, "path", None)
+    if conn is None:
+        return
+    _local.conn = _local.path = None
+    if _idle is None:
+        conn.close()
+        return
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+        _idle.put_nowait((conn, path))
+    except (queue.Full, sqlite3.Error):
+        conn.close()
 
 
 def init_db():
     conn = get_conn()
-    c = conn.cursor()
+    # WAL lets readers run alongside the writer (chat turns, export jobs, sockets);
+    # the mode is persistent, so it is set once here rather than per connection
+    conn.execute("PRAGMA journal_mode=WAL")
+    with conn:
+        _create_schema(conn.cursor())
+
+
+def _create_schema(c):
     c.execute(
         """
         CREATE TABLE IF NOT EXISTS chats (
@@ -29,33 +115,38 @@ def init_db():
     # Add index for better performance on user-specific queries
     c.execute("CREATE INDEX IF NOT EXISTS idx_chats_user_id ON chats (user_id)")
     c.execute("CREATE INDEX IF NOT EXISTS idx_messages_chat_id ON messages (chat_id)")
-    conn.commit()
-    conn.close()
+    # History reads are "newest N of one chat": served straight from this index, no sort
+    c.execute("CREATE INDEX IF NOT EXISTS idx_messages_chat_ts ON messages (chat_id, timestamp)")
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS export_jobs (
+            id TEXT PRIMARY KEY, chat_id TEXT, user_id TEXT, status TEXT,
+            params TEXT, progress TEXT, result TEXT, error TEXT,
+            created_at TIMESTAMP, updated_at TIMESTAMP
+        )"""
+    )
+    c.execute("CREATE INDEX IF NOT EXISTS idx_export_jobs_chat_id ON export_jobs (chat_id)")
 
 
 def insert_message(chat_id, content, sender):
     conn = get_conn()
-    c = conn.cursor()
     from uuid import uuid4
 
-    c.execute(
-        "INSERT INTO messages (id, chat_id, content, sender, timestamp) VALUES (?,?,?,?,?)",
-        (str(uuid4()), chat_id, content, sender, datetime.now()),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            "INSERT INTO messages (id, chat_id, content, sender, timestamp) VALUES (?,?,?,?,?)",
+            (str(uuid4()), chat_id, content, sender, datetime.now()),
+        )
 
 
 def fetch_recent_messages(chat_id, limit):
     conn = get_conn()
-    conn.row_factory = sqlite3.Row
     c = conn.cursor()
     c.execute(
         "SELECT sender, content FROM messages WHERE chat_id = ? ORDER BY timestamp DESC LIMIT ?",
         (chat_id, limit),
     )
     rows = c.fetchall()
-    conn.close()
     messages = []
     for row in rows:
         role = "user" if row["sender"] == "user" else "assistant"
@@ -66,12 +157,10 @@ def fetch_recent_messages(chat_id, limit):
 
 def set_pending_action(chat_id, action_json):
     conn = get_conn()
-    c = conn.cursor()
-    c.execute(
-        "UPDATE chats SET pending_action = ? WHERE id = ?", (action_json, chat_id)
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            "UPDATE chats SET pending_action = ? WHERE id = ?", (action_json, chat_id)
+        )
 
 
 def get_pending_action(chat_id):
@@ -79,7 +168,6 @@ def get_pending_action(chat_id):
     c = conn.cursor()
     c.execute("SELECT pending_action FROM chats WHERE id = ?", (chat_id,))
     row = c.fetchone()
-    conn.close()
     return row[0] if row else None
 
 
@@ -89,39 +177,33 @@ def clear_pending_action(chat_id):
 
 def touch_chat(chat_id):
     conn = get_conn()
-    c = conn.cursor()
-    c.execute("UPDATE chats SET updated_at = ? WHERE id = ?", (datetime.now(), chat_id))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("UPDATE chats SET updated_at = ? WHERE id = ?", (datetime.now(), chat_id))
 
 
 def get_user_chats(user_id):
     """Get all chats for a specific user"""
     conn = get_conn()
-    conn.row_factory = sqlite3.Row
     c = conn.cursor()
     c.execute(
         "SELECT id, title FROM chats WHERE user_id = ? ORDER BY updated_at DESC",
         (user_id,)
     )
     rows = [dict(r) for r in c.fetchall()]
-    conn.close()
     return rows
 
 
 def create_user_chat(user_id, title):
     """Create a new chat for a specific user"""
     conn = get_conn()
-    c = conn.cursor()
     from uuid import uuid4
     
     chat_id = str(uuid4())
-    c.execute(
-        "INSERT INTO chats (id, title, created_at, updated_at, user_id) VALUES (?, ?, ?, ?, ?)",
-        (chat_id, title, datetime.now(), datetime.now(), user_id),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            "INSERT INTO chats (id, title, created_at, updated_at, user_id) VALUES (?, ?, ?, ?, ?)",
+            (chat_id, title, datetime.now(), datetime.now(), user_id),
+        )
     return chat_id
 
 
@@ -131,7 +213,6 @@ def verify_chat_ownership(chat_id, user_id):
     c = conn.cursor()
     c.execute("SELECT user_id FROM chats WHERE id = ?", (chat_id,))
     row = c.fetchone()
-    conn.close()
     return row and row[0] == user_id
 
 
@@ -143,26 +224,83 @@ def delete_user_chat(chat_id, user_id):
     c.execute("SELECT user_id FROM chats WHERE id = ?", (chat_id,))
     row = c.fetchone()
     if not row or row[0] != user_id:
-        conn.close()
         return False
     
     # Delete messages and chat
-    c.execute("DELETE FROM messages WHERE chat_id = ?", (chat_id,))
-    c.execute("DELETE FROM chats WHERE id = ? AND user_id = ?", (chat_id, user_id))
-    conn.commit()
-    conn.close()
+    with conn:
+        c.execute("DELETE FROM messages WHERE chat_id = ?", (chat_id,))
+        c.execute("DELETE FROM chats WHERE id = ? AND user_id = ?", (chat_id, user_id))
     return True
 
 
 def update_chat_title(chat_id, user_id, title):
     """Update chat title only if it belongs to the user"""
     conn = get_conn()
+    with conn:
+        affected = conn.execute(
+            "UPDATE chats SET title = ?, updated_at = ? WHERE id = ? AND user_id = ?",
+            (title, datetime.now(), chat_id, user_id),
+        ).rowcount
+    return affected > 0
+
+
+def create_export_job(chat_id, user_id, params_json):
+    """Persist a queued export job and return its id"""
+    conn = get_conn()
+    from uuid import uuid4
+
+    job_id = str(uuid4())
+    with conn:
+        conn.execute(
+            "INSERT INTO export_jobs (id, chat_id, user_id, status, params, created_at, updated_at) VALUES (?,?,?,?,?,?,?)",
+            (job_id, chat_id, user_id, "queued", params_json, datetime.now(), datetime.now()),
+        )
+    return job_id
+
+
+def update_export_job(job_id, status=None, progress=None, result=None, error=None, clear_error=False):
+    """Update the given export job fields (None leaves a field unchanged; clear_error resets error)"""
+    conn = get_conn()
+    with conn:
+        conn.execute(
+            "UPDATE export_jobs SET status = COALESCE(?, status), progress = COALESCE(?, progress), "
+            "result = COALESCE(?, result), error = CASE WHEN ? THEN NULL ELSE COALESCE(?, error) END, "
+            "updated_at = ? WHERE id = ?",
+            (status, progress, result, clear_error, error, datetime.now(), job_id),
+        )
+
+
+def fail_interrupted_export_jobs():
+    """Mark queued/running export jobs failed. Call once at server startup:
+    jobs run in-process, so anything still open then was cut off by a restart."""
+    conn = get_conn()
+    with conn:
+        conn.execute(
+            "UPDATE export_jobs SET status = 'failed', error = 'Interrupted by server restart', updated_at = ? "
+            "WHERE status IN ('queued', 'running')",
+            (datetime.now(),),
+        )
+
+
+def get_export_job(job_id, user_id):
+    """Get an export job only if it belongs to the user"""
+    conn = get_conn()
     c = conn.cursor()
     c.execute(
-        "UPDATE chats SET title = ?, updated_at = ? WHERE id = ? AND user_id = ?",
-        (title, datetime.now(), chat_id, user_id),
+        "SELECT id, chat_id, status, params, progress, result, error, created_at, updated_at "
+        "FROM export_jobs WHERE id = ? AND user_id = ?",
+        (job_id, user_id),
     )
-    affected = c.rowcount
-    conn.commit()
-    conn.close()
-    return affected > 0
+    row = c.fetchone()
+    return dict(row) if row else None
+
+
+def get_chat_messages(chat_id):
+    """Get every message of a chat, oldest first"""
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute(
+        "SELECT content, sender, timestamp FROM messages WHERE chat_id = ? ORDER BY timestamp ASC",
+        (chat_id,),
+    )
+    return [dict(r) for r in c.fetchall()]
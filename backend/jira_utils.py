@@ -1,16 +1,102 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from collections import Counter
-from requests.auth import HTTPBasicAuth
-import requests
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterator
 from .utils.session_jira import get_session_credentials
+from .utils.http_pool import jira_sessions, credential_key
+from .utils.singleflight import jira_flights
+from .config import JIRA_FANOUT_WORKERS, JIRA_PAGE_SIZE
+from .mirror import mirror_issues, mirror_count, mirror_worklogs
+from .mirror.issues import parse_jira_ts
+from .jql_eval import compile_jql, JqlUnsupported
+from .db import release_conn
 import numpy as np
 import difflib
 
 
+# /search field projections. Callers request only the fields they read;
+# FIELDS_FULL is the historical default used when rendering tickets.
+FIELDS_FULL = "key,summary,status,assignee,reporter,created,updated,priority,issuetype,description,project,duedate,worklog,customfield_10561"
+FIELDS_TICKET = "summary,status,assignee,priority,updated,description,issuetype,customfield_10561"
+FIELDS_COUNT = "key"
+FIELDS_DISTRIBUTION = "status,priority,assignee,issuetype,updated"
+FIELDS_MY_ISSUES = "assignee,status"
+FIELDS_AGGREGATE = "status,priority,assignee,issuetype,project,created"
+FIELDS_PROJECT = "project"
+FIELDS_PEOPLE = "assignee,reporter"
+FIELDS_PERSONAL = "status,labels,duedate,updated"
+
+# Issues sampled (most recently updated first) for the dashboard distributions
+DISTRIBUTION_SAMPLE = 200
+
+# Dashboard counters that narrow another fetched query: counter -> superset.
+# When the superset page holds its whole result the counter is evaluated over
+# it locally instead of costing its own count request. The other counters
+# (high_priority, all_open, ...) span the whole instance; no fetched set
+# contains them, so they stay count requests (or mirror counts).
+DERIVED_COUNTERS = {"my_open": "my_total", "recent_activity": "distribution"}
+
+# Status / label vocabularies behind the personal panel
+DONE_STATUSES = ("Done", "Closed", "Resolved")
+REVIEW_STATUSES = ("In Review", "Code Review", "Peer Review")
+REVIEW_LABELS = ("needs-review", "review-pending")
+BLOCKED_LABELS = ("blocked", "waiting-on-external")
+
+
+def _assignee_clause(username: str) -> str:
+    if username == "currentUser()":
+        return "assignee = currentUser()"
+    return f'assignee = "{username}"'
+
+
+def _status_in(fields: Dict[str, Any], statuses) -> bool:
+    # JQL status comparisons are case-insensitive
+    name = ((fields.get("status") or {}).get("name") or "").casefold()
+    return any(name == s.casefold() for s in statuses)
+
+
+def _has_label(fields: Dict[str, Any], labels) -> bool:
+    return any(l in labels for l in fields.get("labels") or [])
+
+
+def fan_out(
+    tasks: Dict[str, Callable[[], Any]], max_workers: int = JIRA_FANOUT_WORKERS
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Run independent callables on a bounded thread pool.
+
+    Returns (results, timings_ms) keyed like `tasks`. A task that raises
+    yields None so one failing query never sinks the whole batch.
+    """
+    if not tasks:
+        return {}, {}
+
+    def timed(fn):
+        started = time.perf_counter()
+        try:
+            return fn(), (time.perf_counter() - started) * 1000
+        except Exception:
+            return None, (time.perf_counter() - started) * 1000
+        finally:
+            release_conn()  # hand any chat DB connection back before the pool thread exits
+
+    workers = max(1, min(max_workers, len(tasks)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {name: pool.submit(timed, fn) for name, fn in tasks.items()}
+        results, timings = {}, {}
+        for name, future in futures.items():
+            results[name], elapsed = future.result()
+            timings[name] = round(elapsed, 1)
+    return results, timings
+
+
 class JiraManager:
     def __init__(
-        self, base_url: str = None, username: str = None, password: str = None
+        self,
+        base_url: str = None,
+        username: str = None,
+        password: str = None,
+        max_workers: int = JIRA_FANOUT_WORKERS,
     ):
         # Try session credentials first, fallback to params
         session_url, session_user, session_pass = get_session_credentials()
@@ -18,10 +104,11 @@ class JiraManager:
         self.base_url = (session_url or base_url or "").rstrip("/")
         self.username = session_user or username
         self.password = session_pass or password
+        self.max_workers = max(1, int(max_workers or 1))
 
         if self.base_url and self.username and self.password:
-            self.session = requests.Session()
-            self.session.auth = HTTPBasicAuth(self.username, self.password)
+            # Warm keep-alive session shared by every manager with these credentials
+            self.session = jira_sessions.get(self.base_url, self.username, self.password)
         else:
             self.session = None
 
@@ -139,19 +226,133 @@ class JiraManager:
         
         return [match[0] for match in fuzzy_matches[:max_results]]
 
-    def search_issues(self, jql: str, max_results: int = 50) -> List[Dict[str, Any]]:
-        try:
-            params = {
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": "key,summary,status,assignee,reporter,created,updated,priority,issuetype,description,project,duedate,worklog,customfield_10561",
-            }
+    def _search(
+        self,
+        jql: str,
+        max_results: int = 50,
+        start_at: int = 0,
+        fields: Any = FIELDS_FULL,
+        validate: bool = True,
+    ) -> Dict[str, Any]:
+        """Raw /search call returning the full page payload (issues + total).
+
+        `fields` is a comma separated string or a sequence of field names.
+        validate=False sends validateQuery=false, so unknown values (e.g. a
+        deleted issue id) match nothing instead of failing the search with 400.
+        """
+        if not isinstance(fields, str):
+            fields = ",".join(fields)
+        params = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": fields,
+        }
+        if not validate:
+            params["validateQuery"] = "false"
+
+        def run():
             r = self.session.get(f"{self.base_url}/rest/api/2/search", params=params)
             r.raise_for_status()
-            return r.json().get("issues", [])
+            return r.json()
+
+        # Identical concurrent searches for the same identity share one request;
+        # the payload is shared too, so callers must treat it as read-only
+        key = (
+            "search",
+            credential_key(self.base_url, self.username, self.password),
+            jql,
+            fields,
+            max_results,
+            start_at,
+            validate,
+        )
+        return jira_flights.do(key, run)
+
+    def search_issues(
+        self, jql: str, max_results: int = 50, fields: Any = FIELDS_FULL
+    ) -> List[Dict[str, Any]]:
+        try:
+            return list(self._search(jql, max_results, fields=fields).get("issues", []))
         except Exception:
             return []
 
+    def iter_issues(
+        self,
+        jql: str,
+        max_issues: Optional[int] = None,
+        page_size: int = JIRA_PAGE_SIZE,
+        fields: Any = FIELDS_FULL,
+        strict: bool = False,
+        validate: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream issues matching `jql` by walking startAt pages.
+
+        The next page is requested in the background while the caller is still
+        consuming the current one, so at most two pages are held in memory
+        regardless of the total. Stops quietly on the first failed page, like
+        search_issues(), unless `strict` is set, in which case the error is raised.
+        """
+        limit = max_issues if max_issues is not None else float("inf")
+        if limit <= 0:
+            return
+        prefetch = ThreadPoolExecutor(max_workers=1)
+
+        def fetch(start):
+            size = int(min(page_size, limit - start))
+            return start, self._search(jql, size, start, fields, validate)
+
+        try:
+            pending = prefetch.submit(fetch, 0)
+            while pending is not None:
+                try:
+                    start, page = pending.result()
+                except Exception:
+                    if strict:
+                        raise
+                    return
+                issues = page.get("issues", [])
+                next_start = start + len(issues)
+                pending = None
+                if issues and next_start < min(page.get("total", 0), limit):
+                    pending = prefetch.submit(fetch, next_start)
+                yield from issues
+        finally:
+            prefetch.shutdown(wait=False, cancel_futures=True)
+
+    def _local_count(self, jql: str) -> Optional[int]:
+        """Count `jql` in the local mirror with SQL, or None when it has to go to Jira.
+
+        Only pure created/updated window queries qualify (recent_activity,
+        created_this_month, the previous-month trend), and only when the opt-in
+        issue mirror is enabled, fresh and covers the window's lower bound.
+        """
+        now = datetime.now()
+        try:
+            query = compile_jql(jql)
+            bounds = query.date_bounds(self.username, now)
+            since = query.updated_since(self.username, now)
+        except (JqlUnsupported, TypeError):
+            return None
+        if not bounds or since is None:
+            return None
+        return mirror_count(self, since, bounds)
+
+    def count_issues(self, jql: str) -> int:
+        """Return the number of issues matching `jql` without fetching any of them.
+
+        Uses maxResults=0 so Jira only computes `total`; unlike len(search_issues())
+        the result is not capped by the page size. Derived window queries are
+        counted in the local mirror when possible.
+        """
+        local = self._local_count(jql)
+        if local is not None:
+            return local
+        try:
+            return int(self._search(jql, 0, fields=FIELDS_COUNT).get("total", 0))
+        except Exception:
+            return 0
+
     def get_worklog(self, issue_key: str) -> List[Dict[str, Any]]:
         """Get worklog entries for a specific issue"""
         try:
@@ -163,135 +364,129 @@ class JiraManager:
         except Exception:
             return []
 
-    def get_personal_stats(self) -> Dict[str, Any]:
-        """Get personalized stats for today, risks, and capacity"""
-        current_user = self.get_current_user()
-        username = current_user.get("name") or "currentUser()"
-        today = datetime.now().date()
-
-        # Today's stats
-        today_stats = self._get_today_stats(username)
+    def get_personal_stats(self, username: str = None) -> Dict[str, Any]:
+        """Get personalized stats for today, risks, and capacity.
 
-        # Risk stats
-        risk_stats = self._get_risk_stats(username)
+        All six counters and the aging percentile are subsets of "my unresolved
+        issues, plus anything due or touched today, plus review/blocked
+        labels", so that superset is fetched once (projected fields, all pages)
+        and every metric is evaluated locally. Capacity additionally fetches
+        worklogs for the issues touched today.
+        """
+        if not username:
+            current_user = self.get_current_user()
+            username = current_user.get("name") or "currentUser()"
+        today = datetime.now().date()
+        timings = {}
+
+        started = time.perf_counter()
+        labels = ", ".join(f'"{l}"' for l in REVIEW_LABELS + BLOCKED_LABELS)
+        superset_jql = (
+            f"{_assignee_clause(username)} AND ("
+            f'status not in ("Done", "Closed", "Resolved") OR duedate = "{today}" '
+            f'OR updated >= "{today}" OR labels in ({labels}))'
+        )
+        issues = list(self.iter_issues(superset_jql, fields=FIELDS_PERSONAL))
+        timings["fetch"] = round((time.perf_counter() - started) * 1000, 1)
 
-        # Capacity stats
-        capacity_stats = self._get_capacity_stats(username, today)
+        started = time.perf_counter()
+        capacity_stats = self._get_capacity_stats(issues, today)
+        timings["capacity"] = round((time.perf_counter() - started) * 1000, 1)
 
-        return {"today": today_stats, "risks": risk_stats, "capacity": capacity_stats}
+        return {
+            "today": self._get_today_stats(issues, today),
+            "risks": self._get_risk_stats(issues, today),
+            "capacity": capacity_stats,
+            "timings_ms": timings,
+        }
 
-    def _get_today_stats(self, username: str) -> Dict[str, Any]:
+    def _get_today_stats(self, issues: List[Dict[str, Any]], today) -> Dict[str, Any]:
         """Get today's due and review stats"""
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Due today
-        due_today_jql = (
-            f'assignee = "{username}" AND duedate = "{today}"'
-            if username != "currentUser()"
-            else f'assignee = currentUser() AND duedate = "{today}"'
-        )
-        due_today = self.search_issues(due_today_jql, 100)
-
-        # Overdue
-        overdue_jql = (
-            f'assignee = "{username}" AND duedate < "{today}" AND status not in ("Done", "Closed", "Resolved")'
-            if username != "currentUser()"
-            else f'assignee = currentUser() AND duedate < "{today}" AND status not in ("Done", "Closed", "Resolved")'
-        )
-        overdue = self.search_issues(overdue_jql, 100)
-
-        # Reviews waiting (issues in review status or with review-related labels)
-        reviews_jql = (
-            f'assignee = "{username}" AND (status in ("In Review", "Code Review", "Peer Review") OR labels in ("needs-review", "review-pending"))'
-            if username != "currentUser()"
-            else f'assignee = currentUser() AND (status in ("In Review", "Code Review", "Peer Review") OR labels in ("needs-review", "review-pending"))'
-        )
-        reviews = self.search_issues(reviews_jql, 100)
+        today_str = today.strftime("%Y-%m-%d")
+        due_today = overdue = reviews = 0
+        for issue in issues:
+            f = issue.get("fields", {})
+            duedate = f.get("duedate") or ""
+            if duedate == today_str:
+                due_today += 1
+            if duedate and duedate < today_str and not _status_in(f, DONE_STATUSES):
+                overdue += 1
+            # Reviews waiting (issues in review status or with review-related labels)
+            if _status_in(f, REVIEW_STATUSES) or _has_label(f, REVIEW_LABELS):
+                reviews += 1
 
         return {
-            "due_today": len(due_today),
-            "overdue": len(overdue),
-            "reviews_waiting": len(reviews),
+            "due_today": due_today,
+            "overdue": overdue,
+            "reviews_waiting": reviews,
         }
 
-    def _get_risk_stats(self, username: str) -> Dict[str, Any]:
+    def _get_risk_stats(self, issues: List[Dict[str, Any]], today) -> Dict[str, Any]:
         """Get risk-related stats"""
         # Predicted slips (issues that are approaching due date but not progressing)
-        today = datetime.now().date()
-        near_due = today + timedelta(days=5)
-
-        predicted_slips_jql = (
-            f'assignee = "{username}" AND duedate >= "{today}" AND duedate <= "{near_due}" AND status not in ("Done", "Closed", "Resolved", "In Progress") AND updated <= "-3d"'
-            if username != "currentUser()"
-            else f'assignee = currentUser() AND duedate >= "{today}" AND duedate <= "{near_due}" AND status not in ("Done", "Closed", "Resolved", "In Progress") AND updated <= "-3d"'
-        )
-        predicted_slips = self.search_issues(predicted_slips_jql, 100)
-
-        # Blocked issues
-        blocked_jql = (
-            f'assignee = "{username}" AND (status = "Blocked" OR labels in ("blocked", "waiting-on-external"))'
-            if username != "currentUser()"
-            else f'assignee = currentUser() AND (status = "Blocked" OR labels in ("blocked", "waiting-on-external"))'
-        )
-        blocked = self.search_issues(blocked_jql, 100)
-
-        # Aging p90 - get all open issues and calculate 90th percentile of days since last update
-        aging_jql = (
-            f'assignee = "{username}" AND status not in ("Done", "Closed", "Resolved")'
-            if username != "currentUser()"
-            else f'assignee = currentUser() AND status not in ("Done", "Closed", "Resolved")'
-        )
-        aging_issues = self.search_issues(aging_jql, 200)
+        today_str = today.strftime("%Y-%m-%d")
+        near_due = (today + timedelta(days=5)).strftime("%Y-%m-%d")
+        stale_before = datetime.now(timezone.utc) - timedelta(days=3)
 
+        predicted_slips = blocked = 0
         aging_days = []
-        for issue in aging_issues:
-            updated_str = issue.get("fields", {}).get("updated", "")
-            if updated_str:
-                try:
-                    updated_date = datetime.fromisoformat(
-                        updated_str.replace("Z", "+00:00")
-                    ).date()
-                    days_since_update = (datetime.now().date() - updated_date).days
-                    aging_days.append(days_since_update)
-                except:
-                    pass
+        for issue in issues:
+            f = issue.get("fields", {})
+            duedate = f.get("duedate") or ""
+            updated = parse_jira_ts(f.get("updated"))
+            if (
+                duedate
+                and today_str <= duedate <= near_due
+                and not _status_in(f, DONE_STATUSES + ("In Progress",))
+                and updated is not None
+                and updated <= stale_before
+            ):
+                predicted_slips += 1
+            # Blocked issues
+            if _status_in(f, ("Blocked",)) or _has_label(f, BLOCKED_LABELS):
+                blocked += 1
+            # Aging - days since last update of every open issue
+            if updated is not None and not _status_in(f, DONE_STATUSES):
+                aging_days.append((today - updated.date()).days)
 
         aging_p90 = int(np.percentile(aging_days, 90)) if aging_days else 0
 
         return {
-            "predicted_slips": len(predicted_slips),
-            "blocked_count": len(blocked),
+            "predicted_slips": predicted_slips,
+            "blocked_count": blocked,
             "aging_p90_days": aging_p90,
         }
 
-    def _get_capacity_stats(
-        self, username: str, today: datetime.date
-    ) -> Dict[str, Any]:
+    def _get_capacity_stats(self, issues: List[Dict[str, Any]], today) -> Dict[str, Any]:
         """Get capacity and time tracking stats"""
-        # Get issues worked on today
+        # Issues updated today by the user (same cut-off as `updated >= "<today>"`)
         today_str = today.strftime("%Y-%m-%d")
+        worked_today = [
+            i for i in issues if (i.get("fields", {}).get("updated") or "")[:10] >= today_str
+        ]
 
-        # Find issues updated today by the user
-        worked_today_jql = (
-            f'assignee = "{username}" AND updated >= "{today_str}"'
-            if username != "currentUser()"
-            else f'assignee = currentUser() AND updated >= "{today_str}"'
-        )
-        worked_today = self.search_issues(worked_today_jql, 100)
-
-        # Calculate hours logged today (this is simplified - in real implementation you'd use worklog API)
-        hours_logged = 0
-        for issue in worked_today[:10]:  # Limit to avoid too many API calls
-            try:
-                worklog = self.get_worklog(issue.get("key"))
-                for entry in worklog:
-                    started_date = datetime.fromisoformat(
-                        entry.get("started", "").replace("Z", "+00:00")
+        touched_keys = [issue.get("key") for issue in worked_today if issue.get("key")]
+        local = mirror_worklogs(self, today_str, today_str, issue_keys=touched_keys)
+        if local is not None:
+            hours_logged = sum(w["seconds"] for w in local) / 3600
+            worklogs = {}
+        else:
+            # Fetch every touched issue's worklog concurrently (no arbitrary cap)
+            worklogs, _ = fan_out(
+                {k: (lambda k=k: self.get_worklog(k)) for k in touched_keys},
+                self.max_workers,
+            )
+            hours_logged = 0
+        for worklog in worklogs.values():
+            for entry in worklog or []:
+                try:
+                    started_date = datetime.strptime(
+                        entry.get("started", "")[:10], "%Y-%m-%d"
                     ).date()
-                    if started_date == today:
-                        hours_logged += entry.get("timeSpentSeconds", 0) / 3600
-            except:
-                pass
+                except ValueError:
+                    continue
+                if started_date == today:
+                    hours_logged += entry.get("timeSpentSeconds", 0) / 3600
 
         # Target hours (could be configurable)
         target_hours = 8
@@ -337,17 +532,65 @@ class JiraManager:
             "created_this_month": "created >= -30d",
             "resolved_this_month": 'status changed to ("Done", "Closed", "Resolved") DURING (-30d, now())',
         }
-        stats = {}
-        detail = {}
-        for k, q in queries.items():
-            issues = self.search_issues(q, 100)
-            stats[k] = len(issues)
-            detail[k] = issues
+        # Distribution window can be served from the local mirror when it is fresh.
+        # Both paths sample the same DISTRIBUTION_SAMPLE most recently updated issues,
+        # so the charts do not change with the path that answered.
+        mirrored = mirror_issues(
+            self, "updated", datetime.now() - timedelta(days=30), limit=DISTRIBUTION_SAMPLE
+        )
+        # The mirror already counts recent_activity with SQL
+        derived = {
+            k: src for k, src in DERIVED_COUNTERS.items()
+            if not (src == "distribution" and mirrored is not None)
+        }
+        # Every search below is independent: fan them out on one bounded pool.
+        # Summary metrics are pure counters, so only ask Jira for `total`;
+        # my_total fetches one page of my issues so my_open can be derived from it.
+        tasks = {
+            k: (lambda q=q: self.count_issues(q))
+            for k, q in queries.items()
+            if k not in derived and k != "my_total"
+        }
+        tasks["my_total"] = lambda: self._search(
+            queries["my_total"], JIRA_PAGE_SIZE, fields=FIELDS_MY_ISSUES
+        )
+        tasks["recent_tickets"] = lambda: self.search_issues(
+            queries["recent_activity"], 10, FIELDS_TICKET
+        )
+        if mirrored is None:
+            tasks["distribution"] = lambda: self._search(
+                "updated >= -30d ORDER BY updated DESC", DISTRIBUTION_SAMPLE, fields=FIELDS_DISTRIBUTION
+            )
+        tasks["prev_month"] = lambda: self.count_issues(
+            "created >= -60d AND created <= -30d"
+        )
+        tasks["personal"] = lambda: self.get_personal_stats(username)
+        results, timings = fan_out(tasks, self.max_workers)
+
+        stats = {k: results.get(k) or 0 for k in queries if k in tasks}
+        stats["my_total"] = int((results.get("my_total") or {}).get("total", 0))
+        # Derived counters; the ones whose superset was incomplete or failed
+        # are counted by Jira in one more parallel round
+        recount = {}
+        for key, source in derived.items():
+            count = self._count_within(results.get(source), queries[key])
+            if count is None:
+                recount[key] = lambda q=queries[key]: self.count_issues(q)
+            else:
+                stats[key] = count
+        if recount:
+            recounted, recount_timings = fan_out(recount, self.max_workers)
+            stats.update({k: v or 0 for k, v in recounted.items()})
+            timings.update(recount_timings)
         status_counts = Counter()
         priority_counts = Counter()
         assignee_counts = Counter()
         type_counts = Counter()
-        all_issues = self.search_issues("updated >= -30d", 200)
+        all_issues = (
+            mirrored
+            if mirrored is not None
+            else (results.get("distribution") or {}).get("issues") or []
+        )
         for issue in all_issues:
             f = issue.get("fields", {})
             status_counts[(f.get("status") or {}).get("name", "Unknown")] += 1
@@ -356,8 +599,7 @@ class JiraManager:
                 (f.get("assignee") or {}).get("displayName", "Unassigned")
             ] += 1
             type_counts[(f.get("issuetype") or {}).get("name", "Unknown")] += 1
-        prev_month = self.search_issues("created >= -60d AND created <= -30d", 100)
-        prev_count = len(prev_month)
+        prev_count = results.get("prev_month") or 0
         curr_count = stats.get("created_this_month", 0)
         growth = (
             ((curr_count - prev_count) / prev_count * 100)
@@ -365,8 +607,9 @@ class JiraManager:
             else (100 if curr_count else 0)
         )
 
-        # Add personal stats
-        personal_stats = self.get_personal_stats()
+        personal_stats = results.get("personal") or {}
+        for k, ms in personal_stats.pop("timings_ms", {}).items():
+            timings[f"personal.{k}"] = ms
 
         return {
             "summary": {
@@ -392,10 +635,28 @@ class JiraManager:
                 "growth_rate": round(growth, 1),
             },
             "recent_tickets": self._format_tickets(
-                detail.get("recent_activity", [])[:10]
+                (results.get("recent_tickets") or [])[:10]
             ),
+            # Per-query wall time so slow JQL stands out
+            "timings_ms": timings,
         }
 
+    def _count_within(self, page: Optional[Dict[str, Any]], jql: str) -> Optional[int]:
+        """Count `jql` over an already fetched /search page, or None when Jira has to.
+
+        Only valid when `jql` narrows the page's own query and the page holds that
+        query's whole result (total <= issues returned).
+        """
+        if not page:
+            return None
+        issues = page.get("issues") or []
+        if int(page.get("total", 0)) > len(issues):
+            return None
+        try:
+            return len(compile_jql(jql).filter(issues, self.username))
+        except (JqlUnsupported, TypeError):
+            return None
+
     def _format_tickets(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         out = []
         for issue in issues:
@@ -423,8 +684,60 @@ class JiraManager:
 
 
 # Aggregation for visualization
-from typing import Optional, Tuple
-from collections import Counter as _Counter
+from .columnar import IssueColumns, fold_top_n
+
+
+def _fetch_columns(
+    jira_manager: JiraManager,
+    date_field: str,
+    from_date: Optional[str],
+    to_date: Optional[str],
+    jql_extra: Optional[str],
+    max_issues: int,
+) -> Tuple[IssueColumns, str]:
+    """Build the date-window JQL, fetch matching issues once and encode them."""
+    clauses = []
+    if from_date:
+        clauses.append(f'{date_field} >= "{from_date}"')
+    if to_date:
+        clauses.append(f'{date_field} <= "{to_date}"')
+    if jql_extra:
+        clauses.append(f"({jql_extra})")
+
+    jql = " AND ".join(clauses) if clauses else f"{date_field} >= -30d"
+
+    # Date-window queries can be answered from the local mirror; extra clauses
+    # are evaluated locally when they fall inside the supported JQL subset.
+    # The mirror is read from `since`, so the JQL must have that same lower
+    # bound: an explicit from_date or the default -30d window. A to_date-only
+    # or jql_extra-only query reaches back indefinitely and goes to Jira.
+    mirrored = None
+    lower_bounded = bool(from_date) or not clauses
+    try:
+        extra = compile_jql(jql_extra) if jql_extra else None
+        since = (
+            datetime.strptime(from_date, "%Y-%m-%d")
+            if from_date
+            else datetime.now() - timedelta(days=30)
+        )
+        until = datetime.strptime(to_date, "%Y-%m-%d") if to_date else None
+        if lower_bounded:
+            mirrored = mirror_issues(
+                jira_manager, date_field, since, until, limit=None if extra else max_issues
+            )
+        if mirrored is not None and extra is not None:
+            mirrored = extra.filter(mirrored, jira_manager.username)[:max_issues]
+    except (ValueError, TypeError, JqlUnsupported):
+        mirrored = None
+
+    # Otherwise stream pages instead of one capped request; memory stays bounded by page size
+    issues = (
+        mirrored
+        if mirrored is not None
+        else jira_manager.iter_issues(jql, max_issues, fields=FIELDS_AGGREGATE)
+    )
+    # Encode issues into columnar codes batch by batch
+    return IssueColumns.from_issues(issues), jql
 
 
 def aggregate_issues(
@@ -458,104 +771,126 @@ def aggregate_issues(
     if group_by not in allowed:
         return None, f"group_by harus salah satu dari {allowed}"
     
-    clauses = []
     date_field = "created" if group_by == "created_date" else "updated"
-    if from_date:
-        clauses.append(f'{date_field} >= "{from_date}"')
-    if to_date:
-        clauses.append(f'{date_field} <= "{to_date}"')
-    if jql_extra:
-        clauses.append(f"({jql_extra})")
-    
-    jql = " AND ".join(clauses) if clauses else f"{date_field} >= -30d"
-    
-    issues = jira_manager.search_issues(jql, max_issues)
-    counter = _Counter()
-    
-    # Collect distinct values for filter options
-    distinct_status = set()
-    distinct_assignee = set()
-    distinct_project = set()
-    distinct_priority = set()
-    distinct_type = set()
-    
-    for issue in issues:
-        f = issue.get("fields", {})
-        
-        # Determine the grouping key
-        if group_by == "status":
-            key = (f.get("status") or {}).get("name", "Unknown")
-        elif group_by == "priority":
-            key = (f.get("priority") or {}).get("name", "Medium")
-        elif group_by == "assignee":
-            key = (f.get("assignee") or {}).get("displayName", "Unassigned")
-        elif group_by == "type":
-            key = (f.get("issuetype") or {}).get("name", "Unknown")
-        elif group_by == "created_date":
-            key = (f.get("created") or "")[:10] or "Unknown"
-        else:
-            key = "Unknown"
-        
-        counter[key] += 1
-        
-        # Collect distinct values for filter options
-        distinct_status.add((f.get("status") or {}).get("name", "Unknown"))
-        distinct_priority.add((f.get("priority") or {}).get("name", "Medium"))
-        distinct_assignee.add((f.get("assignee") or {}).get("displayName", "Unassigned"))
-        distinct_type.add((f.get("issuetype") or {}).get("name", "Unknown"))
-        proj = (f.get("project") or {}).get("key") if f.get("project") else None
-        if proj:
-            distinct_project.add(proj)
-    
-    # Sort the aggregated data appropriately
-    if group_by == "created_date":
-        # For dates, sort chronologically (ascending by date)
-        counts_data = [
-            {"label": k, "value": v}
-            for k, v in sorted(counter.items(), key=lambda x: x[0])  # Sort by date string
-        ]
-    else:
-        # For all other groupings, sort by count (descending) then by label
-        counts_data = [
-            {"label": k, "value": v}
-            for k, v in sorted(counter.items(), key=lambda x: (-x[1], x[0]))  # Sort by count desc, then label asc
-        ]
-    
+    columns, jql = _fetch_columns(
+        jira_manager, date_field, from_date, to_date, jql_extra, max_issues
+    )
+    labels, counts = columns.group_counts(
+        group_by, chronological=(group_by == "created_date")
+    )
+    total_groups = len(labels)
+
     # Apply max_groups limit if specified
-    limited_data = counts_data
-    others_count = 0
-    
-    if max_groups and isinstance(max_groups, int) and max_groups > 0 and len(counts_data) > max_groups:
+    if max_groups and isinstance(max_groups, int) and max_groups > 0 and total_groups > max_groups:
         if group_by == "created_date":
             # For date grouping, keep chronological order and limit
-            limited_data = counts_data[:max_groups]
+            shown_labels, shown_counts = labels[:max_groups].tolist(), counts[:max_groups].tolist()
         else:
-            # For other groupings, take top N by value (data is already sorted by value desc)
-            limited_data = counts_data[:max_groups]
-            # Calculate "Others" category for remaining items
-            others_items = counts_data[max_groups:]
-            others_count = sum(item["value"] for item in others_items)
-            if others_count > 0:
-                limited_data.append({"label": "Others", "value": others_count})
-    
+            # Top N by value (already sorted desc) plus an "Others" bucket for the rest
+            shown_labels, shown_counts = fold_top_n(labels, counts, max_groups)
+    else:
+        shown_labels, shown_counts = labels.tolist(), counts.tolist()
+    limited_data = [
+        {"label": k, "value": int(v)} for k, v in zip(shown_labels, shown_counts)
+    ]
+
     return (
         {
             "group_by": group_by,
             "from": from_date,
             "to": to_date,
-            "total": sum(counter.values()),
+            "total": int(columns.size),
             "counts": limited_data,  # Now properly limited based on max_groups
-            "total_groups": len(counts_data),  # Original number of groups  
-            "showing_groups": len(counts_data),  # Showing number of groups
+            "total_groups": total_groups,  # Original number of groups
+            "showing_groups": total_groups,  # Showing number of groups
+            "jql": jql,
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "distincts": {
+                dim: columns.distinct(dim)
+                for dim in ("status", "assignee", "project", "priority", "type")
+            },
+        },
+        None,
+    )
+
+def pivot_issues(
+    jira_manager: JiraManager,
+    dimensions: List[str],
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    jql_extra: Optional[str] = None,
+    max_issues: int = 500,
+    max_groups: Optional[int] = None,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Multi-dimensional aggregation over a single fetched issue set.
+
+    Args:
+        jira_manager: JiraManager instance
+        dimensions: 2-4 of "status", "priority", "assignee", "type", "project", "created_date"
+        from_date, to_date, jql_extra, max_issues: as in aggregate_issues
+        max_groups: Per-dimension cap; the remainder is folded into "Others"
+
+    Returns:
+        Tuple of (pivot_data, error_message). pivot_data holds per-dimension
+        counts plus one compact matrix per dimension pair:
+        {"rows": dim_a, "columns": dim_b, "row_labels": [...],
+         "column_labels": [...], "matrix": [[...], ...]}
+    """
+    if jira_manager is None:
+        return None, "Jira manager belum terinisialisasi."
+
+    allowed = {"status", "priority", "assignee", "type", "project", "created_date"}
+    dimensions = list(dict.fromkeys(dimensions or []))
+    if not 2 <= len(dimensions) <= 4 or not set(dimensions) <= allowed:
+        return None, f"dimensions harus 2-4 nilai unik dari {allowed}"
+    if not (isinstance(max_groups, int) and max_groups > 0):
+        max_groups = None
+
+    date_field = "created" if "created_date" in dimensions else "updated"
+    columns, jql = _fetch_columns(
+        jira_manager, date_field, from_date, to_date, jql_extra, max_issues
+    )
+
+    counts = {}
+    for dim in dimensions:
+        labels, values = columns.group_counts(dim, chronological=(dim == "created_date"))
+        if max_groups and len(labels) > max_groups:
+            labels, values = fold_top_n(labels, values, max_groups)
+        else:
+            labels, values = labels.tolist(), values.tolist()
+        counts[dim] = [{"label": k, "value": int(v)} for k, v in zip(labels, values)]
+
+    crosstabs = []
+    for i, row_dim in enumerate(dimensions):
+        for col_dim in dimensions[i + 1:]:
+            row_labels, col_labels, matrix = columns.crosstab(
+                row_dim, col_dim, max_groups, max_groups
+            )
+            crosstabs.append(
+                {
+                    "rows": row_dim,
+                    "columns": col_dim,
+                    "row_labels": row_labels,
+                    "column_labels": col_labels,
+                    "matrix": matrix.tolist(),
+                }
+            )
+
+    return (
+        {
+            "dimensions": dimensions,
+            "from": from_date,
+            "to": to_date,
+            "total": int(columns.size),
+            "counts": counts,
+            "crosstabs": crosstabs,
             "jql": jql,
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "distincts": {
-                "status": sorted(distinct_status - {None}),
-                "assignee": sorted(distinct_assignee - {None}),
-                "project": sorted(distinct_project - {None}),
-                "priority": sorted(distinct_priority - {None}),
-                "type": sorted(distinct_type - {None}),
+                dim: columns.distinct(dim)
+                for dim in ("status", "assignee", "project", "priority", "type")
             },
         },
         None,
-    )
\ No newline at end of file
+    )
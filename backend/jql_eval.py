@@ -0,0 +1,410 @@
+"""Local evaluator for the JQL subset this backend generates itself.
+
+Supported:
+- Clauses: `field = v`, `!=`, `<`, `<=`, `>`, `>=`, `field [not] in (v, ...)`,
+  `field is [not] EMPTY|NULL`. A bare EMPTY/NULL value (`assignee in (EMPTY)`,
+  `duedate = EMPTY`) matches a missing field, as in Jira.
+- Boolean structure: AND, OR, NOT and parentheses. A trailing ORDER BY is ignored.
+- Values: quoted or bare strings, currentUser(), absolute dates
+  ("2024-01-31", "2024/01/31 10:00"), relative dates ("-7d", "-2w", "-4h",
+  "-30m") and now()/startOfDay()/endOfDay()/startOfWeek()/startOfMonth().
+  Date functions take Jira's optional increment: "-1", "+2w", "-1M", "1y";
+  a bare number counts in the function's own unit (startOfMonth(-1) is last month).
+- Fields: status, priority, issuetype/type, resolution, project, key,
+  assignee, reporter, labels, created, updated, duedate/due.
+
+Anything else (text search, `changed`/`was`, worklog fields, ...) raises
+JqlUnsupported, which tells callers to send the query to Jira instead. Values
+that parse but cannot be evaluated raise JqlUnsupported too, never TypeError.
+Issues are matched in Jira's REST shape ({"key", "fields": {...}}).
+"""
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class JqlUnsupported(ValueError):
+    """Raised when a query falls outside the locally evaluable subset."""
+
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>!=|>=|<=|!~|=|<|>|~)
+      | (?P<punct>[(),])
+      | (?P<word>[A-Za-z0-9_.\-+/:@]+)
+    )""",
+    re.VERBOSE,
+)
+
+_NAME_FIELDS = {"status": "status", "priority": "priority", "issuetype": "issuetype", "type": "issuetype", "resolution": "resolution"}
+_USER_FIELDS = {"assignee", "reporter"}
+_DATE_FIELDS = {"created": "created", "updated": "updated", "duedate": "duedate", "due": "duedate"}
+_RELATIVE = re.compile(r"^([+-]?\d+)([mhdw])$")
+_INCREMENT = re.compile(r"^([+-]?\d+)([yMwdhm]?)$")
+_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+# Unit of a bare-number increment, e.g. startOfMonth(-1) is one month back
+_FUNC_UNITS = {"now": "m", "startofday": "d", "endofday": "d", "startofweek": "w", "startofmonth": "M"}
+
+
+def _tokenize(jql: str) -> List[tuple]:
+    tokens, pos = [], 0
+    jql = jql.strip()
+    while pos < len(jql):
+        m = _TOKEN.match(jql, pos)
+        if not m or m.end() == pos:
+            raise JqlUnsupported(f"Cannot tokenize JQL near: {jql[pos:pos + 20]!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        text = m.group(kind)
+        if kind == "string":
+            text = re.sub(r"\\(.)", r"\1", text[1:-1])
+        tokens.append((kind, text))
+    return tokens
+
+
+class _Value:
+    """Literal or function value; resolved against the evaluation context."""
+
+    def __init__(self, text: str, func: Optional[str] = None, quoted: bool = False):
+        self.text, self.func, self.quoted = text, func, quoted
+        # Unquoted EMPTY/NULL stands for "no value"; "EMPTY" in quotes is a literal
+        self.empty = not quoted and not func and text.lower() in ("empty", "null")
+
+    def as_text(self, ctx) -> str:
+        if self.empty:
+            raise JqlUnsupported("EMPTY is not a text value")
+        if self.func == "currentuser":
+            if not ctx.get("current_user"):
+                raise JqlUnsupported("currentUser() needs a known username")
+            return ctx["current_user"]
+        if self.func:
+            raise JqlUnsupported(f"Function {self.func}() is not a text value")
+        return self.text
+
+    def as_datetime(self, ctx) -> datetime:
+        if self.empty:
+            raise JqlUnsupported("EMPTY is not a date value")
+        now = ctx["now"]
+        if self.func:
+            if self.func not in _FUNC_UNITS:
+                raise JqlUnsupported(f"Unsupported date function {self.func}()")
+            day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            if self.func == "now":
+                base = now
+            elif self.func == "startofday":
+                base = day
+            elif self.func == "endofday":
+                base = day + timedelta(days=1) - timedelta(microseconds=1)
+            elif self.func == "startofweek":
+                base = day - timedelta(days=(day.weekday() + 1) % 7)
+            else:
+                base = day.replace(day=1)
+            return _increment(base, self.text, _FUNC_UNITS[self.func]) if self.text else base
+        rel = _relative(self.text)
+        if rel is not None:
+            return now + rel
+        for fmt in ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d"):
+            try:
+                return datetime.strptime(self.text, fmt)
+            except ValueError:
+                continue
+        raise JqlUnsupported(f"Unsupported date literal {self.text!r}")
+
+
+def _relative(text: str) -> Optional[timedelta]:
+    m = _RELATIVE.match(text.strip()) if text else None
+    if not m:
+        return None
+    return timedelta(**{_UNITS[m.group(2)]: int(m.group(1))})
+
+
+def _increment(base: datetime, text: str, default_unit: str) -> datetime:
+    """Apply a date-function increment such as "-1", "+2w" or "-1M" to `base`."""
+    m = _INCREMENT.match(text.strip())
+    if not m:
+        raise JqlUnsupported(f"Unsupported date increment {text!r}")
+    n, unit = int(m.group(1)), m.group(2) or default_unit
+    if unit in ("M", "y"):
+        months = base.year * 12 + base.month - 1 + (n if unit == "M" else 12 * n)
+        year, month = divmod(months, 12)
+        # Clamp like Jira: Jan 31 + 1M is the last day of February
+        last = (datetime(year + (month + 1) // 12, (month + 1) % 12 + 1, 1) - timedelta(days=1)).day
+        return base.replace(year=year, month=month + 1, day=min(base.day, last))
+    return base + timedelta(**{_UNITS[unit]: n})
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens, self.i = tokens, 0
+
+    def peek(self, offset=0):
+        j = self.i + offset
+        return self.tokens[j] if j < len(self.tokens) else (None, None)
+
+    def keyword(self, *words) -> bool:
+        kind, text = self.peek()
+        if kind == "word" and text.lower() in words:
+            self.i += 1
+            return True
+        return False
+
+    def expect(self, kind, text=None):
+        k, t = self.peek()
+        if k != kind or (text is not None and t != text):
+            raise JqlUnsupported(f"Expected {text or kind}, got {t!r}")
+        self.i += 1
+        return t
+
+    def parse(self):
+        node = self.or_expr()
+        if self.keyword("order"):
+            self.i = len(self.tokens)  # ordering is irrelevant for matching
+        if self.i != len(self.tokens):
+            raise JqlUnsupported(f"Unexpected token {self.peek()[1]!r}")
+        return node
+
+    def or_expr(self):
+        nodes = [self.and_expr()]
+        while self.keyword("or"):
+            nodes.append(self.and_expr())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def and_expr(self):
+        nodes = [self.not_expr()]
+        while self.keyword("and"):
+            nodes.append(self.not_expr())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def not_expr(self):
+        if self.keyword("not"):
+            return ("not", self.not_expr())
+        if self.peek() == ("punct", "("):
+            self.i += 1
+            node = self.or_expr()
+            self.expect("punct", ")")
+            return node
+        return self.clause()
+
+    def clause(self):
+        field = self.expect("word").lower()
+        if field not in _NAME_FIELDS and field not in _USER_FIELDS and field not in _DATE_FIELDS and field not in ("project", "key", "labels"):
+            raise JqlUnsupported(f"Field {field!r} is not evaluated locally")
+        if self.keyword("is"):
+            negate = self.keyword("not")
+            if not self.keyword("empty", "null"):
+                raise JqlUnsupported("IS only supports EMPTY/NULL")
+            return ("clause", field, "is not empty" if negate else "is empty", None)
+        if self.keyword("not"):
+            if not self.keyword("in"):
+                raise JqlUnsupported("Expected IN after NOT")
+            return ("clause", field, "not in", self.value_list())
+        if self.keyword("in"):
+            return ("clause", field, "in", self.value_list())
+        kind, op = self.peek()
+        if kind != "op" or op in ("~", "!~"):
+            raise JqlUnsupported(f"Operator {op!r} is not evaluated locally")
+        self.i += 1
+        return ("clause", field, op, self.value())
+
+    def value_list(self):
+        self.expect("punct", "(")
+        values = [self.value()]
+        while self.peek() == ("punct", ","):
+            self.i += 1
+            values.append(self.value())
+        self.expect("punct", ")")
+        return values
+
+    def value(self):
+        kind, text = self.peek()
+        if kind == "string":
+            self.i += 1
+            return _Value(text, quoted=True)
+        if kind != "word":
+            raise JqlUnsupported(f"Expected a value, got {text!r}")
+        self.i += 1
+        if self.peek() == ("punct", "("):
+            self.i += 1
+            arg = ""
+            if self.peek() != ("punct", ")"):
+                arg = self.peek()[1]
+                self.i += 1
+            self.expect("punct", ")")
+            return _Value(arg, func=text.lower())
+        return _Value(text)
+
+
+# --- evaluation ----------------------------------------------------------------
+
+
+def _to_local_naive(value: str) -> Optional[datetime]:
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt).astimezone().replace(tzinfo=None)
+        except ValueError:
+            continue
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _text_values(issue: Dict[str, Any], field: str) -> List[str]:
+    """All case-folded identifiers a JQL literal may match for `field`."""
+    f = issue.get("fields") or {}
+    if field == "key":
+        return [(issue.get("key") or "").casefold()]
+    if field in _NAME_FIELDS:
+        obj = f.get(_NAME_FIELDS[field]) or {}
+        return [v.casefold() for v in (obj.get("name"), obj.get("id")) if v]
+    if field == "project":
+        obj = f.get("project") or {}
+        return [v.casefold() for v in (obj.get("key"), obj.get("name"), obj.get("id")) if v]
+    if field in _USER_FIELDS:
+        obj = f.get(field) or {}
+        keys = ("name", "key", "accountId", "emailAddress", "displayName")
+        return [obj[k].casefold() for k in keys if obj.get(k)]
+    if field == "labels":
+        return [l.casefold() for l in f.get("labels") or []]
+    return []
+
+
+def _match(node, issue, ctx) -> bool:
+    kind = node[0]
+    if kind == "and":
+        return all(_match(n, issue, ctx) for n in node[1])
+    if kind == "or":
+        return any(_match(n, issue, ctx) for n in node[1])
+    if kind == "not":
+        return not _match(node[1], issue, ctx)
+    _, field, op, value = node
+    values = value if isinstance(value, list) else [value]
+    # `in (EMPTY, ...)` / `= EMPTY` also match a missing field; the negative
+    # forms already exclude it. Range comparisons against EMPTY are meaningless.
+    wants_empty = any(v is not None and v.empty for v in values)
+    if wants_empty and op not in ("=", "!=", "in", "not in"):
+        raise JqlUnsupported(f"Operator {op!r} cannot compare with EMPTY")
+    values = [v for v in values if v is not None and not v.empty]
+
+    if field in _DATE_FIELDS:
+        raw = (issue.get("fields") or {}).get(_DATE_FIELDS[field])
+        actual = _to_local_naive(raw) if raw else None
+        if op in ("is empty", "is not empty"):
+            return (actual is None) == (op == "is empty")
+        if actual is None:
+            return wants_empty and op in ("=", "in")
+        if wants_empty and not values:
+            return op in ("!=", "not in")
+        if op in ("in", "not in"):
+            hit = any(actual == v.as_datetime(ctx) for v in values)
+            return hit if op == "in" else not hit
+        target = value.as_datetime(ctx)
+        return {
+            "=": actual == target,
+            "!=": actual != target,
+            "<": actual < target,
+            "<=": actual <= target,
+            ">": actual > target,
+            ">=": actual >= target,
+        }[op]
+
+    actual = _text_values(issue, field)
+    if op in ("is empty", "is not empty"):
+        return (not actual) == (op == "is empty")
+    if op in ("<", "<=", ">", ">="):
+        raise JqlUnsupported(f"Range operator on text field {field!r}")
+    if not actual:
+        # Like Jira, negative operators never match issues where the field is empty
+        return wants_empty and op in ("=", "in")
+    hit = any(v.as_text(ctx).casefold() in actual for v in values)
+    return hit if op in ("=", "in") else not hit
+
+
+def _updated_floor(node, ctx) -> Optional[datetime]:
+    """Lower bound on `updated` implied by the query, if any.
+
+    created >= X also bounds updated (an issue is updated when created).
+    AND takes the tightest child bound; OR needs every branch bounded.
+    """
+    kind = node[0]
+    if kind == "and":
+        bounds = [b for b in (_updated_floor(n, ctx) for n in node[1]) if b]
+        return max(bounds) if bounds else None
+    if kind == "or":
+        bounds = [_updated_floor(n, ctx) for n in node[1]]
+        return min(bounds) if all(bounds) else None
+    if kind == "clause" and node[1] in ("updated", "created") and node[2] in (">=", ">", "=") and not node[3].empty:
+        return node[3].as_datetime(ctx)
+    return None
+
+
+def _date_bounds(node, ctx) -> Optional[List[tuple]]:
+    """[(field, op, datetime)] when the query is only range clauses on created/updated.
+
+    Such queries translate directly into a SQL filter on the mirror's
+    timestamp columns, so they can be counted without decoding any issue.
+    """
+    clauses = node[1] if node[0] == "and" else [node]
+    bounds = []
+    for n in clauses:
+        if n[0] != "clause" or n[1] not in ("created", "updated") or n[2] not in ("<", "<=", ">", ">="):
+            return None
+        bounds.append((n[1], n[2], n[3].as_datetime(ctx)))
+    return bounds
+
+
+def _evaluating(fn):
+    """Surface evaluation errors (date overflow, bad values) as JqlUnsupported."""
+
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        except JqlUnsupported:
+            raise
+        except (TypeError, ValueError, OverflowError) as e:
+            raise JqlUnsupported(f"Cannot evaluate {self.jql!r} locally: {e}") from e
+
+    return wrapper
+
+
+class Query:
+    """Compiled JQL predicate."""
+
+    def __init__(self, jql: str):
+        self.jql = jql
+        self.ast = _Parser(_tokenize(jql)).parse()
+
+    def _ctx(self, current_user, now):
+        return {"current_user": current_user, "now": now or datetime.now()}
+
+    @_evaluating
+    def matches(self, issue: Dict[str, Any], current_user: str = None, now: datetime = None) -> bool:
+        return _match(self.ast, issue, self._ctx(current_user, now))
+
+    @_evaluating
+    def filter(self, issues: Iterable[Dict[str, Any]], current_user: str = None, now: datetime = None) -> List[Dict[str, Any]]:
+        ctx = self._ctx(current_user, now)
+        return [i for i in issues if _match(self.ast, i, ctx)]
+
+    @_evaluating
+    def updated_since(self, current_user: str = None, now: datetime = None) -> Optional[datetime]:
+        """Earliest `updated` a matching issue can have, or None when unbounded."""
+        return _updated_floor(self.ast, self._ctx(current_user, now))
+
+    @_evaluating
+    def date_bounds(self, current_user: str = None, now: datetime = None) -> Optional[List[tuple]]:
+        """Date range clauses of a pure created/updated window query, else None."""
+        return _date_bounds(self.ast, self._ctx(current_user, now))
+
+
+@lru_cache(maxsize=256)
+def compile_jql(jql: str) -> Query:
+    """Parse `jql` once; raises JqlUnsupported outside the supported subset."""
+    return Query(jql)
+
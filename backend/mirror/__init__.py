@@ -0,0 +1,28 @@
+"""Local SQLite mirror of Jira data.
+
+Key concepts:
+- store: connection + schema for the mirror database (separate from maya_tone.db).
+- issues: IssueMirror, synced incrementally with an `updated >= watermark` JQL.
+- worklogs: WorklogStore, synced from Jira's "worklogs updated since" feed with a persisted cursor.
+- sync: SyncScheduler, runs a sync job per Jira identity on a daemon thread.
+
+Readers call mirror_issues() / mirror_count() / mirror_worklogs(); they return None whenever the
+mirror cannot answer (disabled, not yet synced, stale, or window too old) so
+callers fall back to Jira.
+"""
+
+from .issues import IssueMirror, issue_mirror, mirror_issues, mirror_count, identity
+from .worklogs import WorklogStore, worklog_store, mirror_worklogs
+from .sync import SyncScheduler
+
+__all__ = [
+    "IssueMirror",
+    "issue_mirror",
+    "mirror_issues",
+    "mirror_count",
+    "identity",
+    "WorklogStore",
+    "worklog_store",
+    "mirror_worklogs",
+    "SyncScheduler",
+]
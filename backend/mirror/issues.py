@@ -0,0 +1,308 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from ..config import (
+    ISSUE_MIRROR_ENABLED,
+    ISSUE_MIRROR_DB_PATH,
+    ISSUE_MIRROR_SYNC_INTERVAL,
+    ISSUE_MIRROR_WINDOW_DAYS,
+    ISSUE_MIRROR_IDLE_TIMEOUT,
+    ISSUE_MIRROR_RECONCILE_INTERVAL,
+)
+from .store import get_conn, init_mirror_db, get_sync_state, save_sync_state
+from .sync import SyncScheduler
+
+# Fields kept per mirrored issue: everything the dashboard, chart and overview readers use.
+MIRROR_FIELDS = "summary,status,priority,assignee,reporter,issuetype,project,created,updated,duedate,labels,resolution"
+STREAM = "issues"
+RECONCILE_STREAM = "issues_reconcile"
+
+
+def identity(manager) -> Optional[str]:
+    """Mirror owner key: rows are per Jira identity because visibility differs per user."""
+    if not getattr(manager, "session", None) or not manager.username:
+        return None
+    return f"{manager.base_url}|{manager.username}"
+
+
+def parse_jira_ts(value: Optional[str]) -> Optional[datetime]:
+    """Parse Jira timestamps like 2024-05-01T10:03:22.000+0700 (timezone aware)."""
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class IssueMirror:
+    """Incrementally synced local copy of recently updated issues.
+
+    The first sync pulls `updated >= -{window_days}d`; later syncs only ask for
+    `updated >= "<watermark>"`, where the watermark is the newest `updated`
+    seen minus one minute (JQL has minute precision; upserts make the overlap
+    harmless). Rows that fall out of the rolling window are pruned, so the
+    mirror answers any query whose lower date bound lies inside the window.
+
+    The watermark feed never reports deletions, so every `reconcile_interval`
+    seconds the sync also walks the keys of the whole window and drops rows
+    Jira no longer returns (issue deleted, moved out of reach, or permission
+    revoked).
+    """
+
+    def __init__(
+        self,
+        db_path: str = None,
+        window_days: int = ISSUE_MIRROR_WINDOW_DAYS,
+        max_lag: float = ISSUE_MIRROR_SYNC_INTERVAL * 2,
+        reconcile_interval: float = ISSUE_MIRROR_RECONCILE_INTERVAL,
+    ):
+        self.db_path = db_path or ISSUE_MIRROR_DB_PATH
+        self.window_days = window_days
+        self.max_lag = max_lag
+        self.reconcile_interval = reconcile_interval
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def _conn(self):
+        with self._lock:
+            if not self._ready:
+                init_mirror_db(self.db_path)
+                self._ready = True
+        return get_conn(self.db_path)
+
+    # --- sync -----------------------------------------------------------------
+
+    def sync(self, manager) -> int:
+        """Pull issues updated since the stored watermark. Returns rows upserted.
+
+        `manager` only needs base_url, username, session and iter_issues(), so a
+        test can drive this with a fake Jira manager.
+        """
+        owner = identity(manager)
+        if not owner:
+            return 0
+        started = time.time()
+        conn = self._conn()
+        try:
+            state = get_sync_state(conn, owner, STREAM)
+            watermark, covered_since, last_sync = state or (None, None, None)
+            if watermark:
+                jql = f'updated >= "{watermark}" ORDER BY updated ASC'
+            else:
+                jql = f"updated >= -{self.window_days}d ORDER BY updated ASC"
+                covered_since = started - self.window_days * 86400
+
+            if watermark:
+                self._maybe_reconcile(conn, owner, manager, started)
+
+            synced, batch, newest = 0, [], None
+            try:
+                for issue in manager.iter_issues(jql, fields=MIRROR_FIELDS, strict=True):
+                    row = self._row(owner, issue)
+                    batch.append(row)
+                    if row[3] is not None and (newest is None or row[3] > newest[0]):
+                        newest = (row[3], (issue.get("fields") or {}).get("updated"))
+                    if len(batch) >= 500:
+                        synced += self._upsert(conn, batch)
+                        batch = []
+                synced += self._upsert(conn, batch)
+                completed = True
+            except Exception:
+                completed = False  # keep partial progress, but do not claim freshness
+
+            if newest:
+                watermark = self._watermark(newest[1]) or watermark
+            cutoff = started - self.window_days * 86400
+            conn.execute("DELETE FROM issues WHERE owner = ? AND updated_ts < ?", (owner, cutoff))
+            save_sync_state(
+                conn,
+                owner,
+                STREAM,
+                watermark,
+                max(covered_since or cutoff, cutoff),
+                started if completed else last_sync,
+            )
+            conn.commit()
+            return synced
+        finally:
+            conn.close()
+
+    def _maybe_reconcile(self, conn, owner: str, manager, started: float) -> int:
+        """Drop mirrored rows Jira no longer returns for the window. Returns rows removed.
+
+        Only runs once `reconcile_interval` has passed since the last complete
+        pass, and only deletes after the whole key walk succeeded. Rows updated
+        after the walk started are kept: they may be new issues the walk missed.
+        """
+        state = get_sync_state(conn, owner, RECONCILE_STREAM)
+        last = state[2] if state else None
+        if last is not None and started - last < self.reconcile_interval:
+            return 0
+        walk_started = time.time()
+        try:
+            live = {
+                issue.get("key")
+                for issue in manager.iter_issues(
+                    f"updated >= -{self.window_days}d", fields="updated", strict=True
+                )
+            }
+        except Exception:
+            return 0  # retried on the next sync
+        stale = [
+            key
+            for (key,) in conn.execute(
+                "SELECT key FROM issues WHERE owner = ? AND (updated_ts IS NULL OR updated_ts < ?)",
+                (owner, walk_started),
+            )
+            if key not in live
+        ]
+        for i in range(0, len(stale), 500):
+            conn.executemany(
+                "DELETE FROM issues WHERE owner = ? AND key = ?",
+                [(owner, key) for key in stale[i:i + 500]],
+            )
+        save_sync_state(conn, owner, RECONCILE_STREAM, None, None, walk_started)
+        return len(stale)
+
+    @staticmethod
+    def _row(owner: str, issue: Dict[str, Any]):
+        f = issue.get("fields") or {}
+        updated = parse_jira_ts(f.get("updated"))
+        created = parse_jira_ts(f.get("created"))
+        return (
+            owner,
+            issue.get("key"),
+            (f.get("project") or {}).get("key"),
+            updated.timestamp() if updated else None,
+            created.timestamp() if created else None,
+            json.dumps(f, ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _upsert(conn, rows) -> int:
+        if rows:
+            conn.executemany(
+                "INSERT OR REPLACE INTO issues (owner, key, project, updated_ts, created_ts, fields) VALUES (?,?,?,?,?,?)",
+                rows,
+            )
+        return len(rows)
+
+    @staticmethod
+    def _watermark(updated: str) -> Optional[str]:
+        # Keep Jira's own offset: JQL dates are read in the user's timezone
+        ts = parse_jira_ts(updated)
+        return (ts - timedelta(minutes=1)).strftime("%Y/%m/%d %H:%M") if ts else None
+
+    # --- reads ----------------------------------------------------------------
+
+    def covers(self, owner: str, since: datetime) -> bool:
+        """True when the mirror is fresh and holds every issue updated since `since`."""
+        conn = self._conn()
+        try:
+            state = get_sync_state(conn, owner, STREAM)
+        finally:
+            conn.close()
+        if not state or state[1] is None or state[2] is None:
+            return False
+        _, covered_since, last_sync = state
+        return time.time() - last_sync <= self.max_lag and since.timestamp() >= covered_since
+
+    def query(
+        self,
+        owner: str,
+        date_field: str = "updated",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        project: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return mirrored issues in Jira's {key, fields} shape, newest update first."""
+        column = "created_ts" if date_field == "created" else "updated_ts"
+        clauses, params = ["owner = ?"], [owner]
+        if since is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append(f"{column} <= ?")
+            params.append(until.timestamp())
+        if project:
+            clauses.append("project = ?")
+            params.append(project)
+        sql = f"SELECT key, fields FROM issues WHERE {' AND '.join(clauses)} ORDER BY updated_ts DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        conn = self._conn()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [{"key": key, "fields": json.loads(fields)} for key, fields in rows]
+
+    def count(self, owner: str, bounds: List[tuple]) -> int:
+        """COUNT(*) of mirrored issues within [(created|updated, op, datetime), ...]."""
+        clauses, params = ["owner = ?"], [owner]
+        for field, op, value in bounds:
+            if field not in ("created", "updated") or op not in ("<", "<=", ">", ">="):
+                raise ValueError(f"Unsupported bound {field} {op}")
+            clauses.append(f"{field}_ts {op} ?")
+            params.append(value.timestamp())
+        conn = self._conn()
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM issues WHERE {' AND '.join(clauses)}", params).fetchone()[0]
+        finally:
+            conn.close()
+
+
+issue_mirror = IssueMirror()
+_scheduler = SyncScheduler(
+    issue_mirror.sync, ISSUE_MIRROR_SYNC_INTERVAL, ISSUE_MIRROR_IDLE_TIMEOUT
+)
+
+
+def mirror_issues(
+    manager,
+    date_field: str,
+    since: datetime,
+    until: Optional[datetime] = None,
+    project: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """Answer a date-bounded issue query from the mirror, or None to fall back to Jira.
+
+    Every call (re)registers the identity with the background syncer, so the
+    first read for a user falls back while the initial sync runs.
+    """
+    owner = identity(manager)
+    if not ISSUE_MIRROR_ENABLED or not owner:
+        return None
+    _scheduler.ensure(owner, manager)
+    try:
+        if not issue_mirror.covers(owner, since):
+            return None
+        return issue_mirror.query(owner, date_field, since, until, project, limit)
+    except Exception:
+        return None
+
+
+def mirror_count(manager, since: datetime, bounds: List[tuple]) -> Optional[int]:
+    """Count issues within `bounds` in SQL when the mirror covers `since`, else None."""
+    owner = identity(manager)
+    if not ISSUE_MIRROR_ENABLED or not owner:
+        return None
+    _scheduler.ensure(owner, manager)
+    try:
+        if not issue_mirror.covers(owner, since):
+            return None
+        return issue_mirror.count(owner, bounds)
+    except Exception:
+        return None
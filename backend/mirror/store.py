@@ -0,0 +1,73 @@
+import sqlite3
+from ..config import ISSUE_MIRROR_DB_PATH
+
+
+def get_conn(path: str = None):
+    # Generous timeout: the background sync thread writes while requests read
+    return sqlite3.connect(path or ISSUE_MIRROR_DB_PATH, timeout=30)
+
+
+def init_mirror_db(path: str = None):
+    conn = get_conn(path)
+    c = conn.cursor()
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS issues (
+            owner TEXT NOT NULL, key TEXT NOT NULL, project TEXT,
+            updated_ts REAL, created_ts REAL, fields TEXT NOT NULL,
+            PRIMARY KEY (owner, key)
+        )"""
+    )
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_state (
+            owner TEXT NOT NULL, stream TEXT NOT NULL, watermark TEXT,
+            covered_since REAL, last_sync REAL, PRIMARY KEY (owner, stream)
+        )"""
+    )
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS worklogs (
+            owner TEXT NOT NULL, id TEXT NOT NULL, issue_id TEXT NOT NULL,
+            author TEXT, author_display TEXT, started TEXT, started_date TEXT,
+            seconds INTEGER, time_spent TEXT, comment TEXT, activity_type TEXT,
+            updated_ts REAL, PRIMARY KEY (owner, id)
+        )"""
+    )
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS worklog_issues (
+            owner TEXT NOT NULL, issue_id TEXT NOT NULL, key TEXT, summary TEXT,
+            project_key TEXT, project_name TEXT, PRIMARY KEY (owner, issue_id)
+        )"""
+    )
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS worklog_unresolved (
+            owner TEXT NOT NULL, issue_id TEXT NOT NULL, checked_ts REAL,
+            PRIMARY KEY (owner, issue_id)
+        )"""
+    )
+    c.execute("CREATE INDEX IF NOT EXISTS idx_issues_owner_updated ON issues (owner, updated_ts)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_issues_owner_created ON issues (owner, created_ts)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_issues_owner_project ON issues (owner, project)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_worklogs_owner_date ON worklogs (owner, started_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_worklogs_owner_author_date ON worklogs (owner, author, started_date)")
+    conn.commit()
+    conn.close()
+
+
+def get_sync_state(conn, owner: str, stream: str):
+    c = conn.cursor()
+    c.execute(
+        "SELECT watermark, covered_since, last_sync FROM sync_state WHERE owner = ? AND stream = ?",
+        (owner, stream),
+    )
+    return c.fetchone()
+
+
+def save_sync_state(conn, owner: str, stream: str, watermark, covered_since, last_sync):
+    conn.execute(
+        "INSERT OR REPLACE INTO sync_state (owner, stream, watermark, covered_since, last_sync) VALUES (?,?,?,?,?)",
+        (owner, stream, watermark, covered_since, last_sync),
+    )
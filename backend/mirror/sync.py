@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Any, Callable, Dict
+
+
+class SyncScheduler:
+    """Run `job(manager)` every `interval` seconds per Jira identity.
+
+    ensure() registers (or refreshes) an identity and starts its daemon thread
+    on first use. A thread exits once no reader has touched its identity for
+    `idle_timeout` seconds, so logged-out users stop generating Jira traffic.
+    """
+
+    def __init__(self, job: Callable[[Any], Any], interval: float, idle_timeout: float):
+        self.job = job
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self._workers: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def ensure(self, owner: str, manager: Any) -> None:
+        with self._lock:
+            worker = self._workers.get(owner)
+            if worker:
+                worker["manager"] = manager  # latest credentials win
+                worker["last_touch"] = time.time()
+                return
+            worker = {"manager": manager, "last_touch": time.time()}
+            self._workers[owner] = worker
+        threading.Thread(target=self._run, args=(owner,), daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self, owner: str) -> None:
+        while not self._stop.is_set():
+            with self._lock:
+                worker = self._workers[owner]
+                if time.time() - worker["last_touch"] > self.idle_timeout:
+                    del self._workers[owner]
+                    return
+                manager = worker["manager"]
+            try:
+                self.job(manager)
+            except Exception:
+                pass  # next tick retries from the persisted watermark
+            self._stop.wait(self.interval)
@@ -0,0 +1,354 @@
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import requests
+
+from ..config import (
+    ISSUE_MIRROR_ENABLED,
+    ISSUE_MIRROR_DB_PATH,
+    ISSUE_MIRROR_SYNC_INTERVAL,
+    ISSUE_MIRROR_WINDOW_DAYS,
+    ISSUE_MIRROR_IDLE_TIMEOUT,
+)
+from .issues import identity, parse_jira_ts
+from .store import get_conn, init_mirror_db, get_sync_state, save_sync_state
+from .sync import SyncScheduler
+
+STREAM = "worklogs"
+# /rest/api/2/worklog/list accepts at most 1000 ids per call
+LIST_BATCH = 1000
+ISSUE_BATCH = 100
+# Issue ids Jira did not return (deleted or hidden) are looked up again after this
+UNRESOLVED_RECHECK = 86400
+
+
+class WorklogStore:
+    """Local worklog table kept current with Jira's "worklogs updated since" feed.
+
+    The cursor is the `until` value (epoch ms) returned by
+    /rest/api/2/worklog/updated and is persisted in sync_state, so a restart
+    resumes from the last page instead of re-reading everything. Changed ids
+    are resolved in bulk via /worklog/list, removals come from
+    /worklog/deleted, and each worklog's issue (key, summary, project) is
+    looked up once via an `id in (...)` search. Issues that search no longer
+    returns are recorded in worklog_unresolved and their worklogs dropped.
+    """
+
+    def __init__(
+        self,
+        db_path: str = None,
+        window_days: int = ISSUE_MIRROR_WINDOW_DAYS,
+        max_lag: float = ISSUE_MIRROR_SYNC_INTERVAL * 2,
+    ):
+        self.db_path = db_path or ISSUE_MIRROR_DB_PATH
+        self.window_days = window_days
+        self.max_lag = max_lag
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def _conn(self):
+        with self._lock:
+            if not self._ready:
+                init_mirror_db(self.db_path)
+                self._ready = True
+        return get_conn(self.db_path)
+
+    # --- sync -----------------------------------------------------------------
+
+    def sync(self, manager) -> int:
+        """Apply worklog changes since the stored cursor. Returns rows upserted."""
+        owner = identity(manager)
+        if not owner:
+            return 0
+        started = time.time()
+        conn = self._conn()
+        try:
+            state = get_sync_state(conn, owner, STREAM)
+            cursor, covered_since, last_sync = state or (None, None, None)
+            cutoff = started - self.window_days * 86400
+            if cursor is None:
+                cursor = str(int(cutoff * 1000))
+                covered_since = cutoff
+
+            synced, completed = 0, False
+            try:
+                changed, next_cursor = self._changed_ids(manager, "updated", cursor)
+                for batch in _chunks(changed, LIST_BATCH):
+                    synced += self._upsert(conn, owner, self._fetch_worklogs(manager, batch))
+                deleted, _ = self._changed_ids(manager, "deleted", cursor)
+                for batch in _chunks(deleted, 500):
+                    conn.executemany(
+                        "DELETE FROM worklogs WHERE owner = ? AND id = ?",
+                        [(owner, wid) for wid in batch],
+                    )
+                cursor = next_cursor
+                completed = True
+            except Exception:
+                pass  # keep what was written; the cursor only advances on success
+            try:
+                self._resolve_issues(conn, owner, manager)
+            except Exception:
+                pass  # retried next sync; covers() keeps unresolved ranges on Jira
+
+            cutoff_date = datetime.fromtimestamp(cutoff).strftime("%Y-%m-%d")
+            conn.execute(
+                "DELETE FROM worklogs WHERE owner = ? AND started_date < ?", (owner, cutoff_date)
+            )
+            save_sync_state(
+                conn,
+                owner,
+                STREAM,
+                cursor,
+                max(covered_since or cutoff, cutoff),
+                started if completed else last_sync,
+            )
+            conn.commit()
+            return synced
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _changed_ids(manager, kind: str, since: str):
+        """Walk /worklog/{updated|deleted} pages; returns (ids, until cursor)."""
+        ids, until = [], since
+        while True:
+            r = manager.session.get(
+                f"{manager.base_url}/rest/api/2/worklog/{kind}", params={"since": since}
+            )
+            r.raise_for_status()
+            page = r.json()
+            ids.extend(str(v["worklogId"]) for v in page.get("values", []))
+            until = str(page.get("until", until))
+            if page.get("lastPage", True) or until == since:
+                return ids, until
+            since = until
+
+    @staticmethod
+    def _fetch_worklogs(manager, ids: List[str]) -> List[Dict[str, Any]]:
+        r = manager.session.post(
+            f"{manager.base_url}/rest/api/2/worklog/list",
+            json={"ids": [int(i) for i in ids]},
+        )
+        r.raise_for_status()
+        return r.json()
+
+    @staticmethod
+    def _upsert(conn, owner: str, worklogs: Iterable[Dict[str, Any]]) -> int:
+        rows = []
+        for w in worklogs:
+            author = w.get("author") or {}
+            started = w.get("started") or ""
+            updated = parse_jira_ts(w.get("updated"))
+            rows.append(
+                (
+                    owner,
+                    str(w.get("id")),
+                    str(w.get("issueId")),
+                    author.get("name") or author.get("accountId") or author.get("displayName"),
+                    author.get("displayName"),
+                    started,
+                    started[:10],
+                    int(w.get("timeSpentSeconds") or 0),
+                    w.get("timeSpent") or "",
+                    w.get("comment") or "",
+                    (w.get("activityType") or {}).get("name"),
+                    updated.timestamp() if updated else None,
+                )
+            )
+        if rows:
+            conn.executemany(
+                "INSERT OR REPLACE INTO worklogs (owner, id, issue_id, author, author_display, started, started_date,"
+                " seconds, time_spent, comment, activity_type, updated_ts) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)",
+                rows,
+            )
+        return len(rows)
+
+    @staticmethod
+    def _resolve_issues(conn, owner: str, manager) -> None:
+        """Fill worklog_issues for issue ids not seen before (key, summary, project).
+
+        Ids Jira does not return (issue deleted, or not visible to this user) go
+        to worklog_unresolved and their worklogs are dropped: Jira would not list
+        them either. Recorded ids are only looked up again after UNRESOLVED_RECHECK.
+        """
+        now = time.time()
+        missing = [
+            row[0]
+            for row in conn.execute(
+                "SELECT DISTINCT w.issue_id FROM worklogs w LEFT JOIN worklog_issues i"
+                " ON i.owner = w.owner AND i.issue_id = w.issue_id"
+                " LEFT JOIN worklog_unresolved u ON u.owner = w.owner AND u.issue_id = w.issue_id"
+                " WHERE w.owner = ? AND i.issue_id IS NULL AND (u.issue_id IS NULL OR u.checked_ts < ?)",
+                (owner, now - UNRESOLVED_RECHECK),
+            )
+        ]
+        for batch in _chunks(missing, ISSUE_BATCH):
+            found = WorklogStore._lookup_issues(manager, batch)
+            rows = []
+            for issue_id, issue in found.items():
+                f = issue.get("fields") or {}
+                project = f.get("project") or {}
+                rows.append(
+                    (owner, issue_id, issue.get("key"), f.get("summary"),
+                     project.get("key"), project.get("name"))
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO worklog_issues (owner, issue_id, key, summary, project_key, project_name)"
+                " VALUES (?,?,?,?,?,?)",
+                rows,
+            )
+            conn.executemany(
+                "DELETE FROM worklog_unresolved WHERE owner = ? AND issue_id = ?",
+                [(owner, issue_id) for issue_id in found],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO worklog_unresolved (owner, issue_id, checked_ts) VALUES (?,?,?)",
+                [(owner, issue_id, now) for issue_id in batch if issue_id not in found],
+            )
+        conn.execute(
+            "DELETE FROM worklogs WHERE owner = ? AND issue_id IN"
+            " (SELECT issue_id FROM worklog_unresolved WHERE owner = ?)",
+            (owner, owner),
+        )
+
+    @staticmethod
+    def _lookup_issues(manager, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Issues for `ids` keyed by id; ids Jira does not return are left out.
+
+        validateQuery=false makes Jira skip unknown ids instead of rejecting the
+        whole search. A server that still answers 400/404 gets the ids one by one.
+        """
+        try:
+            issues = manager.iter_issues(
+                f"id in ({','.join(ids)})", fields="summary,project", strict=True, validate=False
+            )
+            return {str(issue.get("id")): issue for issue in issues}
+        except requests.HTTPError as e:
+            if getattr(e.response, "status_code", None) not in (400, 404):
+                raise
+            if len(ids) == 1:
+                return {}
+            found = {}
+            for issue_id in ids:
+                found.update(WorklogStore._lookup_issues(manager, [issue_id]))
+            return found
+
+    # --- reads ----------------------------------------------------------------
+
+    def covers(self, owner: str, since: datetime, until: Optional[datetime] = None) -> bool:
+        """True when the store is fresh, holds every worklog started since `since`,
+        and every worklog in [since, until] has its issue resolved.
+
+        Reads join worklog_issues, so a worklog whose issue lookup failed or has
+        not run yet would silently drop out of the answer; such ranges are
+        reported as not covered and the caller falls back to Jira.
+        """
+        conn = self._conn()
+        try:
+            state = get_sync_state(conn, owner, STREAM)
+            if not state or state[1] is None or state[2] is None:
+                return False
+            _, covered_since, last_sync = state
+            if time.time() - last_sync > self.max_lag or since.timestamp() < covered_since:
+                return False
+            sql = (
+                "SELECT 1 FROM worklogs w LEFT JOIN worklog_issues i"
+                " ON i.owner = w.owner AND i.issue_id = w.issue_id"
+                " WHERE w.owner = ? AND i.issue_id IS NULL AND w.started_date >= ?"
+            )
+            params = [owner, since.strftime("%Y-%m-%d")]
+            if until is not None:
+                sql += " AND w.started_date <= ?"
+                params.append(until.strftime("%Y-%m-%d"))
+            return conn.execute(sql + " LIMIT 1", params).fetchone() is None
+        finally:
+            conn.close()
+
+    def query(
+        self,
+        owner: str,
+        from_date: str,
+        to_date: str,
+        author: Optional[str] = None,
+        issue_keys: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Worklogs started within [from_date, to_date] (YYYY-MM-DD), oldest first."""
+        return list(self.iter_query(owner, from_date, to_date, author, issue_keys))
+
+    def iter_query(
+        self,
+        owner: str,
+        from_date: str,
+        to_date: str,
+        author: Optional[str] = None,
+        issue_keys: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Like query(), but streams rows from the cursor instead of building a list."""
+        sql = (
+            "SELECT w.id, i.key, i.summary, i.project_key, i.project_name, w.author, w.author_display,"
+            " w.started, w.started_date, w.seconds, w.time_spent, w.comment, w.activity_type"
+            " FROM worklogs w JOIN worklog_issues i ON i.owner = w.owner AND i.issue_id = w.issue_id"
+            " WHERE w.owner = ? AND w.started_date BETWEEN ? AND ?"
+        )
+        params: List[Any] = [owner, from_date, to_date]
+        if author:
+            sql += " AND (w.author = ? OR w.author_display = ?)"
+            params += [author, author]
+        if issue_keys is not None:
+            keys = list(issue_keys)
+            if not keys:
+                return
+            sql += f" AND i.key IN ({','.join('?' * len(keys))})"
+            params += keys
+        sql += " ORDER BY w.started_date, i.key, w.started"
+        columns = (
+            "id", "issue_key", "summary", "project_key", "project_name", "author", "author_display",
+            "started", "work_date", "seconds", "time_spent", "comment", "activity_type",
+        )
+        conn = self._conn()
+        try:
+            for row in conn.execute(sql, params):
+                yield dict(zip(columns, row))
+        finally:
+            conn.close()
+
+
+def _chunks(items: List[str], size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+worklog_store = WorklogStore()
+_scheduler = SyncScheduler(
+    worklog_store.sync, ISSUE_MIRROR_SYNC_INTERVAL, ISSUE_MIRROR_IDLE_TIMEOUT
+)
+
+
+def mirror_worklogs(
+    manager,
+    from_date: str,
+    to_date: str,
+    author: Optional[str] = None,
+    issue_keys: Optional[Iterable[str]] = None,
+    lazy: bool = False,
+) -> Optional[Iterable[Dict[str, Any]]]:
+    """Answer a worklog date-range query locally, or None to fall back to Jira.
+
+    With lazy=True the rows are returned as an iterator over the SQLite cursor.
+    """
+    owner = identity(manager)
+    if not ISSUE_MIRROR_ENABLED or not owner:
+        return None
+    _scheduler.ensure(owner, manager)
+    try:
+        if not worklog_store.covers(
+            owner, datetime.strptime(from_date, "%Y-%m-%d"), datetime.strptime(to_date, "%Y-%m-%d")
+        ):
+            return None
+        if lazy:
+            return worklog_store.iter_query(owner, from_date, to_date, author, issue_keys)
+        return worklog_store.query(owner, from_date, to_date, author, issue_keys)
+    except Exception:
+        return None
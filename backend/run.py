@@ -6,14 +6,15 @@ Usage (dev):
   python backend/run.py
 
 This wraps create_app() and exposes SocketIO.run for unified server startup.
+The app is only built under __main__: spawned worker processes (timesheet PDF
+rendering) re-import the main module and must not run create_app()/init_db().
 """
 
 import os
 from . import create_app
 from .extensions import socketio
 
-app = create_app()
-
 if __name__ == "__main__":
+    app = create_app()
     debug_mode = os.environ.get("FLASK_DEBUG", "False").lower() in ("1", "true", "yes")
     socketio.run(app, host="0.0.0.0", port=4000, debug=debug_mode)
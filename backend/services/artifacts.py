@@ -0,0 +1,98 @@
+"""Local artifact store for generated exports.
+
+Each artifact is a pair of files in EXPORT_DIR: `<id>.bin` (the payload) and
+`<id>.json` (owner, filename, content type, size, created). Payloads are
+written to a temp file and renamed, so a reader never sees a partial file.
+Artifacts older than EXPORT_RETENTION_DAYS are purged on the next save.
+"""
+
+import json
+import os
+import re
+import time
+import uuid
+from typing import Any, Dict, Iterable, Optional, Union
+
+from ..config import EXPORT_DIR, EXPORT_RETENTION_DAYS
+
+_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _paths(artifact_id: str):
+    base = os.path.join(EXPORT_DIR, artifact_id)
+    return base + ".bin", base + ".json"
+
+
+def save_artifact(
+    owner: str,
+    filename: str,
+    content_type: str,
+    data: Union[bytes, Iterable[bytes]],
+) -> str:
+    """Store `data` (bytes or an iterable of byte chunks) and return the artifact id."""
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    purge_expired()
+    artifact_id = uuid.uuid4().hex
+    payload_path, meta_path = _paths(artifact_id)
+    chunks = [data] if isinstance(data, (bytes, bytearray)) else data
+    size = 0
+    tmp = payload_path + ".tmp"
+    with open(tmp, "wb") as fh:
+        for chunk in chunks:
+            fh.write(chunk)
+            size += len(chunk)
+    os.replace(tmp, payload_path)
+    meta = {
+        "owner": owner,
+        "filename": filename,
+        "content_type": content_type,
+        "size": size,
+        "created": time.time(),
+    }
+    with open(meta_path, "w", encoding="utf-8") as fh:
+        json.dump(meta, fh)
+    return artifact_id
+
+
+def get_artifact(artifact_id: str) -> Optional[Dict[str, Any]]:
+    """Return artifact metadata plus its `path`, or None if unknown."""
+    if not _ID_RE.match(artifact_id or ""):
+        return None
+    payload_path, meta_path = _paths(artifact_id)
+    try:
+        with open(meta_path, encoding="utf-8") as fh:
+            meta = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not os.path.exists(payload_path):
+        return None
+    return dict(meta, id=artifact_id, path=os.path.abspath(payload_path))
+
+
+def download_url(artifact_id: str) -> str:
+    return f"/api/exports/{artifact_id}"
+
+
+def purge_expired(now: float = None) -> int:
+    """Delete artifacts past the retention window. Returns how many were removed."""
+    cutoff = (now or time.time()) - EXPORT_RETENTION_DAYS * 86400
+    removed = 0
+    try:
+        names = os.listdir(EXPORT_DIR)
+    except OSError:
+        return 0
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        artifact_id = name[:-5]
+        payload_path, meta_path = _paths(artifact_id)
+        try:
+            if os.path.getmtime(meta_path) >= cutoff:
+                continue
+            os.remove(meta_path)
+            if os.path.exists(payload_path):
+                os.remove(payload_path)
+            removed += 1
+        except OSError:
+            continue
+    return removed
@@ -0,0 +1,127 @@
+"""Background export jobs.
+
+A chat-triggered export_worklog_data call is queued here instead of holding
+the chat request open. Job state lives in the export_jobs table (maya_tone.db);
+while it runs, progress is emitted to the chat's Socket.IO room as
+"export_progress" {job_id, chat_id, stage, done, total, message}. When the job
+finishes, the result (download link markdown or an error) is stored as an
+assistant message and emitted as "new_message", like any other reply.
+
+Jobs run on a small in-process thread pool with the Jira credentials captured
+at submit time; jobs left open by a restart are marked failed at startup
+(fail_interrupted_export_jobs() in create_app).
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..chat_helpers import build_export_markdown
+from ..config import EXPORT_JOB_WORKERS
+from ..db import create_export_job, update_export_job, insert_message, touch_chat, release_conn
+from ..extensions import socketio
+from ..utils.session_jira import use_credentials
+from . import jira_crud
+
+# Minimum seconds between two "fetching" progress updates for one job
+PROGRESS_INTERVAL = 0.5
+
+_executor = ThreadPoolExecutor(max_workers=EXPORT_JOB_WORKERS, thread_name_prefix="export-job")
+
+
+def _progress_text(stage: str, done: Optional[int], total: Optional[int]) -> str:
+    if stage == "fetching" and total is not None:
+        return f"fetched {done}/{total} issues"
+    return stage
+
+
+class _Reporter:
+    """Throttled progress sink: persists the latest state and emits it to the chat room."""
+
+    def __init__(self, job_id: str, chat_id: str):
+        self.job_id = job_id
+        self.chat_id = chat_id
+        self._stage = None
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, stage: str, done: Optional[int] = None, total: Optional[int] = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            final = done is not None and done == total
+            if stage == self._stage and not final and now - self._last < PROGRESS_INTERVAL:
+                return
+            self._stage, self._last = stage, now
+        message = _progress_text(stage, done, total)
+        update_export_job(self.job_id, status="running", progress=message)
+        try:
+            socketio.emit(
+                "export_progress",
+                {
+                    "job_id": self.job_id,
+                    "chat_id": self.chat_id,
+                    "stage": stage,
+                    "done": done,
+                    "total": total,
+                    "message": message,
+                    "timestamp": datetime.now().isoformat(),
+                },
+                room=self.chat_id,
+            )
+        except Exception:
+            pass
+
+
+def submit_export_job(chat_id: str, user_id: str, credentials, params: Dict[str, Any]) -> str:
+    """Queue export_worklog_data(**params) for `chat_id` and return the job id."""
+    job_id = create_export_job(chat_id, user_id, json.dumps(params, ensure_ascii=False))
+    _executor.submit(_run, job_id, chat_id, tuple(credentials), dict(params))
+    return job_id
+
+
+def _run(job_id: str, chat_id: str, credentials, params: Dict[str, Any]) -> None:
+    try:
+        _run_job(job_id, chat_id, credentials, params)
+    finally:
+        release_conn()
+
+
+def _run_job(job_id: str, chat_id: str, credentials, params: Dict[str, Any]) -> None:
+    reporter = _Reporter(job_id, chat_id)
+    update_export_job(job_id, status="running", progress="started")
+    try:
+        with use_credentials(*credentials):
+            result, err = jira_crud.export_worklog_data(**params, progress=reporter)
+        if err:
+            raise RuntimeError(err)
+        answer = build_export_markdown(
+            result.get("table", "No data available"),
+            result.get("download_link"),
+            result.get("filename"),
+        )
+        update_export_job(
+            job_id, status="done", progress="done", result=result.get("download_link"), clear_error=True
+        )
+    except Exception as e:
+        answer = f"❌ Export gagal: {e}"
+        update_export_job(job_id, status="failed", error=str(e))
+
+    insert_message(chat_id, answer, "assistant")
+    touch_chat(chat_id)
+    try:
+        socketio.emit(
+            "new_message",
+            {
+                "chat_id": chat_id,
+                "sender": "assistant",
+                "content": answer,
+                "timestamp": datetime.now().isoformat(),
+                "job_id": job_id,
+            },
+            room=chat_id,
+        )
+    except Exception:
+        pass
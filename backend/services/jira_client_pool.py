@@ -0,0 +1,79 @@
+"""Credential-keyed pool of initialised python-jira clients.
+
+Constructing JIRA(server=..., basic_auth=...) performs a server-info
+handshake, so jira_crud tools reuse one client per identity instead of
+building a new one on every call. The pool is bounded (LRU) and drops
+clients that sit idle longer than `idle_ttl`.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from ..config import JIRA_SESSION_IDLE_TTL, JIRA_MAX_SESSIONS
+from ..utils.http_pool import credential_key
+
+
+class JiraClientPool:
+    def __init__(
+        self,
+        factory: Callable[[str, str, str], Any],
+        max_clients: int = JIRA_MAX_SESSIONS,
+        idle_ttl: float = JIRA_SESSION_IDLE_TTL,
+    ):
+        self.factory = factory
+        self.max_clients = max_clients
+        self.idle_ttl = idle_ttl
+        self._clients: "OrderedDict[Tuple[str, str, str], Dict]" = OrderedDict()
+        self._building: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, base_url: str, username: str, password: str):
+        """Check out the client for these credentials, building it once if needed.
+
+        Concurrent first calls for the same identity wait on a per-key lock so
+        only one handshake happens. Construction errors propagate and nothing
+        is cached.
+        """
+        key = credential_key(base_url, username, password)
+        client = self._lookup(key)
+        if client is not None:
+            return client
+        with self._lock:
+            build_lock = self._building.setdefault(key, threading.Lock())
+        with build_lock:
+            client = self._lookup(key)  # built while we waited
+            if client is not None:
+                return client
+            try:
+                client = self.factory(base_url, username, password)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+            with self._lock:
+                self._stats["misses"] += 1
+                self._clients[key] = {"client": client, "last_used": time.time()}
+                while len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+                    self._stats["evictions"] += 1
+            return client
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, active=len(self._clients))
+
+    def _lookup(self, key):
+        now = time.time()
+        with self._lock:
+            for stale in [k for k, e in self._clients.items() if now - e["last_used"] > self.idle_ttl]:
+                del self._clients[stale]
+                self._stats["evictions"] += 1
+            entry = self._clients.get(key)
+            if entry is None:
+                return None
+            entry["last_used"] = now
+            self._clients.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry["client"]
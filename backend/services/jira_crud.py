@@ -3,27 +3,47 @@
 from datetime import datetime, timedelta
 from ..utils.session_jira import get_session_credentials
 from typing import Dict, Any
-import base64
+from collections import defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 from datetime import datetime, timedelta
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from io import BytesIO
+
+from .jira_client_pool import JiraClientPool
+from .project_metadata import project_catalog, issue_type_names
+from .artifacts import save_artifact, download_url
+from .timesheet_pdf import render_timesheet_pdf
+from ..config import JIRA_FANOUT_WORKERS, JIRA_POOL_MAXSIZE
+from ..jira_utils import JiraManager
+from ..mirror import mirror_worklogs
+from ..utils.http_pool import credential_key
+from ..utils.singleflight import jira_flights
+from ..utils.rate_limit import RateLimitedAdapter, jira_rate_limiter
 
 try:
     from jira import JIRA  # type: ignore
 except ImportError:
     JIRA = None
 
+def _build_client(base_url, username, password):
+    # Throttling is handled by the shared rate-limited adapter, not python-jira's own retries
+    client = JIRA(server=base_url, basic_auth=(username, password), max_retries=0)
+    adapter = RateLimitedAdapter(jira_rate_limiter, pool_maxsize=JIRA_POOL_MAXSIZE)
+    client._session.mount("https://", adapter)
+    client._session.mount("http://", adapter)
+    return client
+
+
+# Initialised clients are reused per credential identity (skips the server-info handshake)
+client_pool = JiraClientPool(_build_client)
+
 
 def jira_client():
     base_url, username, password = get_session_credentials()
     if not JIRA or not all([base_url, username, password]):
         return None
     try:
-        return JIRA(server=base_url, basic_auth=(username, password))
+        return client_pool.get(base_url, username, password)
     except Exception:
         return None
 
@@ -71,40 +91,46 @@ def execute_jql_search(jql_query: str, max_results: int = 50):
     if not client:
         return None, "Jira client tidak tersedia"
     try:
-        issues = client.search_issues(jql_query, maxResults=max_results)
-        out = []
-        for issue in issues:
-            f = issue.fields
-            issue_data = {
-                "key": issue.key,
-                "fields": {
-                    "summary": f.summary,
-                    "status": {"name": f.status.name if f.status else None},
-                    "assignee": {
-                        "displayName": (
-                            f.assignee.displayName if f.assignee else None
-                        )
-                    },
-                    "priority": {"name": f.priority.name if f.priority else None},
-                    "created": f.created,
-                    "updated": f.updated,
-                    "dueDate": f.duedate,
-                    "reporter": {"displayName": f.reporter.displayName},
-                    "issuetype": {"name": f.issuetype.name},
-                    "description": getattr(f, 'description', ''),
-                },
-            }
-            
-            # Add acceptance criteria for Story type issues
-            if f.issuetype and f.issuetype.name == "Story":
-                issue_data["fields"]["acceptance_criteria"] = getattr(f, 'customfield_10561', '')
-            
-            out.append(issue_data)
-        return out, None
+        # Identical concurrent searches for the same identity share one call
+        key = ("jql_search", credential_key(*get_session_credentials()), jql_query, max_results)
+        return list(jira_flights.do(key, lambda: _jql_search_rows(client, jql_query, max_results))), None
     except Exception as e:
         return None, f"Error eksekusi JQL: {e}"
 
 
+def _jql_search_rows(client, jql_query: str, max_results: int):
+    issues = client.search_issues(jql_query, maxResults=max_results)
+    out = []
+    for issue in issues:
+        f = issue.fields
+        issue_data = {
+            "key": issue.key,
+            "fields": {
+                "summary": f.summary,
+                "status": {"name": f.status.name if f.status else None},
+                "assignee": {
+                    "displayName": (
+                        f.assignee.displayName if f.assignee else None
+                    )
+                },
+                "priority": {"name": f.priority.name if f.priority else None},
+                "created": f.created,
+                "updated": f.updated,
+                "dueDate": f.duedate,
+                "reporter": {"displayName": f.reporter.displayName},
+                "issuetype": {"name": f.issuetype.name},
+                "description": getattr(f, 'description', ''),
+            },
+        }
+        
+        # Add acceptance criteria for Story type issues
+        if f.issuetype and f.issuetype.name == "Story":
+            issue_data["fields"]["acceptance_criteria"] = getattr(f, 'customfield_10561', '')
+        
+        out.append(issue_data)
+    return out
+
+
 def get_all_projects():
     client = jira_client()
     if not client:
@@ -118,20 +144,20 @@ def get_all_projects():
         jql = f"(assignee = '{username}' OR reporter = '{username}' OR worklogAuthor = '{username}') AND resolution = Unresolved"
         issues = client.search_issues(jql, maxResults=1000, fields="project")
         
-        # Extract unique projects from the issues
-        project_keys = set()
+        # Extract unique projects from the issues (the project field already carries the name)
+        project_names = {}
         for issue in issues:
-            project_keys.add(issue.fields.project.key)
+            project_names[issue.fields.project.key] = getattr(issue.fields.project, "name", None)
         
-        # Get project details for the projects the user has issues in
-        user_projects = []
-        for project_key in project_keys:
-            try:
-                project = client.project(project_key)
-                user_projects.append({"key": project.key, "name": project.name})
-            except Exception:
-                # Skip projects that can't be accessed
-                continue
+        # Prefer names from the bulk project catalog; fall back to the issue payload
+        try:
+            catalog = project_catalog(*get_session_credentials())
+        except Exception:
+            catalog = {}
+        user_projects = [
+            {"key": key, "name": (catalog.get(key) or {}).get("name") or name or key}
+            for key, name in sorted(project_names.items())
+        ]
         
         return user_projects, None
     except Exception as e:
@@ -144,6 +170,11 @@ def get_issue_types(project_key=None):
         return None, "Jira client tidak tersedia"
     try:
         if project_key:
+            project = project_catalog(*get_session_credentials()).get(project_key)
+            names = issue_type_names(project) if project else []
+            if names:
+                return [{"name": name} for name in names], None
+            # Not in the catalog (or the server ignored expand=issueTypes)
             meta = client.project(project_key)
             return [{"name": t.name} for t in meta.issueTypes], None
         return [{"name": t.name} for t in client.issue_types()], None
@@ -178,37 +209,102 @@ def get_issue_worklogs(issue_key: str):
         return None, f"Error mengambil worklog untuk {issue_key}: {e}"
 
 
+def _fetch_worklogs(client, issue_keys, max_workers=JIRA_FANOUT_WORKERS, on_done=None):
+    """Fetch worklogs for many issues on a bounded thread pool.
+
+    Returns (worklogs, failed): worklogs[i] belongs to issue_keys[i] (None when
+    that fetch failed) and failed lists {"issueKey", "error"} in input order.
+    `on_done(done, total)` is called as each fetch finishes, in completion order.
+    """
+    if not issue_keys:
+        return [], []
+    workers = max(1, min(max_workers, len(issue_keys)))
+    results, failed = [], []
+    finished = [0]
+    lock = threading.Lock()
+
+    def tick(_):
+        with lock:
+            finished[0] += 1
+            done = finished[0]
+        try:
+            on_done(done, len(issue_keys))
+        except Exception:
+            pass  # progress reporting never fails the fetch
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(client.worklogs, key) for key in issue_keys]
+        if on_done:
+            for future in futures:
+                future.add_done_callback(tick)
+        for key, future in zip(issue_keys, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(None)
+                failed.append({"issueKey": key, "error": str(e)})
+    return results, failed
+
+
+def _local_worklogs(from_date: str, to_date: str, username: str, lazy: bool = False):
+    """Worklogs from the local store (indexed by date), or None to fall back to Jira."""
+    try:
+        return mirror_worklogs(JiraManager(), from_date, to_date, author=username, lazy=lazy)
+    except Exception:
+        return None
+
+
 def get_worklogs(from_date: str, to_date: str, username: str):
+    """Return ({"worklogs": [...], "failed_issues": [...]}, error).
+
+    worklogs rows: id, issueKey, issueSummary, comment, timeSpent, started,
+    author. failed_issues lists {"issueKey", "error"} for issues whose worklogs
+    could not be read, so an incomplete answer is visible to the caller.
+    """
     client = jira_client()
     if not client:
         return None, "Jira client tidak tersedia"
     try:
+        local = _local_worklogs(from_date, to_date, username)
+        if local is not None:
+            rows = [
+                {
+                    "id": w["id"],
+                    "issueKey": w["issue_key"],
+                    "issueSummary": w["summary"],
+                    "comment": w["comment"],
+                    "timeSpent": w["time_spent"],
+                    "started": w["started"],
+                    "author": w["author"] or w["author_display"],
+                }
+                for w in local
+            ]
+            return {"worklogs": rows, "failed_issues": []}, None
+        
         jql = f"worklogAuthor = '{username}' AND worklogDate >= '{from_date}' AND worklogDate <= '{to_date}'"
         issues = client.search_issues(jql, maxResults=200)
+        issue_worklogs, failed = _fetch_worklogs(client, [issue.key for issue in issues])
         rows = []
-        for issue in issues:
-            try:
-                for w in client.worklogs(issue.key):
-                    started = getattr(w, "started", "")
-                    if started and from_date <= started[:10] <= to_date:
-                        author_name = getattr(
-                            getattr(w, "author", None), "name", ""
-                        ) or getattr(getattr(w, "author", None), "displayName", "")
-                        if author_name == username:
-                            rows.append(
-                                {
-                                    "id": w.id,
-                                    "issueKey": issue.key,
-                                    "issueSummary": issue.fields.summary,
-                                    "comment": getattr(w, "comment", ""),
-                                    "timeSpent": getattr(w, "timeSpent", ""),
-                                    "started": started,
-                                    "author": author_name,
-                                }
-                            )
-            except Exception:
-                continue
-        return rows, None
+        for issue, worklogs in zip(issues, issue_worklogs):
+            for w in worklogs or []:
+                started = getattr(w, "started", "")
+                if started and from_date <= started[:10] <= to_date:
+                    author_name = getattr(
+                        getattr(w, "author", None), "name", ""
+                    ) or getattr(getattr(w, "author", None), "displayName", "")
+                    if author_name == username:
+                        rows.append(
+                            {
+                                "id": w.id,
+                                "issueKey": issue.key,
+                                "issueSummary": issue.fields.summary,
+                                "comment": getattr(w, "comment", ""),
+                                "timeSpent": getattr(w, "timeSpent", ""),
+                                "started": started,
+                                "author": author_name,
+                            }
+                        )
+        return {"worklogs": rows, "failed_issues": failed}, None
     except Exception as e:
         return None, f"Error mengambil worklog: {e}"
 
@@ -240,15 +336,6 @@ def update_worklog(issue_key, worklog_id, time_spent_hours=None, description=Non
     if not client:
         return None, "Jira client tidak terinisialisasi."
     try:
-        # First, let's validate that the worklog exists and get available worklog IDs for debugging
-        try:
-            all_worklogs = client.worklogs(issue_key)
-            available_ids = [str(w.id) for w in all_worklogs]
-            print(f"DEBUG: Available worklog IDs for {issue_key}: {available_ids}")
-            print(f"DEBUG: Trying to update worklog ID: {worklog_id}")
-        except Exception as debug_e:
-            print(f"DEBUG: Could not fetch worklogs for debugging: {debug_e}")
-        
         data = {}
         if time_spent_hours is not None:
             data["timeSpentSeconds"] = int(float(time_spent_hours) * 3600)
@@ -413,8 +500,15 @@ def update_issue_status(issue_key, target_status_name):
     except Exception as e:
         return None, f"Error mengupdate status issue {issue_key}: {e}"
 
-def export_worklog_data(start_date: str, end_date: str, username: str, full_name: str):
-    """Export worklog data in table format with PDF download option."""
+def export_worklog_data(start_date: str, end_date: str, username: str, full_name: str, format: str = "pdf", progress=None):
+    """Export worklog data in table format with PDF download option.
+    
+    format="csv"/"xlsx" skips the table and PDF entirely and returns a link to
+    the streaming /api/exports/worklogs route instead. `progress(stage, done,
+    total)` receives "fetching" / "rendering" / "saving" updates (used by
+    background export jobs).
+    """
+    progress = progress or (lambda *a: None)
     client = jira_client()
     if not client:
         return None, "Jira client tidak tersedia"
@@ -425,42 +519,153 @@ def export_worklog_data(start_date: str, end_date: str, username: str, full_name
         if start_dt > end_dt:
             return _create_error_response(start_date, username, full_name), None
         
-        # Get worklogs
-        jql = f"worklogAuthor = '{username}' AND worklogDate >= '{start_date}' AND worklogDate <= '{end_date}'"
-        issues = client.search_issues(jql, maxResults=500)
+        format = (format or "pdf").lower()
+        if format in STREAM_EXPORT_FORMATS:
+            return {
+                "table": f"Export worklog {start_date} s/d {end_date} dalam format {format.upper()} siap diunduh.",
+                "download_link": f"/api/exports/worklogs?{urlencode({'format': format, 'start_date': start_date, 'end_date': end_date})}",
+                "filename": f"worklogs_{username}_{start_date}_{end_date}.{format}"
+            }, None
         
-        worklog_data = []
-        project_cache = {}
-        
-        for issue in issues:
-            try:
-                if issue.fields.project.key not in project_cache:
-                    project_cache[issue.fields.project.key] = issue.fields.project.name
-                
-                for worklog in client.worklogs(issue.key):
-                    if _is_valid_worklog(worklog, start_date, end_date, username):
-                        worklog_data.append(_extract_worklog_data(worklog, issue, project_cache))
-            except Exception:
-                continue
+        # Get worklogs (local store first, then per-issue fetches from Jira)
+        worklog_data, failed = _collect_export_worklogs(client, start_date, end_date, username, progress)
         
         # Generate tables
         table_rows = _generate_table_rows(worklog_data, start_dt, end_dt, username, full_name)
         markdown_table = _build_markdown_table(table_rows, start_dt, end_dt, full_name, worklog_data, client)
+        if failed:
+            failed_keys = ", ".join(f["issueKey"] for f in failed)
+            markdown_table += f"\n\n⚠️ Worklog gagal diambil untuk {len(failed)} issue: {failed_keys}. Data di atas mungkin tidak lengkap."
         
         # Generate PDF
-        pdf_buffer = _generate_pdf_table(table_rows, start_dt, end_dt, full_name, worklog_data)
-        pdf_b64 = base64.b64encode(pdf_buffer.getvalue()).decode('utf-8')
-        download_link = f"data:application/pdf;base64,{pdf_b64}"
+        # Rendered in a worker process from plain row data (see timesheet_pdf.py)
+        progress("rendering", None, None)
+        project_name = worklog_data[0]['project_name'] if worklog_data else ""
+        pdf_bytes = render_timesheet_pdf(table_rows, start_date, end_date, full_name, project_name)
+        filename = f"timesheet_{username}_{start_date}_{end_date}.pdf"
+        
+        # Store the file and hand back a short link instead of an inline data: URI
+        progress("saving", None, None)
+        owner = get_session_credentials()[1]
+        artifact_id = save_artifact(owner, filename, "application/pdf", pdf_bytes)
         
         return {
             "table": markdown_table,
-            "download_link": download_link,
-            "filename": f"timesheet_{username}_{start_date}_{end_date}.pdf"
+            "download_link": download_url(artifact_id),
+            "filename": filename,
+            "failed_issues": failed
         }, None
         
     except Exception as e:
         return None, f"Error exporting worklog data: {e}"
 
+def _collect_export_worklogs(client, start_date, end_date, username, progress=None):
+    """Return (worklog_data, failed_issues) for the timesheet export."""
+    progress = progress or (lambda *a: None)
+    local = _local_worklogs(start_date, end_date, username)
+    if local is not None:
+        progress("fetching", len(local), len(local))
+        return [
+            {
+                "issue_key": w["issue_key"],
+                "description": w["comment"] or "—",
+                "hours": _format_hours(w["seconds"]),
+                "work_date": w["work_date"],
+                "project_name": w["project_name"],
+                "activity_type": w["activity_type"] or "Development",
+            }
+            for w in local
+        ], []
+    
+    jql = f"worklogAuthor = '{username}' AND worklogDate >= '{start_date}' AND worklogDate <= '{end_date}'"
+    issues = client.search_issues(jql, maxResults=500)
+    progress("fetching", 0, len(issues))
+    
+    worklog_data = []
+    project_cache = {}
+    issue_worklogs, failed = _fetch_worklogs(
+        client, [issue.key for issue in issues],
+        on_done=lambda done, total: progress("fetching", done, total)
+    )
+    
+    for issue, worklogs in zip(issues, issue_worklogs):
+        if issue.fields.project.key not in project_cache:
+            project_cache[issue.fields.project.key] = issue.fields.project.name
+        
+        for worklog in worklogs or []:
+            if _is_valid_worklog(worklog, start_date, end_date, username):
+                worklog_data.append(_extract_worklog_data(worklog, issue, project_cache))
+    return worklog_data, failed
+
+STREAM_EXPORT_FORMATS = ("csv", "xlsx")
+EXPORT_COLUMNS = ["Work Date", "Issue Key", "Issue Summary", "Description", "Hours", "Username", "Full Name", "Project", "Activity Type"]
+
+def iter_worklog_rows(start_date: str, end_date: str, username: str, full_name: str, page_size: int = 50):
+    """Yield EXPORT_COLUMNS rows for the CSV/XLSX exports without materialising the range.
+
+    Reads the local worklog store through its cursor when it covers the range;
+    otherwise walks the JQL search one page at a time and fetches that page's
+    worklogs concurrently, so memory stays bounded by one page. If some issues'
+    worklogs cannot be fetched, a last row (see _failed_issues_row) lists their
+    keys. Call inside a request context; the returned generator may then be
+    consumed lazily.
+    """
+    local = _local_worklogs(start_date, end_date, username, lazy=True)
+    if local is not None:
+        return (
+            [w["work_date"], w["issue_key"], w["summary"] or "", w["comment"] or "",
+             round(w["seconds"] / 3600, 2), username, full_name, w["project_name"] or "",
+             w["activity_type"] or "Development"]
+            for w in local
+        )
+    client = jira_client()
+    if not client:
+        raise RuntimeError("Jira client tidak tersedia")
+    return _iter_jira_worklog_rows(client, start_date, end_date, username, full_name, page_size)
+
+def _iter_jira_worklog_rows(client, start_date, end_date, username, full_name, page_size):
+    jql = f"worklogAuthor = '{username}' AND worklogDate >= '{start_date}' AND worklogDate <= '{end_date}'"
+    start_at, failed = 0, []
+    while True:
+        issues = client.search_issues(jql, startAt=start_at, maxResults=page_size, fields="summary,project")
+        if not issues:
+            break
+        issue_worklogs, page_failed = _fetch_worklogs(client, [issue.key for issue in issues])
+        failed.extend(page_failed)
+        for issue, worklogs in zip(issues, issue_worklogs):
+            for worklog in worklogs or []:
+                if not _is_valid_worklog(worklog, start_date, end_date, username):
+                    continue
+                activity_type = getattr(worklog, "activityType", None)
+                yield [
+                    getattr(worklog, "started", "")[:10],
+                    issue.key,
+                    getattr(issue.fields, "summary", "") or "",
+                    getattr(worklog, "comment", "") or "",
+                    round(getattr(worklog, "timeSpentSeconds", 0) / 3600, 2),
+                    username,
+                    full_name,
+                    issue.fields.project.name,
+                    getattr(activity_type, "name", "Development") if activity_type else "Development",
+                ]
+        start_at += len(issues)
+        if start_at >= getattr(issues, "total", start_at):
+            break
+    if failed:
+        # Headers are already sent once rows stream, so incompleteness is reported in-band
+        yield _failed_issues_row(failed)
+
+def _failed_issues_row(failed):
+    """Trailing EXPORT_COLUMNS row listing issues whose worklogs could not be fetched."""
+    failed_keys = ", ".join(f["issueKey"] for f in failed)
+    row = [
+        "⚠️ GAGAL",
+        failed_keys,
+        f"Worklog gagal diambil untuk {len(failed)} issue",
+        "Data di atas mungkin tidak lengkap.",
+    ]
+    return row + [""] * (len(EXPORT_COLUMNS) - len(row))
+
 def _is_valid_worklog(worklog, start_date, end_date, username):
     started = getattr(worklog, "started", "")
     if not started or not (start_date <= started[:10] <= end_date):
@@ -473,9 +678,12 @@ def _is_valid_worklog(worklog, start_date, end_date, username):
     author_name = getattr(author, "name", "") or getattr(author, "displayName", "")
     return author_name == username
 
+def _format_hours(seconds):
+    hours_float = (seconds or 0) / 3600
+    return int(hours_float) if hours_float == int(hours_float) else round(hours_float, 1)
+
 def _extract_worklog_data(worklog, issue, project_cache):
-    hours_float = getattr(worklog, "timeSpentSeconds", 0) / 3600
-    hours = int(hours_float) if hours_float == int(hours_float) else round(hours_float, 1)
+    hours = _format_hours(getattr(worklog, "timeSpentSeconds", 0))
     description = getattr(worklog, "comment", "") or "—"
     
     activity_type = getattr(worklog, "activityType", None)
@@ -490,14 +698,22 @@ def _extract_worklog_data(worklog, issue, project_cache):
         "activity_type": activity_type
     }
 
+def _group_by_date(worklog_data):
+    """Index worklogs by work_date in one pass, keeping their original order per day."""
+    by_date = defaultdict(list)
+    for w in worklog_data:
+        by_date[w["work_date"]].append(w)
+    return by_date
+
 def _generate_table_rows(worklog_data, start_dt, end_dt, username, full_name):
     table_rows = []
     current_date = start_dt
     day_no = 1
+    by_date = _group_by_date(worklog_data)
     
     while current_date <= end_dt:
         date_str = current_date.strftime("%Y-%m-%d")
-        day_worklogs = [w for w in worklog_data if w["work_date"] == date_str]
+        day_worklogs = by_date.get(date_str)
         
         if day_worklogs:
             for i, worklog in enumerate(day_worklogs):
@@ -541,172 +757,6 @@ Year: {period_year}\n\n
     
     return timesheet_header + header + "\n" + separator + "\n" + "\n".join(markdown_rows)
 
-def _generate_pdf_table(table_rows, start_dt, end_dt, full_name, worklog_data):
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=20, leftMargin=20, topMargin=40, bottomMargin=20)
-    
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=12,
-        spaceAfter=8,
-        alignment=1,  # Center alignment
-        textColor=colors.HexColor('#2c3e50')
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=8,
-        spaceAfter=6,
-        textColor=colors.HexColor('#34495e')
-    )
-    
-    # Cell text style for wrapping
-    cell_style = ParagraphStyle(
-        'CellText',
-        parent=styles['Normal'],
-        fontSize=6,
-        textColor=colors.HexColor('#2c3e50'),
-        wordWrap='LTR',
-        alignment=0,  # Left alignment
-        leftIndent=1,
-        rightIndent=1,
-        spaceAfter=1,
-        spaceBefore=1
-    )
-    
-    # Content
-    story = []
-    
-    # Title
-    month_start = start_dt.strftime("%m/%d")
-    month_end = end_dt.strftime("%m/%d") 
-    period_year = start_dt.strftime("%Y")
-    month_range = f"{start_dt.strftime('%B %d')} - {end_dt.strftime('%B %d')}"
-    project_name = worklog_data[0]['project_name'] if worklog_data else ""
-    
-    story.append(Paragraph(f"Consultant Timesheet - {month_start}/{month_end} {period_year}", title_style))
-    story.append(Spacer(1, 8))
-    
-    # Header info
-    story.append(Paragraph(f"<b>Name:</b> {full_name}", subtitle_style))
-    story.append(Paragraph(f"<b>Role:</b> ", subtitle_style))
-    story.append(Paragraph(f"<b>Project:</b> {project_name}", subtitle_style))
-    story.append(Paragraph(f"<b>Period:</b> {month_range}, {period_year}", subtitle_style))
-    story.append(Spacer(1, 12))
-    
-    # Table headers
-    headers = ['No', 'Issue Key', 'Issue Summary', 'Hours', 'MD', 'Work Date', 'Username', 'Full Name', 'Project', 'Activity Type']
-    
-    # Convert headers to Paragraph objects for consistent styling
-    header_paragraphs = [Paragraph(str(header), cell_style) for header in headers]
-    
-    # Convert table data to Paragraph objects to enable text wrapping
-    processed_rows = []
-    for row in table_rows:
-        processed_row = []
-        for i, cell in enumerate(row):
-            cell_text = str(cell) if cell is not None else ""
-            # Use center alignment for specific columns (No, Hours, MD)
-            if i in [0, 3, 4]:  # No, Hours, MD columns
-                centered_style = ParagraphStyle(
-                    'CenteredCellText',
-                    parent=cell_style,
-                    alignment=1  # Center alignment
-                )
-                processed_row.append(Paragraph(cell_text, centered_style))
-            else:
-                processed_row.append(Paragraph(cell_text, cell_style))
-        processed_rows.append(processed_row)
-    
-    # Combine headers and data
-    data = [header_paragraphs] + processed_rows
-    
-    # Create table with adjusted column widths for portrait
-    table = Table(data, colWidths=[0.3*inch, 0.6*inch, 1.8*inch, 0.4*inch, 0.3*inch, 0.6*inch, 0.6*inch, 0.8*inch, 0.8*inch, 0.7*inch])
-    
-    # Base table style
-    table_style_commands = [
-        # Header styling
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 7),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
-        
-        # Data rows - basic styling
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#2c3e50')),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 6),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 1), (-1, -1), 'TOP'),
-        
-        # Base grid and borders - only vertical lines and header border
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#bdc3c7')),  # Vertical lines
-        ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#2980b9')),  # Header bottom border
-        ('BOX', (0, 0), (-1, -1), 0.5, colors.HexColor('#bdc3c7')),  # Outer border
-        
-        # Padding
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        
-        # Enable text wrapping by allowing variable row heights
-        ('ROWSPLITMODE', (0, 0), (-1, -1), 'SPAN'),
-    ]
-    
-    # Group rows by date and apply same background color + remove horizontal borders
-    if len(table_rows) > 0:
-        # Assuming Work Date is at index 5 (6th column)
-        work_date_col = 5
-        colors_list = [colors.HexColor('#f8f9fa'), colors.HexColor('#e9ecef')]
-        current_color_index = 0
-        
-        # Track date groups and apply colors
-        i = 0
-        while i < len(table_rows):
-            current_date = table_rows[i][work_date_col] if len(table_rows[i]) > work_date_col else None
-            
-            # Find all consecutive rows with same date
-            group_start = i
-            group_end = i
-            
-            while group_end < len(table_rows) - 1:
-                next_date = table_rows[group_end + 1][work_date_col] if len(table_rows[group_end + 1]) > work_date_col else None
-                if current_date == next_date and current_date is not None:
-                    group_end += 1
-                else:
-                    break
-            
-            # Apply same background color to entire date group
-            current_color = colors_list[current_color_index % 2]
-            table_style_commands.append(
-                ('BACKGROUND', (0, group_start + 1), (-1, group_end + 1), current_color)
-            )
-            
-            # Remove horizontal borders within the group
-            for row_idx in range(group_start, group_end):
-                table_style_commands.append(
-                    ('LINEBELOW', (0, row_idx + 1), (-1, row_idx + 1), 0, None)
-                )
-            
-            current_color_index += 1
-            i = group_end + 1
-    
-    # Apply the style
-    table.setStyle(TableStyle(table_style_commands))
-    
-    story.append(table)
-    doc.build(story)
-    
-    buffer.seek(0)
-    return buffer
-
 def _create_error_response(start_date, username, full_name):
     return {
         "table": f"| No | Issue Key | Issue Summary | Hours | MD | Work Date | Username | Full Name | Project Name | Activities Type |\n|---|---|---|---|---|---|---|---|---|---|\n| 1 |  | Invalid date range | 0 | 1 | {start_date} | {username} | {full_name} |  |  |"
@@ -0,0 +1,45 @@
+"""Shared Jira project metadata catalog.
+
+One request to /rest/api/2/project (with lead and issue types expanded)
+returns every project the user can see, so the catalog is loaded in bulk
+instead of one client.project() call per key. Entries are cached per
+credential identity, because project visibility differs per user, and are
+refreshed in the background once older than PROJECT_META_TTL.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ..config import PROJECT_META_TTL, PROJECT_META_MAX_STALE, JIRA_MAX_SESSIONS
+from ..utils.cache import StaleWhileRevalidateCache
+from ..utils.http_pool import credential_key, jira_sessions
+
+_catalogs = StaleWhileRevalidateCache(
+    PROJECT_META_TTL, PROJECT_META_MAX_STALE, max_entries=JIRA_MAX_SESSIONS
+)
+
+
+def _load(base_url: str, username: str, password: str, session=None) -> Dict[str, Dict[str, Any]]:
+    session = session or jira_sessions.get(base_url, username, password)
+    r = session.get(
+        f"{base_url}/rest/api/2/project",
+        params={"expand": "lead,issueTypes,description"},
+    )
+    r.raise_for_status()
+    return {p["key"]: p for p in r.json() if p.get("key")}
+
+
+def project_catalog(base_url: str, username: str, password: str, session=None) -> Dict[str, Dict[str, Any]]:
+    """Return {project_key: project JSON} for this identity. Load errors propagate."""
+    base_url = (base_url or "").rstrip("/")
+    key = credential_key(base_url, username, password)
+    catalog, _, _ = _catalogs.get(key, lambda: _load(base_url, username, password, session))
+    return catalog
+
+
+def get_project(base_url: str, username: str, password: str, project_key: str, session=None) -> Optional[Dict[str, Any]]:
+    return project_catalog(base_url, username, password, session).get(project_key)
+
+
+def issue_type_names(project: Dict[str, Any]) -> List[str]:
+    return [t.get("name") for t in project.get("issueTypes") or [] if t.get("name")]
+
@@ -0,0 +1,214 @@
+"""Timesheet PDF rendering in a worker process pool.
+
+reportlab layout is CPU-bound and holds the GIL, so rendering on the request
+thread stalls every other Socket.IO/Flask handler in the process. Here the
+export code passes plain data (row lists + strings) to a small process pool;
+each worker builds its paragraph styles once in the pool initializer and
+reuses them for every document. Separate exports render in parallel across
+workers. If the pool is disabled (PDF_RENDER_WORKERS=0) or breaks, rendering
+falls back to the calling thread.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from io import BytesIO
+from typing import List, Optional
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+from ..config import PDF_RENDER_WORKERS, PDF_RENDER_TIMEOUT
+
+HEADERS = ['No', 'Issue Key', 'Issue Summary', 'Hours', 'MD', 'Work Date', 'Username', 'Full Name', 'Project', 'Activity Type']
+COL_WIDTHS = [0.3*inch, 0.6*inch, 1.8*inch, 0.4*inch, 0.3*inch, 0.6*inch, 0.6*inch, 0.8*inch, 0.8*inch, 0.7*inch]
+CENTERED_COLUMNS = (0, 3, 4)  # No, Hours, MD
+WORK_DATE_COL = 5
+
+_styles = None
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _build_styles():
+    styles = getSampleStyleSheet()
+    cell = ParagraphStyle(
+        'CellText',
+        parent=styles['Normal'],
+        fontSize=6,
+        textColor=colors.HexColor('#2c3e50'),
+        wordWrap='LTR',
+        alignment=0,  # Left alignment
+        leftIndent=1,
+        rightIndent=1,
+        spaceAfter=1,
+        spaceBefore=1
+    )
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=12,
+            spaceAfter=8,
+            alignment=1,  # Center alignment
+            textColor=colors.HexColor('#2c3e50')
+        ),
+        "subtitle": ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=8,
+            spaceAfter=6,
+            textColor=colors.HexColor('#34495e')
+        ),
+        "cell": cell,
+        "cell_centered": ParagraphStyle('CenteredCellText', parent=cell, alignment=1),
+    }
+
+
+def _init_worker():
+    """Pool initializer: compile styles once per worker process."""
+    global _styles
+    _styles = _build_styles()
+
+
+def _get_styles():
+    global _styles
+    if _styles is None:
+        _styles = _build_styles()
+    return _styles
+
+
+def _table_style(table_rows: List[List[str]]) -> TableStyle:
+    commands = [
+        # Header styling
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 7),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+
+        # Data rows - basic styling
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#2c3e50')),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 6),
+        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 1), (-1, -1), 'TOP'),
+
+        # Base grid and borders - only vertical lines and header border
+        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#bdc3c7')),
+        ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#2980b9')),
+        ('BOX', (0, 0), (-1, -1), 0.5, colors.HexColor('#bdc3c7')),
+
+        # Padding
+        ('LEFTPADDING', (0, 0), (-1, -1), 2),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+        ('TOPPADDING', (0, 0), (-1, -1), 3),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+
+        # Enable text wrapping by allowing variable row heights
+        ('ROWSPLITMODE', (0, 0), (-1, -1), 'SPAN'),
+    ]
+
+    # Group consecutive rows by work date: shared background, no inner horizontal borders
+    colors_list = [colors.HexColor('#f8f9fa'), colors.HexColor('#e9ecef')]
+    color_index = 0
+    i = 0
+    while i < len(table_rows):
+        current_date = table_rows[i][WORK_DATE_COL] if len(table_rows[i]) > WORK_DATE_COL else None
+        group_end = i
+        while group_end < len(table_rows) - 1:
+            next_row = table_rows[group_end + 1]
+            next_date = next_row[WORK_DATE_COL] if len(next_row) > WORK_DATE_COL else None
+            if current_date == next_date and current_date is not None:
+                group_end += 1
+            else:
+                break
+        commands.append(('BACKGROUND', (0, i + 1), (-1, group_end + 1), colors_list[color_index % 2]))
+        for row_idx in range(i, group_end):
+            commands.append(('LINEBELOW', (0, row_idx + 1), (-1, row_idx + 1), 0, None))
+        color_index += 1
+        i = group_end + 1
+    return TableStyle(commands)
+
+
+def _render(table_rows: List[List[str]], start_date: str, end_date: str, full_name: str, project_name: str) -> bytes:
+    styles = _get_styles()
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=20, leftMargin=20, topMargin=40, bottomMargin=20)
+
+    month_start = start_dt.strftime("%m/%d")
+    month_end = end_dt.strftime("%m/%d")
+    period_year = start_dt.strftime("%Y")
+    month_range = f"{start_dt.strftime('%B %d')} - {end_dt.strftime('%B %d')}"
+
+    story = [
+        Paragraph(f"Consultant Timesheet - {month_start}/{month_end} {period_year}", styles["title"]),
+        Spacer(1, 8),
+        Paragraph(f"<b>Name:</b> {full_name}", styles["subtitle"]),
+        Paragraph("<b>Role:</b> ", styles["subtitle"]),
+        Paragraph(f"<b>Project:</b> {project_name}", styles["subtitle"]),
+        Paragraph(f"<b>Period:</b> {month_range}, {period_year}", styles["subtitle"]),
+        Spacer(1, 12),
+    ]
+
+    # Paragraph cells so long text wraps inside the fixed column widths
+    cell, centered = styles["cell"], styles["cell_centered"]
+    data = [[Paragraph(header, cell) for header in HEADERS]]
+    for row in table_rows:
+        data.append([
+            Paragraph(str(value) if value is not None else "", centered if i in CENTERED_COLUMNS else cell)
+            for i, value in enumerate(row)
+        ])
+
+    table = Table(data, colWidths=COL_WIDTHS)
+    table.setStyle(_table_style(table_rows))
+    story.append(table)
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    if PDF_RENDER_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: never fork a process that is running request/sync threads
+            _pool = ProcessPoolExecutor(
+                max_workers=PDF_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _reset_pool(broken: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def render_timesheet_pdf(
+    table_rows: List[List[str]], start_date: str, end_date: str, full_name: str, project_name: str
+) -> bytes:
+    """Render the timesheet PDF and return its bytes (dates as YYYY-MM-DD)."""
+    pool = _get_pool()
+    if pool is None:
+        return _render(table_rows, start_date, end_date, full_name, project_name)
+    try:
+        future = pool.submit(_render, table_rows, start_date, end_date, full_name, project_name)
+        return future.result(timeout=PDF_RENDER_TIMEOUT)
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        return _render(table_rows, start_date, end_date, full_name, project_name)
@@ -5,10 +5,10 @@ function name + JSON args (mirrors the OpenAI tool call contract) without
 embedding Jira specifics in the conversation layer.
 """
 
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, Optional
 from ..jira_utils import aggregate_issues, JiraManager
 from . import jira_crud
-from ..config import JIRA_BASE_URL, JIRA_USERNAME, JIRA_PASSWORD
+from ..config import JIRA_BASE_URL, JIRA_USERNAME, JIRA_PASSWORD, EXPORT_JOB_WORKERS
 
 _jira_manager = None
 
@@ -21,9 +21,13 @@ def jira_manager():
     return _jira_manager
 
 
-def execute(function_name: str, args: Dict) -> Tuple[Any, str]:
+def execute(function_name: str, args: Dict, context: Optional[Dict] = None) -> Tuple[Any, str]:
     """Execute a tool function by name.
 
+    context: optional caller info, e.g. {"chat_id": ...}; with a chat_id,
+    export_worklog_data is queued as a background job (services/export_jobs.py)
+    that posts its result to that chat.
+
     Returns: (result, error) where exactly one is non-null.
     Unknown function names return (None, error_msg).
     Catches all exceptions to prevent bubbling into the chat flow.
@@ -94,12 +98,23 @@ def execute(function_name: str, args: Dict) -> Tuple[Any, str]:
                 start_datetime = datetime.now() - timedelta(days=30)
                 start_date = start_datetime.strftime("%Y-%m-%d")
             
-            return jira_crud.export_worklog_data(
-                start_date=start_date,
-                end_date=end_date,
-                username=session_username or "unknown",
-                full_name=full_name
-            )
+            params = {
+                "start_date": start_date,
+                "end_date": end_date,
+                "username": session_username or "unknown",
+                "full_name": full_name,
+                "format": args.get("format") or "pdf",
+            }
+            chat_id = (context or {}).get("chat_id")
+            if chat_id and EXPORT_JOB_WORKERS > 0 and params["format"] == "pdf":
+                from .export_jobs import submit_export_job
+
+                job_id = submit_export_job(chat_id, session_username, get_session_credentials(), params)
+                return {
+                    "table": f"⏳ Export worklog {start_date} s/d {end_date} sedang diproses di background (job {job_id[:8]}). File akan dikirim ke chat ini setelah selesai.",
+                    "job_id": job_id,
+                }, None
+            return jira_crud.export_worklog_data(**params)
         if function_name == "get_issue_transitions":
             return jira_crud.get_issue_transitions(**args)
         if function_name == "update_issue_status":
@@ -0,0 +1,82 @@
+"""In-process result caches shared by the API blueprints."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+from .singleflight import SingleFlight
+
+
+class StaleWhileRevalidateCache:
+    """Keyed TTL cache that serves stale entries while refreshing them.
+
+    - Fresh entry (age <= ttl): returned as-is.
+    - Stale entry (ttl < age <= max_stale): returned immediately and a single
+      background refresh is started for that key.
+    - Missing or expired entry (age > max_stale): loaded synchronously. Concurrent
+      misses on the same key share one load (single-flight), so a cold cache
+      behind a fan-out does not load the same key once per worker.
+
+    A failed background refresh keeps the previous value. Errors from a
+    synchronous load propagate to the caller.
+    """
+
+    def __init__(self, ttl: float, max_stale: float = None, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._loads = SingleFlight()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Tuple[Any, float, bool]:
+        """Return (value, age_seconds, stale) for `key`, loading via `loader` if needed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age <= self.ttl:
+                return value, age, False
+            if self.max_stale is None or age <= self.max_stale:
+                self._refresh_async(key, loader)
+                return value, age, True
+
+        def load():
+            value = loader()
+            self.set(key, value)
+            return value
+
+        return self._loads.do(key, load), 0.0, False
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _refresh_async(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.set(key, loader())
+            except Exception:
+                pass  # keep serving the previous value
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
@@ -0,0 +1,95 @@
+"""Process-wide registry of keep-alive Jira HTTP sessions.
+
+Blueprints build a JiraManager per request; without sharing, every request
+pays a fresh TCP + TLS handshake. Sessions here are keyed by credential
+identity (base URL, username, password hash), carry a sized, rate-limited
+adapter pool, and are closed after sitting idle for `idle_ttl` seconds.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import requests
+from requests.auth import HTTPBasicAuth
+
+from ..config import (
+    JIRA_POOL_CONNECTIONS,
+    JIRA_POOL_MAXSIZE,
+    JIRA_SESSION_IDLE_TTL,
+    JIRA_MAX_SESSIONS,
+)
+from .rate_limit import RateLimitedAdapter, jira_rate_limiter
+
+
+def credential_key(base_url: str, username: str, password: str) -> Tuple[str, str, str]:
+    """Identity key that never keeps the raw password around."""
+    digest = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+    return (base_url or "", username or "", digest)
+
+
+class SessionRegistry:
+    def __init__(
+        self,
+        pool_connections: int = JIRA_POOL_CONNECTIONS,
+        pool_maxsize: int = JIRA_POOL_MAXSIZE,
+        idle_ttl: float = JIRA_SESSION_IDLE_TTL,
+        max_sessions: int = JIRA_MAX_SESSIONS,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[Tuple[str, str, str], Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, base_url: str, username: str, password: str) -> requests.Session:
+        key = credential_key(base_url, username, password)
+        now = time.time()
+        with self._lock:
+            expired = self._sweep(now)
+            entry = self._sessions.get(key)
+            if entry:
+                self._stats["hits"] += 1
+                self._sessions.move_to_end(key)
+            else:
+                self._stats["misses"] += 1
+                entry = {"session": self._build(username, password)}
+                self._sessions[key] = entry
+                while len(self._sessions) > self.max_sessions:
+                    expired.append(self._sessions.popitem(last=False)[1]["session"])
+                    self._stats["evictions"] += 1
+            entry["last_used"] = now
+        for session in expired:
+            session.close()
+        return entry["session"]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, active=len(self._sessions))
+
+    def _build(self, username: str, password: str) -> requests.Session:
+        session = requests.Session()
+        session.auth = HTTPBasicAuth(username, password)
+        adapter = RateLimitedAdapter(
+            jira_rate_limiter,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _sweep(self, now: float):
+        """Drop sessions idle past the TTL; caller closes them outside the lock."""
+        expired = []
+        for key in [k for k, e in self._sessions.items() if now - e["last_used"] > self.idle_ttl]:
+            expired.append(self._sessions.pop(key)["session"])
+            self._stats["evictions"] += 1
+        return expired
+
+
+jira_sessions = SessionRegistry()
@@ -0,0 +1,138 @@
+"""Client-side rate limiting for outbound Jira traffic.
+
+- TokenBucket: process-wide request budget (rate per second + burst). When
+  Jira answers 429/503 the bucket is paused for everyone, honouring
+  Retry-After, so callers back off together instead of hammering the server.
+- RateLimitedAdapter: requests HTTPAdapter that takes a token before every
+  send and retries throttled responses with Retry-After or jittered
+  exponential backoff. 429 means the request was rejected, so it is retried
+  for any method; a 503 may come from a gateway after Jira already applied
+  the write, so it is only retried for idempotent methods.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from requests.adapters import HTTPAdapter
+
+from ..config import (
+    JIRA_RATE_LIMIT,
+    JIRA_RATE_BURST,
+    JIRA_THROTTLE_RETRIES,
+    JIRA_BACKOFF_BASE,
+    JIRA_BACKOFF_MAX,
+)
+
+THROTTLE_STATUSES = (429, 503)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 0.001)
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "throttled": 0, "retries": 0, "gave_up": 0, "wait_seconds": 0.0}
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                    self._last = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._stats["requests"] += 1
+                        self._stats["wait_seconds"] += waited
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds`, then restart from an empty bucket."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._last = until
+
+    def record(self, event: str) -> None:
+        with self._lock:
+            self._stats[event] += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            out = dict(self._stats)
+            out["wait_seconds"] = round(out["wait_seconds"], 3)
+            out["paused_for"] = round(max(0.0, self._paused_until - time.monotonic()), 3)
+            return out
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Parse Retry-After as delta-seconds or an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        retries: int = JIRA_THROTTLE_RETRIES,
+        backoff_base: float = JIRA_BACKOFF_BASE,
+        backoff_max: float = JIRA_BACKOFF_MAX,
+        **kwargs,
+    ):
+        self.bucket = bucket
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            response = super().send(request, **kwargs)
+            if response.status_code not in THROTTLE_STATUSES:
+                return response
+            self.bucket.record("throttled")
+            retryable = response.status_code == 429 or (request.method or "").upper() in IDEMPOTENT_METHODS
+            if attempt >= self.retries or not retryable:
+                self.bucket.record("gave_up")
+                return response
+            delay = retry_after_seconds(response)
+            if delay is None:
+                # Full-jitter exponential backoff
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+            self.bucket.pause(min(delay, self.backoff_max))
+            self.bucket.record("retries")
+            response.close()
+            attempt += 1
+
+
+# One budget for every outbound Jira call in the process
+jira_rate_limiter = TokenBucket(JIRA_RATE_LIMIT, JIRA_RATE_BURST)
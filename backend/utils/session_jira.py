@@ -1,11 +1,30 @@
 # backend/utils/session_jira.py
-from flask import session
+import threading
+from contextlib import contextmanager
+from flask import session, has_request_context
 from ..config import JIRA_BASE_URL
 
+# Credentials pinned for the current thread (background jobs have no request/session)
+_pinned = threading.local()
+
+
+@contextmanager
+def use_credentials(base_url, username, password):
+    """Make get_session_credentials() return these values on this thread."""
+    previous = getattr(_pinned, "credentials", None)
+    _pinned.credentials = (base_url, username, password)
+    try:
+        yield
+    finally:
+        _pinned.credentials = previous
+
 
 def get_session_credentials():
     """Get Jira credentials from session instead of env."""
-    if not session.get("logged_in"):
+    pinned = getattr(_pinned, "credentials", None)
+    if pinned:
+        return pinned
+    if not has_request_context() or not session.get("logged_in"):
         return None, None, None
 
     return (JIRA_BASE_URL, session.get("jira_username"), session.get("jira_password"))
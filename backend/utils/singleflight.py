@@ -0,0 +1,60 @@
+"""Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-flight call: the
+first caller (leader) runs it, the others wait and receive the same result
+or exception. Nothing is cached once the call completes.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "executed": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+                self._stats["executed"] += 1
+            else:
+                self._stats["coalesced"] += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """calls = requests seen, executed = real calls made, coalesced = calls saved."""
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._inflight))
+
+
+# Shared by JiraManager and jira_crud so identical Jira queries collapse process-wide
+jira_flights = SingleFlight()
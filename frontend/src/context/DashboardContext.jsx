@@ -29,11 +29,15 @@ export function DashboardProvider({
         inFlight.current = true;
         setLoading(true);
         setError('');
-        const res = await fetch('/api/dashboard-stats');
+        const res = await fetch(
+          force ? '/api/dashboard-stats?refresh=1' : '/api/dashboard-stats',
+        );
         if (!res.ok) throw new Error(`HTTP ${res.status}`);
         const json = await res.json();
         setData(json);
-        setLastFetched(Date.now());
+        // Backend may serve a cached payload; date it by when it was computed
+        const ageMs = (json?.cache?.age_seconds || 0) * 1000;
+        setLastFetched(Date.now() - ageMs);
       } catch (e) {
         setError(e.message || 'Failed loading dashboard');
       } finally {
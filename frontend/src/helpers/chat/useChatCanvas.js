@@ -80,7 +80,11 @@ export function useChatCanvas({
 
     s.on('new_message', (data) => {
       if (data.chat_id !== activeChatId) return;
-      setMessages((prev) => {
+      setMessages((prevAll) => {
+        // A finished export job replaces its transient progress bubble
+        const prev = data.job_id
+          ? prevAll.filter((m) => m.exportJobId !== data.job_id)
+          : prevAll;
         if (data.sender === 'assistant') {
           const lastAssistant = [...prev]
             .reverse()
@@ -103,6 +107,23 @@ export function useChatCanvas({
       });
       setLoading(false);
     });
+    s.on('export_progress', ({ chat_id, job_id, message, timestamp }) => {
+      if (chat_id !== activeChatId) return;
+      setMessages((prev) => {
+        const bubble = {
+          sender: 'assistant',
+          content: `⏳ Export: ${message}`,
+          timestamp: timestamp || new Date().toISOString(),
+          partial: true,
+          exportJobId: job_id,
+        };
+        const idx = prev.findIndex((m) => m.exportJobId === job_id);
+        if (idx === -1) return [...prev, bubble];
+        const copy = [...prev];
+        copy[idx] = { ...copy[idx], content: bubble.content };
+        return copy;
+      });
+    });
     s.on('assistant_start', ({ chat_id, timestamp }) => {
       if (chat_id !== activeChatId) return;
       setLoading(true);
@@ -121,7 +142,7 @@ export function useChatCanvas({
       setMessages((prev) => {
         const copy = [...prev];
         for (let i = copy.length - 1; i >= 0; i--) {
-          if (copy[i].sender === 'assistant') {
+          if (copy[i].sender === 'assistant' && !copy[i].exportJobId) {
             copy[i] = {
               ...copy[i],
               content: (copy[i].content || '') + delta,
@@ -139,7 +160,7 @@ export function useChatCanvas({
       setMessages((prev) => {
         const copy = [...prev];
         for (let i = copy.length - 1; i >= 0; i--) {
-          if (copy[i].sender === 'assistant') {
+          if (copy[i].sender === 'assistant' && !copy[i].exportJobId) {
             const { cleaned, downloadData } = extractExportData(content);
             copy[i] = {
               ...copy[i],
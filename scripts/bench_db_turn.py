@@ -0,0 +1,115 @@
+"""Per-chat-turn SQLite overhead: connection per call vs backend/db.py.
+
+A chat turn in /api/ask_stream touches maya_tone.db six times (ownership
+check, pending action, user message, recent history, assistant message,
+touch). This script runs that sequence against two scratch databases:
+
+  before: a fresh sqlite3.connect() + close per helper, default rollback
+          journal (what db.py did before connections were pooled)
+  after:  the current db.py helpers; every turn runs on a new thread and ends
+          with release_conn(), like a Werkzeug/Socket.IO request with the
+          teardown_appcontext hook
+
+Usage:
+  SECRET_KEY=x python scripts/bench_db_turn.py [turns]
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import db  # noqa: E402
+from backend.config import MAX_CONTEXT_MESSAGES  # noqa: E402
+
+
+def _before_helpers(path):
+    def run(sql, params, fetch=False):
+        conn = sqlite3.connect(path)
+        try:
+            rows = conn.execute(sql, params).fetchall() if fetch else None
+            conn.commit()
+            return rows
+        finally:
+            conn.close()
+
+    def turn(chat_id):
+        run("SELECT user_id FROM chats WHERE id = ?", (chat_id,), fetch=True)
+        run("SELECT pending_action FROM chats WHERE id = ?", (chat_id,), fetch=True)
+        run(
+            "INSERT INTO messages (id, chat_id, content, sender, timestamp) VALUES (?,?,?,?,?)",
+            (str(uuid4()), chat_id, "question", "user", datetime.now()),
+        )
+        run(
+            "SELECT sender, content FROM messages WHERE chat_id = ? ORDER BY timestamp DESC LIMIT ?",
+            (chat_id, MAX_CONTEXT_MESSAGES),
+            fetch=True,
+        )
+        run(
+            "INSERT INTO messages (id, chat_id, content, sender, timestamp) VALUES (?,?,?,?,?)",
+            (str(uuid4()), chat_id, "answer", "assistant", datetime.now()),
+        )
+        run("UPDATE chats SET updated_at = ? WHERE id = ?", (datetime.now(), chat_id))
+
+    return turn
+
+
+def _after_turn(chat_id):
+    db.verify_chat_ownership(chat_id, "bench")
+    db.get_pending_action(chat_id)
+    db.insert_message(chat_id, "question", "user")
+    db.fetch_recent_messages(chat_id, MAX_CONTEXT_MESSAGES)
+    db.insert_message(chat_id, "answer", "assistant")
+    db.touch_chat(chat_id)
+
+
+def _timed(turn, chat_id, turns):
+    """Milliseconds per turn, each turn on its own thread (thread-per-request)."""
+    def request():
+        try:
+            turn(chat_id)
+        finally:
+            db.release_conn()
+
+    started = time.perf_counter()
+    for _ in range(turns):
+        t = threading.Thread(target=request)
+        t.start()
+        t.join()
+    return (time.perf_counter() - started) * 1000 / turns
+
+
+def main(turns):
+    with tempfile.TemporaryDirectory() as tmp:
+        # "before": same schema, default rollback journal, plain connections only
+        before_path = os.path.join(tmp, "before.db")
+        conn = sqlite3.connect(before_path)
+        db._create_schema(conn.cursor())
+        before_chat = str(uuid4())
+        conn.execute(
+            "INSERT INTO chats (id, title, created_at, updated_at, user_id) VALUES (?,?,?,?,?)",
+            (before_chat, "before", datetime.now(), datetime.now(), "bench"),
+        )
+        conn.commit()
+        conn.close()
+        before = _timed(_before_helpers(before_path), before_chat, turns)
+
+        db.DB_PATH = os.path.join(tmp, "after.db")
+        db.init_db()
+        after_chat = db.create_user_chat("bench", "after")
+        db.release_conn()
+        after = _timed(_after_turn, after_chat, turns)
+
+    print(f"turns: {turns} (6 DB calls each, one thread per turn)")
+    print(f"before (connect per call):      {before:.3f} ms/turn")
+    print(f"after  (pooled WAL connection): {after:.3f} ms/turn")
+    print(f"speedup: {before / after:.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
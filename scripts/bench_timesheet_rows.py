@@ -0,0 +1,92 @@
+"""Timesheet row building: per-day rescan vs one pass with _group_by_date.
+
+_generate_table_rows (backend/services/jira_crud.py) used to filter the whole
+worklog list once per calendar day, O(days x worklogs). It now groups the
+worklogs by work_date once. This script times both over synthetic worklogs
+spread across a date range, and checks that they produce identical rows.
+
+Usage:
+  SECRET_KEY=x python scripts/bench_timesheet_rows.py [days] [entries ...]
+  (defaults: 365 days, 1000 2000 5000 10000 entries)
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.jira_crud import _generate_table_rows  # noqa: E402
+
+
+def _rescan_table_rows(worklog_data, start_dt, end_dt, username, full_name):
+    """The previous implementation, kept here as the baseline."""
+    table_rows = []
+    current_date = start_dt
+    day_no = 1
+    while current_date <= end_dt:
+        date_str = current_date.strftime("%Y-%m-%d")
+        day_worklogs = [w for w in worklog_data if w["work_date"] == date_str]
+        if day_worklogs:
+            for i, worklog in enumerate(day_worklogs):
+                row_day_no = day_no if i == 0 else ""
+                table_rows.append([
+                    str(row_day_no), worklog['issue_key'], worklog['description'][:50] + "..." if len(worklog['description']) > 50 else worklog['description'],
+                    str(worklog['hours']), "1", date_str, username, full_name,
+                    worklog['project_name'], worklog['activity_type']
+                ])
+            day_no += 1
+        else:
+            table_rows.append(["", "", "", "", "", date_str, "", "", "", ""])
+        current_date += timedelta(days=1)
+    return table_rows
+
+
+def _worklogs(start_dt, days, entries, seed=7):
+    rng = random.Random(seed)
+    out = []
+    for i in range(entries):
+        day = start_dt + timedelta(days=rng.randrange(days))
+        out.append({
+            "work_date": day.strftime("%Y-%m-%d"),
+            "issue_key": f"PRJ-{rng.randrange(1, 900)}",
+            "description": "worklog comment " * rng.randrange(1, 6),
+            "hours": rng.choice([0.5, 1, 2, 4, 8]),
+            "project_name": "Project",
+            "activity_type": "Development",
+        })
+    # Export fetches come back grouped by issue, not by date
+    out.sort(key=lambda w: w["issue_key"])
+    return out
+
+
+def _best_ms(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best, result
+
+
+def main(days, sizes):
+    start_dt = datetime(2024, 1, 1)
+    end_dt = start_dt + timedelta(days=days - 1)
+    print(f"range: {days} days ({start_dt:%Y-%m-%d} .. {end_dt:%Y-%m-%d}), best of 3")
+    print(f"{'entries':>8} {'rescan ms':>10} {'grouped ms':>11} {'speedup':>8}  rows")
+    for entries in sizes:
+        data = _worklogs(start_dt, days, entries)
+        before_ms, before = _best_ms(_rescan_table_rows, data, start_dt, end_dt, "user", "User Name")
+        after_ms, after = _best_ms(_generate_table_rows, data, start_dt, end_dt, "user", "User Name")
+        if before != after:
+            print(f"{entries:>8} MISMATCH: rows differ")
+            return 1
+        print(f"{entries:>8} {before_ms:>10.1f} {after_ms:>11.1f} {before_ms / after_ms:>7.1f}x  {len(after)} identical")
+    return 0
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    sys.exit(main(args[0] if args else 365, args[1:] or [1000, 2000, 5000, 10000]))
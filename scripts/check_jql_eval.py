@@ -0,0 +1,146 @@
+"""Compare the local JQL evaluator (backend/jql_eval.py) with Jira's own results.
+
+  record: run each query against Jira and save the matching keys together with
+          the superset of issues they were drawn from (a JSON fixture).
+  check:  evaluate the same queries locally over the recorded superset, using
+          the recorded clock and UTC offset, and report every key where the
+          two disagree.
+
+Usage:
+  JIRA_BASE_URL=... JIRA_USERNAME=... JIRA_PASSWORD=... SECRET_KEY=x \\
+      python scripts/check_jql_eval.py record jql_fixture.json
+  SECRET_KEY=x python scripts/check_jql_eval.py check [jql_fixture.json]
+
+`check` without a path runs offline against scripts/fixtures/jql_eval.json,
+which holds a hand-built issue set covering the queries below with the keys
+Jira returns for them.
+
+Every query is wrapped as `(<query>) AND updated >= -<window>d` so Jira's
+answer is contained in the recorded superset. Record with the machine in the
+same timezone as the Jira user profile: JQL dates are read in that timezone
+and the evaluator uses local time. Exits non-zero on any mismatch.
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.config import JIRA_BASE_URL, JIRA_USERNAME, JIRA_PASSWORD  # noqa: E402
+from backend.jira_utils import JiraManager, REVIEW_LABELS, BLOCKED_LABELS  # noqa: E402
+from backend.jql_eval import compile_jql, JqlUnsupported  # noqa: E402
+from backend.mirror.issues import MIRROR_FIELDS  # noqa: E402
+
+WINDOW_DAYS = 90
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "jql_eval.json")
+_labels = ", ".join(f'"{l}"' for l in REVIEW_LABELS + BLOCKED_LABELS)
+
+# The query shapes this backend generates (dashboard, personal panel, charts)
+QUERIES = [
+    "assignee = currentUser()",
+    'assignee = currentUser() AND status not in ("Done", "Closed")',
+    "reporter = currentUser()",
+    "updated >= -7d",
+    'priority in ("High", "Highest")',
+    'status not in ("Done", "Closed", "Resolved")',
+    "created >= -30d",
+    "created >= -60d AND created <= -30d",
+    "updated >= startOfDay()",
+    "updated >= startOfDay(-1)",
+    "created >= startOfMonth(-1M)",
+    "created >= startOfMonth(-1) AND created < startOfMonth()",
+    "updated >= startOfWeek(-1w)",
+    "duedate <= now() AND resolution is EMPTY",
+    f"labels in ({_labels})",
+    'status = "In Progress" OR status = "In Review"',
+    "NOT priority = Low AND assignee is not EMPTY",
+    "assignee in (EMPTY)",
+    "assignee in (EMPTY, currentUser())",
+    'assignee not in (EMPTY) AND priority != "High"',
+    "duedate = EMPTY",
+    f'assignee = currentUser() AND (status not in ("Done", "Closed", "Resolved") '
+    f"OR updated >= startOfDay() OR labels in ({_labels}))",
+]
+
+
+def _windowed(jql: str) -> str:
+    return f"({jql}) AND updated >= -{WINDOW_DAYS}d"
+
+
+def record(path: str) -> int:
+    manager = JiraManager(JIRA_BASE_URL, JIRA_USERNAME, JIRA_PASSWORD)
+    if not manager.session:
+        print("JIRA_BASE_URL, JIRA_USERNAME and JIRA_PASSWORD must be set")
+        return 2
+    recorded_at = datetime.now().astimezone()
+    superset = list(
+        manager.iter_issues(f"updated >= -{WINDOW_DAYS}d", fields=MIRROR_FIELDS, strict=True)
+    )
+    expected = {}
+    for jql in QUERIES:
+        keys = [i["key"] for i in manager.iter_issues(_windowed(jql), fields="key", strict=True)]
+        expected[jql] = sorted(keys)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "recorded_at": recorded_at.isoformat(),
+                "user": manager.username,
+                "window_days": WINDOW_DAYS,
+                "issues": superset,
+                "expected": expected,
+            },
+            f,
+            ensure_ascii=False,
+        )
+    print(f"recorded {len(superset)} issues, {len(expected)} queries -> {path}")
+    return 0
+
+
+def _pin_timezone(offset: timedelta) -> None:
+    """Run in the recording's UTC offset; issue timestamps convert to local time."""
+    minutes = int(offset.total_seconds() // 60)
+    sign = "-" if minutes >= 0 else "+"  # POSIX TZ offsets count west of UTC
+    os.environ["TZ"] = f"JQL{sign}{abs(minutes) // 60:02d}:{abs(minutes) % 60:02d}"
+    time.tzset()
+
+
+def check(path: str) -> int:
+    with open(path, encoding="utf-8") as f:
+        fixture = json.load(f)
+    now = datetime.fromisoformat(fixture["recorded_at"])
+    if now.tzinfo is not None:
+        _pin_timezone(now.utcoffset())
+        now = now.replace(tzinfo=None)
+    issues, user = fixture["issues"], fixture["user"]
+    failures = 0
+    for jql, keys in fixture["expected"].items():
+        try:
+            query = compile_jql(f"({jql}) AND updated >= -{fixture['window_days']}d")
+            local = {i["key"] for i in query.filter(issues, user, now)}
+        except JqlUnsupported as e:
+            print(f"SKIP  {jql}  ({e})")
+            continue
+        missing, extra = sorted(set(keys) - local), sorted(local - set(keys))
+        if missing or extra:
+            failures += 1
+            print(f"FAIL  {jql}\n      missing locally: {missing[:20]}\n      extra locally:   {extra[:20]}")
+        else:
+            print(f"ok    {jql}  ({len(keys)} issues)")
+    missing = [q for q in QUERIES if q not in fixture["expected"]]
+    if missing:
+        failures += 1
+        print(f"FAIL  fixture has no expected result for: {missing}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args == ["check"]:
+        args.append(DEFAULT_FIXTURE)
+    if len(args) != 2 or args[0] not in ("record", "check"):
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(record(args[1]) if args[0] == "record" else check(args[1]))
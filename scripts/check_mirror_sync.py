@@ -0,0 +1,148 @@
+"""Drive IssueMirror.sync (backend/mirror/issues.py) against an in-process fake Jira.
+
+The fake answers iter_issues() by evaluating the JQL the mirror sends with
+backend/jql_eval.py over an in-memory issue table. It records every query and
+how many issues it returned. Each step checks one guarantee of the sync:
+
+  1. the first sync loads the window and nothing older
+  2. later syncs ask only for issues updated since the watermark
+  3. a failed pull keeps the rows it got but does not claim freshness
+  4. reconcile drops issues deleted or hidden in Jira, but keeps new ones
+  5. covers(), query() and count() answer from the synced rows
+
+Usage:
+  SECRET_KEY=x python scripts/check_mirror_sync.py
+Exits non-zero on the first failed check.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.jql_eval import compile_jql  # noqa: E402
+from backend.mirror.issues import IssueMirror, identity  # noqa: E402
+from backend.mirror.store import get_sync_state  # noqa: E402
+
+
+def _jira_ts(dt: datetime) -> str:
+    """Jira timestamp in the local offset (the evaluator compares local times)."""
+    return dt.astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
+
+
+class FakeJira:
+    base_url = "http://fake-jira"
+    username = "tester"
+    session = object()
+
+    def __init__(self):
+        self.issues = {}
+        self.hidden = set()
+        self.queries = []
+        self.fail_after = None
+
+    def put(self, key, updated, created=None, status="Open"):
+        self.issues[key] = {
+            "key": key,
+            "fields": {
+                "summary": f"Issue {key}",
+                "status": {"name": status},
+                "project": {"key": key.split("-")[0]},
+                "created": _jira_ts(created or updated),
+                "updated": _jira_ts(updated),
+            },
+        }
+
+    def iter_issues(self, jql, fields=None, strict=False, **kwargs):
+        query = compile_jql(jql)
+        visible = [i for k, i in self.issues.items() if k not in self.hidden]
+        matched = sorted(query.filter(visible, self.username), key=lambda i: i["fields"]["updated"])
+        self.queries.append((jql, len(matched)))
+        for n, issue in enumerate(matched):
+            if self.fail_after is not None and n >= self.fail_after:
+                raise RuntimeError("simulated Jira failure")
+            yield issue
+
+
+def check(label, condition):
+    print(f"{'ok  ' if condition else 'FAIL'}  {label}")
+    if not condition:
+        sys.exit(1)
+
+
+def main():
+    now = datetime.now()
+    jira = FakeJira()
+    for i in range(50):
+        jira.put(f"PRJ-{i}", now - timedelta(days=i, hours=1))
+    jira.put("OLD-1", now - timedelta(days=120))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mirror = IssueMirror(
+            db_path=os.path.join(tmp, "mirror.db"), window_days=30, max_lag=60, reconcile_interval=0
+        )
+        owner = identity(jira)
+
+        # 1. initial load
+        synced = mirror.sync(jira)
+        keys = {i["key"] for i in mirror.query(owner)}
+        check("initial sync loads the 30-day window", synced == 30 and len(keys) == 30)
+        check("issues older than the window are not mirrored", "OLD-1" not in keys and "PRJ-40" not in keys)
+        check("initial query is relative to the window", jira.queries[-1][0].startswith("updated >= -30d"))
+
+        # 2. incremental pull
+        time.sleep(1)
+        jira.queries.clear()
+        jira.put("PRJ-5", datetime.now(), status="Done")
+        jira.put("NEW-1", datetime.now())
+        mirror.sync(jira)
+        pulled = [q for q in jira.queries if "ORDER BY" in q[0]]
+        check("incremental sync asks from the watermark", pulled and pulled[0][0].startswith('updated >= "'))
+        check("incremental sync returns only recent changes", pulled[0][1] <= 3)
+        rows = {i["key"]: i for i in mirror.query(owner)}
+        check("updated issue is upserted", rows["PRJ-5"]["fields"]["status"]["name"] == "Done")
+        check("new issue is added", "NEW-1" in rows)
+
+        # 3. failed pull
+        conn = mirror._conn()
+        last_sync_before = get_sync_state(conn, owner, "issues")[2]
+        conn.close()
+        time.sleep(1)
+        jira.put("NEW-2", datetime.now())
+        jira.put("NEW-3", datetime.now() + timedelta(seconds=1))
+        jira.fail_after = 1
+        mirror.sync(jira)
+        jira.fail_after = None
+        conn = mirror._conn()
+        last_sync_after = get_sync_state(conn, owner, "issues")[2]
+        conn.close()
+        check("failed pull does not advance last_sync", last_sync_after == last_sync_before)
+        mirror.sync(jira)
+        check("next sync picks up the rest", {"NEW-2", "NEW-3"} <= {i["key"] for i in mirror.query(owner)})
+
+        # 4. reconcile deletions and permission changes
+        del jira.issues["PRJ-3"]
+        jira.hidden.add("PRJ-7")
+        mirror.sync(jira)
+        keys = {i["key"] for i in mirror.query(owner)}
+        check("issue deleted in Jira is dropped", "PRJ-3" not in keys)
+        check("issue no longer visible is dropped", "PRJ-7" not in keys)
+        check("live issues are kept", {"PRJ-1", "PRJ-5", "NEW-1", "NEW-2"} <= keys)
+
+        # 5. reads
+        check("covers() is true inside the window after a fresh sync",
+              mirror.covers(owner, datetime.now() - timedelta(days=10)))
+        check("covers() is false beyond the window", not mirror.covers(owner, datetime.now() - timedelta(days=60)))
+        window = [("updated", ">=", datetime.now() - timedelta(days=7))]
+        expected = compile_jql("updated >= -7d").filter(
+            [i for k, i in jira.issues.items() if k not in jira.hidden], jira.username
+        )
+        check("SQL count matches Jira for a window query", mirror.count(owner, window) == len(expected))
+    print("all mirror sync checks passed")
+
+
+if __name__ == "__main__":
+    main()